@@ -0,0 +1,57 @@
+import time
+
+import numpy as np
+
+from dual_autodiff.dual_array import DualArray
+
+
+def f(x):
+    """Test function mixing the arithmetic operators and elementary functions."""
+    return (x * x + 1.0).log() * x.sin() + (x / 3.0).exp()
+
+
+def df(x):
+    """Analytic derivative of f."""
+    return 2 * x / (x * x + 1) * np.sin(x) + np.log(x * x + 1) * np.cos(x) + np.exp(x / 3) / 3
+
+
+def best_time(func, repeat):
+    """Best wall-clock time of func over repeat runs."""
+    times = []
+    for _ in range(repeat):
+        start_t = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start_t)
+    return min(times)
+
+
+def main(n=10_000_000, repeat=5):
+    """
+    A demo file to compare the accuracy and throughput of DualArray in double, single and mixed precision
+    """
+    x = np.linspace(0.1, 10, n)
+    exact_value = np.log(x * x + 1) * np.sin(x) + np.exp(x / 3)
+    exact_deriv = df(x)
+    modes = [
+        ("float64", np.float64, np.float64),
+        ("float32", np.float32, np.float32),
+        ("mixed (64/32)", np.float64, np.float32),
+    ]
+
+    print(f"\nf(x) and f'(x) at {n:,} points")
+    print("-" * 90)
+    print(f"{'Mode':<15} | {'Memory (MB)':>11} | {'Time (s)':>9} | {'Max rel. error f':>17} | {'Max rel. error df':>17}")
+    print("-" * 90)
+    for name, dtype, dual_dtype in modes:
+        seed = DualArray(x, 1.0, dtype=dtype, dual_dtype=dual_dtype)
+        memory = (seed.real.nbytes + seed.dual.nbytes) / 1e6
+        elapsed = best_time(lambda: f(seed), repeat)
+        result = f(seed)
+        value_error = np.max(np.abs(result.real - exact_value) / np.abs(exact_value))
+        deriv_error = np.max(np.abs(result.dual - exact_deriv) / np.maximum(np.abs(exact_deriv), 1.0))
+        print(f"{name:<15} | {memory:>11.1f} | {elapsed:>9.3f} | {value_error:>17.2e} | {deriv_error:>17.2e}")
+    print("-" * 90)
+
+
+if __name__ == "__main__":
+    main()
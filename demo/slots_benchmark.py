@@ -0,0 +1,64 @@
+import time
+import tracemalloc
+
+from dual_autodiff.dual import Dual
+
+
+class DictDual(Dual):
+    """Dual with a per-instance __dict__, i.e. the layout before __slots__ was introduced"""
+
+
+def memory_per_instance(cls, n):
+    """Average number of bytes allocated per instance when holding n instances."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    values = [cls(float(i), 1.0) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Remove the list's own pointer storage
+    return (after - before) / n - 8, values
+
+
+def throughput(func, x, repeat):
+    """Operations per second of func(x)."""
+    start_t = time.perf_counter()
+    for _ in range(repeat):
+        func(x)
+    return repeat / (time.perf_counter() - start_t)
+
+
+def main(n=1_000_000, repeat=1_000_000):
+    """
+    A demo file to measure the memory footprint of the __slots__ Dual layout and the throughput of the fast paths
+    for int/float operands
+    """
+    # --- Memory ---
+    print("\nMemory per instance:")
+    print("-" * 50)
+    for cls, name in [(DictDual, "With __dict__"), (Dual, "With __slots__")]:
+        per_instance, _ = memory_per_instance(cls, n)
+        print(f"{name:<20} | {per_instance:>10.1f} B")
+    print("-" * 50)
+
+    # --- Throughput ---
+    # Wrapping the constant in Dual by hand reproduces the temporary the operators used to build internally
+    x = Dual(1.5, 1.0)
+    cases = [
+        ("x + 2.0", lambda x: x + 2.0, lambda x: x + Dual(2.0)),
+        ("x * 2.0", lambda x: x * 2.0, lambda x: x * Dual(2.0)),
+        ("x / 2.0", lambda x: x / 2.0, lambda x: x / Dual(2.0)),
+        ("3 * x * x + 1", lambda x: 3 * x * x + 1, lambda x: Dual(3) * x * x + Dual(1)),
+    ]
+    print("\nThroughput (operations per second):")
+    print("-" * 60)
+    print(f"{'Expression':<15} | {'Temporary Dual':>15} | {'Fast path':>15} | {'Speed-up':>8}")
+    print("-" * 60)
+    for name, fast, slow in cases:
+        fast_ops = throughput(fast, x, repeat)
+        slow_ops = throughput(slow, x, repeat)
+        print(f"{name:<15} | {slow_ops:>15,.0f} | {fast_ops:>15,.0f} | {fast_ops / slow_ops:>7.2f}x")
+    print("-" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Dual number automatic differentiation
+
+``dual_autodiff.Dual`` is the compiled ``dual_autodiff_x.dual.Dual`` when that package is installed and the
+pure-Python ``dual_autodiff.dual.Dual`` otherwise. Set the environment variable DUAL_AUTODIFF_BACKEND to "python"
+or "cython" (before the first import) to choose one explicitly; ``backend`` holds the name of the one in use. The
+reductions ``dual_sum``, ``dual_dot`` and ``dual_prod`` come from the same backend.
+"""
+
+import os
+
+from . import dual as _python
+
+
+BACKENDS = ("auto", "python", "cython")
+
+
+def _select_backend() -> tuple:
+    """Pick the Dual class according to DUAL_AUTODIFF_BACKEND.
+
+    Raises:
+        ValueError: If DUAL_AUTODIFF_BACKEND is not one of BACKENDS
+        ImportError: If the cython backend is requested but dual_autodiff_x is not installed
+
+    Returns:
+        tuple: (module providing Dual and the reductions, backend name)
+    """
+    requested = os.environ.get("DUAL_AUTODIFF_BACKEND", "auto").strip().lower() or "auto"
+    if requested not in BACKENDS:
+        raise ValueError(
+            f"DUAL_AUTODIFF_BACKEND must be one of {', '.join(BACKENDS)}, got {requested!r}"
+        )
+    if requested != "python":
+        try:
+            import dual_autodiff_x.dual as compiled
+        except ImportError as err:
+            if requested == "cython":
+                raise ImportError(
+                    "DUAL_AUTODIFF_BACKEND=cython requires the compiled dual_autodiff_x package"
+                ) from err
+        else:
+            return compiled, "cython"
+    return _python, "python"
+
+
+_backend_module, backend = _select_backend()
+Dual = _backend_module.Dual
+dual_sum = _backend_module.dual_sum
+dual_dot = _backend_module.dual_dot
+dual_prod = _backend_module.dual_prod
+
+__all__ = ["BACKENDS", "Dual", "backend", "dual_dot", "dual_prod", "dual_sum"]
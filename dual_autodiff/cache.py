@@ -0,0 +1,146 @@
+from collections import OrderedDict, namedtuple
+from typing import Callable, Optional
+
+import numpy as np
+
+from .dual import Dual
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class DerivativeCache:
+    """
+    An opt-in memoizing cache for derivative evaluations with bounded LRU eviction
+
+    Entries are keyed on the function object, the Dual backend and the input value. With a tolerance or a number of
+    decimals, nearby inputs are rounded onto the same key and share one entry. Works with any class exposing the
+    ``derivative(func, x)`` classmethod, i.e. both ``dual_autodiff.dual.Dual`` and ``dual_autodiff_x.dual.Dual``.
+
+    Rounding trades accuracy for hits: an entry holds the derivative at the first input that reached its key, not
+    at the rounded value, and later inputs with the same key get that value unchanged. Two such inputs can be up to
+    one tolerance (or 10 ** -decimals) apart, so a hit can be off by up to about max|f''| * tolerance. For f(x) =
+    x ** 3 and a tolerance of 0.1, inputs 0.96 and 1.04 share an entry and the second one gets 2.76 instead of 3.24.
+
+    Attributes:
+        maxsize: (int): Maximum number of cached entries
+        hits: (int): Number of lookups answered from the cache
+        misses: (int): Number of lookups that had to evaluate the derivative
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        tolerance: Optional[float] = None,
+        decimals: Optional[int] = None,
+    ):
+        """Configure the cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of cached entries. Defaults to 128.
+            tolerance (float, optional): Inputs are snapped to multiples of tolerance before lookup, so a hit may
+                return the derivative at an input up to tolerance away. Defaults to None.
+            decimals (int, optional): Inputs are rounded to this many decimals before lookup, so a hit may return the
+                derivative at an input up to 10 ** -decimals away. Defaults to None.
+
+        Raises:
+            ValueError: If maxsize is not positive, tolerance is not positive, decimals is not a non-negative integer,
+                or both tolerance and decimals are given
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+        if tolerance is not None and decimals is not None:
+            raise ValueError("Only one of tolerance and decimals can be given.")
+        # A zero tolerance would map every input onto the same (nan) key
+        if tolerance is not None and not tolerance > 0:
+            raise ValueError("tolerance must be positive.")
+        if decimals is not None and (isinstance(decimals, bool) or not isinstance(decimals, int) or decimals < 0):
+            raise ValueError("decimals must be a non-negative integer.")
+        self.maxsize = maxsize
+        self.tolerance = tolerance
+        self.decimals = decimals
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, func: Callable, x, backend) -> tuple:
+        """Build the cache key for an evaluation.
+
+        Args:
+            func (Callable): Function being differentiated
+            x (float, np.ndarray): Evaluation point(s)
+            backend (type): Dual class used for the evaluation
+
+        Returns:
+            tuple: Hashable key
+        """
+        values = np.asarray(x, dtype=np.float64)
+        if self.tolerance is not None:
+            values = np.round(values / self.tolerance) * self.tolerance
+        elif self.decimals is not None:
+            values = np.round(values, self.decimals)
+        # Adding 0.0 maps -0.0 onto 0.0 so they share a key
+        values = values + 0.0
+        return func, backend, values.shape, values.tobytes()
+
+    def derivative(self, func: Callable, x, backend: type = Dual):
+        """Evaluate (or look up) the derivative of func at x.
+
+        Args:
+            func (Callable): Function to be differentiated
+            x (float, np.ndarray): Value(s) of x derivative is to be evaluated at
+            backend (type, optional): Dual class performing the evaluation. Defaults to dual_autodiff.dual.Dual.
+
+        Returns:
+            float, np.ndarray: Value(s) of derivative evaluated at x (on a hit with a tolerance or decimals, at the
+                input that created the entry)
+        """
+        key = self._key(func, x, backend)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            result = self._entries[key]
+        else:
+            self.misses += 1
+            result = backend.derivative(func, x)
+            self._entries[key] = result
+            # Evict the least recently used entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        # Hand out copies so callers cannot modify cached arrays
+        return result.copy() if isinstance(result, np.ndarray) else result
+
+    def invalidate(self, func: Optional[Callable] = None) -> int:
+        """Remove cached entries.
+
+        Args:
+            func (Callable, optional): Only remove the entries of this function. Defaults to removing everything.
+
+        Returns:
+            int: Number of entries removed
+        """
+        if func is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+        stale = [key for key in self._entries if key[0] is func]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Report the cache statistics.
+
+        Returns:
+            CacheInfo: (hits, misses, maxsize, currsize)
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
@@ -1,5 +1,76 @@
-from typing import Callable
-import numpy as np
+from __future__ import annotations
+
+import math
+import sys
+from itertools import zip_longest
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Tuple, Union
+
+# NumPy is only needed for array inputs, so it is imported on first use to keep the import of this module cheap
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _numpy():
+    """Import NumPy on first use."""
+    import numpy
+
+    return numpy
+
+
+def _scalar(name: str, numpy_name: str) -> Callable:
+    """Wrap math.<name> so that it falls back to NumPy where math would raise.
+
+    math raises OverflowError or ValueError where NumPy returns inf or nan with a RuntimeWarning (e.g. exp(1000),
+    sin(inf)); the fallback keeps NumPy's results for those inputs, as before scalars were routed through math.
+    """
+    func = getattr(math, name)
+
+    def call(x):
+        try:
+            return func(x)
+        except (OverflowError, ValueError):
+            return float(getattr(_numpy(), numpy_name)(x))
+
+    call.__name__ = numpy_name
+    return call
+
+
+class _ScalarMath:
+    """Elementary functions of plain numbers, with the NumPy names used for arrays."""
+
+    sin = staticmethod(_scalar("sin", "sin"))
+    cos = staticmethod(_scalar("cos", "cos"))
+    tan = staticmethod(_scalar("tan", "tan"))
+    log = staticmethod(_scalar("log", "log"))
+    exp = staticmethod(_scalar("exp", "exp"))
+    sqrt = staticmethod(_scalar("sqrt", "sqrt"))
+    tanh = staticmethod(_scalar("tanh", "tanh"))
+    arcsin = staticmethod(_scalar("asin", "arcsin"))
+    arctan = staticmethod(_scalar("atan", "arctan"))
+
+
+def _lib(value):
+    """Pick the namespace for elementary functions of value: _ScalarMath for plain numbers, NumPy otherwise."""
+    if isinstance(value, (int, float)):
+        return _ScalarMath
+    return _numpy()
+
+
+def _any(condition) -> bool:
+    """Whether a condition holds for a plain number or for any element of an array."""
+    return bool(condition) if isinstance(condition, bool) else bool(_numpy().any(condition))
+
+
+def _erf(value):
+    """Error function of a plain number (math) or an array (scipy.special if installed, else elementwise math)."""
+    if isinstance(value, (int, float)):
+        return math.erf(value)
+    try:
+        from scipy.special import erf
+    except ImportError:
+        np = _numpy()
+        return np.vectorize(math.erf, otypes=[float])(value)
+    return erf(value)
 
 
 class Dual:
@@ -14,7 +85,9 @@ class Dual:
         real: (float): Real part
         dual: (float): Dual part
     """
-    
+
+    # No per-instance __dict__, so large collections of Duals stay small
+    __slots__ = ("real", "dual")
 
     def __init__(self, real: float, dual: float = 0.0):
         """Input the real and dual parts of the dual number.
@@ -40,9 +113,13 @@ class Dual:
             Dual: Resulting sum of the addition
         """
         # Check if the other object is a Dual number
-        if not isinstance(other, Dual):
-            # If the other number is not a Dual number, make it a Dual number
-            other = Dual(other)
+        if isinstance(other, Dual):
+            return Dual(self.real + other.real, self.dual + other.dual)
+        # Fast path for plain numbers (c + 0ε), without building a temporary Dual
+        if isinstance(other, (int, float)):
+            return Dual(self.real + other, self.dual)
+        # Otherwise make it a Dual number
+        other = Dual(other)
         return Dual(self.real + other.real, self.dual + other.dual)
 
     # Reverse addition (if right side of operand is a Dual number)
@@ -68,6 +145,9 @@ class Dual:
         Returns:
             Dual: Resulting difference of the subtraction
         """
+        # Fast path for plain numbers (c + 0ε)
+        if isinstance(other, (int, float)):
+            return Dual(self.real - other, self.dual)
         # Check if the other object is a Dual number
         if not isinstance(other, Dual):
             # Make it a Dual number
@@ -84,12 +164,24 @@ class Dual:
         Returns:
             Dual: Resulting difference of the subtraction
         """
+        # Fast path for plain numbers (c + 0ε)
+        if isinstance(other, (int, float)):
+            return Dual(other - self.real, -self.dual)
         # Convert other number to Dual number if needed
         if not isinstance(other, Dual):
             other = Dual(other)
         # Reverse the order (other - self)
         return Dual(other.real - self.real, other.dual - self.dual)
 
+    # Negation
+    def __neg__(self) -> "Dual":
+        """Overload unary - operator to negate the Dual number.
+
+        Returns:
+            Dual: -(a + bε) = -a - bε
+        """
+        return Dual(-self.real, -self.dual)
+
     # Multiplication
     def __mul__(self, other) -> "Dual":
         """Overload * operator to perform multiplication involving Dual numbers.
@@ -100,6 +192,9 @@ class Dual:
         Returns:
             Dual: Resulting product of the multiplication
         """
+        # Fast path for plain numbers (c + 0ε): both parts are scaled
+        if isinstance(other, (int, float)):
+            return Dual(self.real * other, self.dual * other)
         # Check if the other object is a Dual number
         if not isinstance(other, Dual):
             # Make it a Dual number
@@ -132,11 +227,14 @@ class Dual:
         Returns:
             Dual: Resulting quotient of the division
         """
+        # Fast path for plain numbers (c + 0ε): both parts are divided
+        if isinstance(other, (int, float)):
+            return Dual(self.real / other, self.dual / other)
         # Check if the other object is a Dual number
         if not isinstance(other, Dual):
             # Make it a Dual number
             other = Dual(other)
-            # Perform the division (https://fs.unm.edu/DualNumbers.pdf)
+        # Perform the division (https://fs.unm.edu/DualNumbers.pdf)
         real = self.real / other.real
         dual = (self.dual * other.real - self.real * other.dual) / (other.real**2)
         return Dual(real, dual)
@@ -151,6 +249,9 @@ class Dual:
         Returns:
             Dual: Resulting quotient of the division
         """
+        # Fast path for plain numbers (c + 0ε)
+        if isinstance(other, (int, float)):
+            return Dual(other / self.real, -other * self.dual / (self.real**2))
         # Check if the other object is a Dual number
         if not isinstance(other, Dual):
             # Make it a Dual number
@@ -185,7 +286,7 @@ class Dual:
                 )
             # (a + bε) ** (c + dε) = a ** c * (1 + (b * c * log(a) + d * log(a) * ε)) - from Stack Exchange
             pow_real = a**c
-            pow_dual = a ** (c - 1) * (b * c + a * d * np.log(a))
+            pow_dual = a ** (c - 1) * (b * c + a * d * _lib(a).log(a))
             return Dual(pow_real, pow_dual)
         else:
             # If other is a real number (a + bε) ** n
@@ -214,7 +315,7 @@ class Dual:
             a, b = self.real, self.dual
             # Applying opposite principle to __pow__
             pow_real = other**a
-            pow_dual = pow_real * b * np.log(other)
+            pow_dual = pow_real * b * _lib(other).log(other)
             return Dual(pow_real, pow_dual)
         else:
             # Raise a ValueError if the LHS is not a float or a int (Dual ** Dual handled by __pow__)
@@ -231,24 +332,57 @@ class Dual:
         """
         return f"Dual({self.real}, {self.dual})"
 
+    def __reduce__(self) -> tuple:
+        """Pickle as the constructor call Dual(real, dual), which is cheaper than the default for __slots__ classes.
+
+        Returns:
+            tuple: (Dual, (real, dual))
+        """
+        return Dual, (self.real, self.dual)
+
     # CLASS METHODS FOR DUAL NUMBERS
     # Derivative
     @classmethod
-    def derivative(cls, func: Callable, x: float) -> float:
+    def derivative(
+        cls, func: Callable, x: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """Function to be used for automatic differentiation, where the result is the derivative of the function evaluated at x
+
+        If x is an array of points, all points are seeded at once in a DualArray and func is evaluated a single time
+        in vectorised form. If func needs single numbers (it branches on x, or converts it with float() or math
+        functions), the derivative is evaluated point by point instead; other errors raised by func propagate.
+
         Args:
             func (Callable): Function to be differentiated
-            x (float): Value of x derivative is to be evaluated at
+            x (float, np.ndarray): Value(s) of x derivative is to be evaluated at
 
         Returns:
-            float: Value of derivative evaluated at x
+            float, np.ndarray: Value(s) of derivative evaluated at x
         """
+        if not isinstance(x, (int, float)) and _numpy().ndim(x) > 0:
+            return cls._derivative_array(func, _numpy().asarray(x, dtype=float))
         # Get the dual of the input x value
         dual_x = cls(x, 1.0)
         # Evaluate the function at x
         eval_x = func(dual_x)
         return eval_x.dual
 
+    @classmethod
+    def _derivative_array(cls, func: Callable, x: np.ndarray) -> np.ndarray:
+        """Evaluate the derivative of func at every point of the array x.
+
+        Args:
+            func (Callable): Function to be differentiated
+            x (np.ndarray): Values of x derivative is to be evaluated at
+
+        Returns:
+            np.ndarray: Values of derivative evaluated at x, with the same shape as x
+        """
+        # Imported here as dual_array depends on this module
+        from .dual_array import _evaluate_points
+
+        return _evaluate_points(func, x, cls)[1]
+
     # IMPLEMENT COMMON FUNCTIONS f(x) AND GET DERIVATIVE f'(x)
     # sin(x)
     def sin(self) -> "Dual":
@@ -261,20 +395,21 @@ class Dual:
         Returns:
             Dual: returns the Dual representation of sin(x)
         """
-        return Dual(np.sin(self.real), np.cos(self.real) * self.dual)
+        lib = _lib(self.real)
+        return Dual(lib.sin(self.real), lib.cos(self.real) * self.dual)
 
     # Compute the derivative of sin(x) directly
     @staticmethod  # staticmethod to directly evaluate the derivative
-    def sin_derivative(x: float) -> float:
+    def sin_derivative(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """Direct static function to calculate the derivative of sin(x) at x
 
         Args:
-            x (float): Value to evaluate the derivative
+            x (float, np.ndarray): Value(s) to evaluate the derivative
 
         Returns:
-            float: Value of derivative evaluated at x
+            float, np.ndarray: Value(s) of derivative evaluated at x
         """
-        return Dual.derivative(np.sin, x)
+        return Dual.derivative(lambda x: x.sin(), x)
 
     # cos(x)
     def cos(self) -> "Dual":
@@ -287,20 +422,21 @@ class Dual:
         Returns:
             Dual: returns the Dual representation of cos(x)
         """
-        return Dual(np.cos(self.real), -np.sin(self.real) * self.dual)
+        lib = _lib(self.real)
+        return Dual(lib.cos(self.real), -lib.sin(self.real) * self.dual)
 
     # Compute the derivative of cos(x) directly
     @staticmethod
-    def cos_derivative(x: float) -> float:
+    def cos_derivative(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """Direct static function to calculate the derivative of cos(x) at x
 
         Args:
-            x (float): Value to evaluate the derivative
+            x (float, np.ndarray): Value(s) to evaluate the derivative
 
         Returns:
-            float: Value of derivative evaluated at x
+            float, np.ndarray: Value(s) of derivative evaluated at x
         """
-        return Dual.derivative(np.cos, x)
+        return Dual.derivative(lambda x: x.cos(), x)
 
     # tan(x)
     def tan(self) -> "Dual":
@@ -313,20 +449,21 @@ class Dual:
         Returns:
             Dual: returns the Dual representation of tan(x)
         """
-        return Dual(np.tan(self.real), ((1 / np.cos(self.real)) ** 2) * self.dual)
+        lib = _lib(self.real)
+        return Dual(lib.tan(self.real), ((1 / lib.cos(self.real)) ** 2) * self.dual)
 
     # Compute the derivative of tan(x) directly
     @staticmethod
-    def tan_derivative(x: float) -> float:
+    def tan_derivative(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """Direct static function to calculate the derivative of tan(x) at x
 
         Args:
-            x (float): Value to evaluate the derivative
+            x (float, np.ndarray): Value(s) to evaluate the derivative
 
         Returns:
-            float: Value of derivative evaluated at x
+            float, np.ndarray: Value(s) of derivative evaluated at x
         """
-        return Dual.derivative(np.tan, x)
+        return Dual.derivative(lambda x: x.tan(), x)
 
     # ln(x)
     def log(self) -> "Dual":
@@ -346,20 +483,20 @@ class Dual:
         if self.real <= 0:
             # Raise a Value error
             raise ValueError("The argument to ln must be positive.")
-        return Dual(np.log(self.real), self.dual / self.real)
+        return Dual(_lib(self.real).log(self.real), self.dual / self.real)
 
     # Compute the derivative of ln(x) directly
     @staticmethod
-    def log_derivative(x: float) -> float:
+    def log_derivative(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """Direct static function to calculate the derivative of ln(x) at x
 
         Args:
-            x (float): Value to evaluate the derivative
+            x (float, np.ndarray): Value(s) to evaluate the derivative
 
         Returns:
-            float: Value of derivative evaluated at x
+            float, np.ndarray: Value(s) of derivative evaluated at x
         """
-        return Dual.derivative(np.log, x)
+        return Dual.derivative(lambda x: x.log(), x)
     
     # exp(x)
     def exp(self) -> "Dual":
@@ -373,17 +510,337 @@ class Dual:
             Dual: returns the Dual representation of exp(x)
         """
         # Find the exponential of the real part
-        exp_real = np.exp(self.real)
+        exp_real = _lib(self.real).exp(self.real)
         return Dual(exp_real, exp_real * self.dual)
 
     @staticmethod
-    def exp_derivative(x: float) -> float:
+    def exp_derivative(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
         """Direct static function to calculate the derivative of exp(x) at x
 
         Args:
-            x (float): Value to evaluate the derivative
+            x (float, np.ndarray): Value(s) to evaluate the derivative
+
+        Returns:
+            float, np.ndarray: Value(s) of derivative evaluated at x
+        """
+        return Dual.derivative(lambda x: x.exp(), x)
+
+    # sqrt(x)
+    def sqrt(self) -> "Dual":
+        """
+        Returns sqrt(x), where x is a Dual number.
+
+        x = a + b * ε
+        sqrt(x) = sqrt(a) + (b / (2 * sqrt(a))) * ε
+
+        Raises:
+            ValueError: if the argument to sqrt is not positive
+
+        Returns:
+            Dual: returns the Dual representation of sqrt(x)
+        """
+        # Check for non-positive values (the derivative is infinite at 0)
+        if _any(self.real <= 0):
+            raise ValueError("The argument to sqrt must be positive.")
+        sqrt_real = _lib(self.real).sqrt(self.real)
+        return Dual(sqrt_real, self.dual / (2 * sqrt_real))
+
+    @staticmethod
+    def sqrt_derivative(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Direct static function to calculate the derivative of sqrt(x) at x
+
+        Args:
+            x (float, np.ndarray): Value(s) to evaluate the derivative
+
+        Returns:
+            float, np.ndarray: Value(s) of derivative evaluated at x
+        """
+        return Dual.derivative(lambda x: x.sqrt(), x)
+
+    # tanh(x)
+    def tanh(self) -> "Dual":
+        """
+        Returns tanh(x), where x is a Dual number.
+
+        x = a + b * ε
+        tanh(x) = tanh(a) + b * (1 - tanh(a) ** 2) * ε
+
+        Returns:
+            Dual: returns the Dual representation of tanh(x)
+        """
+        tanh_real = _lib(self.real).tanh(self.real)
+        return Dual(tanh_real, (1 - tanh_real * tanh_real) * self.dual)
+
+    @staticmethod
+    def tanh_derivative(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Direct static function to calculate the derivative of tanh(x) at x
+
+        Args:
+            x (float, np.ndarray): Value(s) to evaluate the derivative
 
         Returns:
-            float: Value of derivative evaluated at x
+            float, np.ndarray: Value(s) of derivative evaluated at x
+        """
+        return Dual.derivative(lambda x: x.tanh(), x)
+
+    # sigmoid(x)
+    def sigmoid(self) -> "Dual":
         """
-        return Dual.derivative(np.exp, x)
+        Returns sigmoid(x), where x is a Dual number.
+
+        x = a + b * ε
+        sigmoid(x) = s + b * s * (1 - s) * ε, where s = 1 / (1 + exp(-a))
+
+        Returns:
+            Dual: returns the Dual representation of sigmoid(x)
+        """
+        # 1 / (1 + exp(-a)) written with tanh, which cannot overflow for large |a|
+        sig_real = 0.5 * (1 + _lib(self.real).tanh(0.5 * self.real))
+        return Dual(sig_real, sig_real * (1 - sig_real) * self.dual)
+
+    @staticmethod
+    def sigmoid_derivative(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Direct static function to calculate the derivative of sigmoid(x) at x
+
+        Args:
+            x (float, np.ndarray): Value(s) to evaluate the derivative
+
+        Returns:
+            float, np.ndarray: Value(s) of derivative evaluated at x
+        """
+        return Dual.derivative(lambda x: x.sigmoid(), x)
+
+    # arcsin(x)
+    def arcsin(self) -> "Dual":
+        """
+        Returns arcsin(x), where x is a Dual number.
+
+        x = a + b * ε
+        arcsin(x) = arcsin(a) + (b / sqrt(1 - a ** 2)) * ε
+
+        Raises:
+            ValueError: if the argument to arcsin is not in (-1, 1)
+
+        Returns:
+            Dual: returns the Dual representation of arcsin(x)
+        """
+        # Check the domain (the derivative is infinite at -1 and 1)
+        if _any(self.real <= -1) or _any(self.real >= 1):
+            raise ValueError("The argument to arcsin must be in (-1, 1).")
+        lib = _lib(self.real)
+        return Dual(lib.arcsin(self.real), self.dual / lib.sqrt(1 - self.real * self.real))
+
+    @staticmethod
+    def arcsin_derivative(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Direct static function to calculate the derivative of arcsin(x) at x
+
+        Args:
+            x (float, np.ndarray): Value(s) to evaluate the derivative
+
+        Returns:
+            float, np.ndarray: Value(s) of derivative evaluated at x
+        """
+        return Dual.derivative(lambda x: x.arcsin(), x)
+
+    # arctan(x)
+    def arctan(self) -> "Dual":
+        """
+        Returns arctan(x), where x is a Dual number.
+
+        x = a + b * ε
+        arctan(x) = arctan(a) + (b / (1 + a ** 2)) * ε
+
+        Returns:
+            Dual: returns the Dual representation of arctan(x)
+        """
+        return Dual(_lib(self.real).arctan(self.real), self.dual / (1 + self.real * self.real))
+
+    @staticmethod
+    def arctan_derivative(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Direct static function to calculate the derivative of arctan(x) at x
+
+        Args:
+            x (float, np.ndarray): Value(s) to evaluate the derivative
+
+        Returns:
+            float, np.ndarray: Value(s) of derivative evaluated at x
+        """
+        return Dual.derivative(lambda x: x.arctan(), x)
+
+    # |x|
+    def abs(self) -> "Dual":
+        """
+        Returns |x|, where x is a Dual number.
+
+        x = a + b * ε
+        |x| = |a| + b * sign(a) * ε (the tangent at a = 0 is taken to be 0)
+
+        Returns:
+            Dual: returns the Dual representation of |x|
+        """
+        if isinstance(self.real, (int, float)):
+            sign = 1.0 if self.real > 0 else -1.0 if self.real < 0 else 0.0
+            return Dual(abs(self.real), sign * self.dual)
+        np = _numpy()
+        return Dual(np.abs(self.real), np.sign(self.real) * self.dual)
+
+    @staticmethod
+    def abs_derivative(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Direct static function to calculate the derivative of |x| at x
+
+        Args:
+            x (float, np.ndarray): Value(s) to evaluate the derivative
+
+        Returns:
+            float, np.ndarray: Value(s) of derivative evaluated at x
+        """
+        return Dual.derivative(lambda x: x.abs(), x)
+
+    def __abs__(self) -> "Dual":
+        """Overload abs() to return |x| (see Dual.abs)."""
+        return self.abs()
+
+    # erf(x)
+    def erf(self) -> "Dual":
+        """
+        Returns erf(x), where x is a Dual number.
+
+        x = a + b * ε
+        erf(x) = erf(a) + b * (2 / sqrt(pi)) * exp(-a ** 2) * ε
+
+        Returns:
+            Dual: returns the Dual representation of erf(x)
+        """
+        lib = _lib(self.real)
+        return Dual(_erf(self.real), 2 / math.sqrt(math.pi) * lib.exp(-self.real * self.real) * self.dual)
+
+    @staticmethod
+    def erf_derivative(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Direct static function to calculate the derivative of erf(x) at x
+
+        Args:
+            x (float, np.ndarray): Value(s) to evaluate the derivative
+
+        Returns:
+            float, np.ndarray: Value(s) of derivative evaluated at x
+        """
+        return Dual.derivative(lambda x: x.erf(), x)
+
+
+# REDUCTIONS OVER MANY DUAL NUMBERS
+# Each runs over its input once with plain running totals for the real and dual parts, so no intermediate Dual is
+# created per element (unlike sum() or a loop of +, which allocate one per step). Elements may be Dual numbers or
+# plain numbers (c + 0ε).
+def _array_parts(values) -> Optional[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """Flattened (real, dual) parts of a DualArray, or (values, None) for a numeric NumPy array.
+
+    Returns:
+        tuple, None: The parts, or None for other inputs, which are reduced element by element
+    """
+    # A DualArray can only exist once its module has been imported, so this check never imports NumPy itself
+    dual_array = sys.modules.get(__package__ + ".dual_array")
+    if dual_array is not None and isinstance(values, dual_array.DualArray):
+        return values.real.ravel(), values.dual.ravel()
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(values, np.ndarray) and values.dtype != object:
+        return values.ravel(), None
+    return None
+
+
+def dual_sum(values: Iterable) -> Dual:
+    """Sum of dual numbers.
+
+    Args:
+        values (Iterable[Dual, int, float], DualArray): Terms of the sum
+
+    Returns:
+        Dual: Sum of the terms (Dual(0.0, 0.0) when there are none)
+    """
+    parts = _array_parts(values)
+    if parts is not None:
+        real, dual = parts
+        return Dual(float(real.sum()), 0.0 if dual is None else float(dual.sum()))
+    real = dual = 0.0
+    for x in values:
+        if isinstance(x, Dual):
+            real += x.real
+            dual += x.dual
+        else:
+            real += x
+    return Dual(real, dual)
+
+
+def dual_dot(a: Iterable, b: Iterable) -> Dual:
+    """Dot product of two equal-length sequences of dual numbers, sum((a_i + a_i'ε)(b_i + b_i'ε)).
+
+    Args:
+        a (Iterable[Dual, int, float], DualArray): Left operand
+        b (Iterable[Dual, int, float], DualArray): Right operand
+
+    Raises:
+        ValueError: If the operands have different lengths
+
+    Returns:
+        Dual: Dot product, with dual part sum(a_i' b_i + a_i b_i')
+    """
+    a_parts, b_parts = _array_parts(a), _array_parts(b)
+    if a_parts is not None and b_parts is not None:
+        (ar, ad), (br, bd) = a_parts, b_parts
+        if ar.shape != br.shape:
+            raise ValueError("dual_dot requires operands of the same length.")
+        dual = 0.0
+        if ad is not None:
+            dual += float(ad @ br)
+        if bd is not None:
+            dual += float(ar @ bd)
+        return Dual(float(ar @ br), dual)
+    missing = object()
+    real = dual = 0.0
+    for x, y in zip_longest(a, b, fillvalue=missing):
+        if x is missing or y is missing:
+            raise ValueError("dual_dot requires operands of the same length.")
+        if isinstance(x, Dual):
+            if isinstance(y, Dual):
+                real += x.real * y.real
+                dual += x.real * y.dual + x.dual * y.real
+            else:
+                real += x.real * y
+                dual += x.dual * y
+        elif isinstance(y, Dual):
+            real += x * y.real
+            dual += x * y.dual
+        else:
+            real += x * y
+    return Dual(real, dual)
+
+
+def dual_prod(values: Iterable) -> Dual:
+    """Product of dual numbers.
+
+    The dual part follows the product rule, sum_i (b_i * prod_{j != i} a_j), and is exact when real parts are zero.
+
+    Args:
+        values (Iterable[Dual, int, float], DualArray): Factors of the product
+
+    Returns:
+        Dual: Product of the factors (Dual(1.0, 0.0) when there are none)
+    """
+    parts = _array_parts(values)
+    if parts is not None:
+        real, dual = parts
+        if dual is None:
+            return Dual(float(real.prod()), 0.0)
+        np = _numpy()
+        # prod_{j != i} a_j as (product of the factors before i) * (product of the factors after i)
+        before = np.concatenate(([1.0], np.cumprod(real[:-1])))
+        after = np.concatenate((np.cumprod(real[:0:-1])[::-1], [1.0]))
+        return Dual(float(real.prod()), float(np.sum(dual * before * after)))
+    real, dual = 1.0, 0.0
+    for x in values:
+        if isinstance(x, Dual):
+            dual = real * x.dual + dual * x.real
+            real *= x.real
+        else:
+            real *= x
+            dual *= x
+    return Dual(real, dual)
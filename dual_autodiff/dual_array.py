@@ -0,0 +1,498 @@
+from typing import Callable, Tuple, Union
+import numpy as np
+
+from .dual import Dual, _erf
+
+
+class NotVectorisableError(TypeError):
+    """Raised when a DualArray is used where a single number is needed (e.g. by float() or math.sin)."""
+
+
+class DualArray:
+    """
+    A class for representing arrays of dual numbers for vectorised automatic differentiation
+
+    Rather than holding one Dual object per element, the real and dual parts are stored as two contiguous
+    NumPy arrays, so every operation is a whole-array NumPy operation.
+
+    Both parts are float64 by default. For memory-bandwidth bound work they can be stored as float32 (half the
+    memory traffic), or in mixed precision with a float64 real part and a float32 dual part. Every operation is
+    computed in at least the precision of its inputs and the result is rounded to the precision of the operands,
+    so results keep the widest precision of the DualArray operands. The dual part of a float32 result carries a
+    relative rounding error of about 6e-8 per operation (float32 machine epsilon), versus 1e-16 for float64, which
+    adds up to around 1e-6 for a function of a dozen operations. Mixed precision keeps the values of func at full
+    float64 accuracy and only rounds the derivatives (around 3e-7 for the same function).
+    demo/precision_benchmark.py measures the accuracy and throughput of the three modes.
+
+    Each element has the form a + bε, where a is the real part and b is coefficient to ε, where ε ** 2 = 0.
+
+    Attributes:
+        real: (np.ndarray): Real parts
+        dual: (np.ndarray): Dual parts
+    """
+
+    # Make NumPy defer to the reflected operators of DualArray (e.g. ndarray * DualArray)
+    __array_priority__ = 1000
+
+    def __init__(self, real, dual=None, dtype=np.float64, dual_dtype=None):
+        """Input the real and dual parts of the dual array.
+
+        Args:
+            real (array_like): Real parts of the dual numbers.
+            dual (array_like, optional): Dual parts of the dual numbers. Defaults to zeros.
+            dtype (np.dtype, optional): Storage type of the real parts, float32 or float64. Defaults to float64.
+            dual_dtype (np.dtype, optional): Storage type of the dual parts, float32 or float64. Defaults to dtype.
+
+        Raises:
+            ValueError: If a storage type is not float32 or float64
+        """
+        dtype = self._precision(dtype)
+        dual_dtype = dtype if dual_dtype is None else self._precision(dual_dtype)
+        self.real = np.ascontiguousarray(real, dtype=dtype)
+        if dual is None:
+            self.dual = np.zeros(self.real.shape, dtype=dual_dtype)
+        else:
+            dual = np.asarray(dual, dtype=dual_dtype)
+            if dual.shape != self.real.shape:
+                # Copy the broadcast, as broadcast views are read-only
+                dual = np.array(np.broadcast_to(dual, self.real.shape))
+            self.dual = np.ascontiguousarray(dual)
+
+    @staticmethod
+    def _precision(dtype) -> np.dtype:
+        """Check that a storage type is float32 or float64."""
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError(f"DualArray parts must be float32 or float64, not {dtype}")
+        return dtype
+
+    @classmethod
+    def from_duals(cls, duals, dtype=np.float64, dual_dtype=None) -> "DualArray":
+        """Build a DualArray from a sequence of Dual numbers.
+
+        Args:
+            duals (Iterable[Dual]): Dual numbers to be packed into the array
+            dtype (np.dtype, optional): Storage type of the real parts. Defaults to float64.
+            dual_dtype (np.dtype, optional): Storage type of the dual parts. Defaults to dtype.
+
+        Returns:
+            DualArray: Array holding the real and dual parts of the inputs
+        """
+        duals = list(duals)
+        real = np.fromiter((d.real for d in duals), dtype=np.float64, count=len(duals))
+        dual = np.fromiter((d.dual for d in duals), dtype=np.float64, count=len(duals))
+        return cls(real, dual, dtype=dtype, dual_dtype=dual_dtype)
+
+    def to_duals(self) -> list:
+        """Unpack the array into a flat list of Dual numbers.
+
+        Returns:
+            list: Dual numbers, one per element
+        """
+        return [Dual(r, d) for r, d in zip(self.real.ravel().tolist(), self.dual.ravel().tolist())]
+
+    # Convert the other operand into a pair of (real, dual) parts
+    @staticmethod
+    def _parts(other):
+        """Split an operand into its real and dual parts.
+
+        Args:
+            other (int, float, array_like, Dual, DualArray): Operand to split
+
+        Returns:
+            tuple: (real, dual) parts of the operand
+        """
+        if isinstance(other, (DualArray, Dual)):
+            return other.real, other.dual
+        # Plain numbers and arrays have no dual part
+        return np.asarray(other, dtype=np.float64), 0.0
+
+    def astype(self, dtype, dual_dtype=None) -> "DualArray":
+        """Copy the array with new storage types.
+
+        Args:
+            dtype (np.dtype): Storage type of the real parts, float32 or float64
+            dual_dtype (np.dtype, optional): Storage type of the dual parts. Defaults to dtype.
+
+        Returns:
+            DualArray: Converted copy
+        """
+        return DualArray(self.real.copy(), self.dual.copy(), dtype=dtype, dual_dtype=dual_dtype)
+
+    def _like(self, real, dual, other=None) -> "DualArray":
+        """Build a result with the storage types of self, widened to those of other if it is a DualArray.
+
+        Args:
+            real (array_like): Real parts of the result
+            dual (array_like): Dual parts of the result
+            other (optional): The other operand of a binary operation
+
+        Returns:
+            DualArray: Result of the operation
+        """
+        dtype, dual_dtype = self.real.dtype, self.dual.dtype
+        if isinstance(other, DualArray):
+            dtype = np.promote_types(dtype, other.real.dtype)
+            dual_dtype = np.promote_types(dual_dtype, other.dual.dtype)
+        return DualArray(real, dual, dtype=dtype, dual_dtype=dual_dtype)
+
+    # Array container behaviour
+    @property
+    def shape(self) -> tuple:
+        """Shape of the array."""
+        return self.real.shape
+
+    @property
+    def ndim(self) -> int:
+        """Number of array dimensions."""
+        return self.real.ndim
+
+    @property
+    def size(self) -> int:
+        """Number of elements in the array."""
+        return self.real.size
+
+    def __len__(self) -> int:
+        return len(self.real)
+
+    def __getitem__(self, index) -> Union[Dual, "DualArray"]:
+        """Index the array, returning a Dual for a single element and a DualArray otherwise."""
+        real = self.real[index]
+        dual = self.dual[index]
+        if np.ndim(real) == 0:
+            return Dual(float(real), float(dual))
+        return self._like(real, dual)
+
+    def __setitem__(self, index, value) -> None:
+        """Assign Dual numbers, DualArrays or plain numbers to elements of the array."""
+        real, dual = self._parts(value)
+        self.real[index] = real
+        self.dual[index] = dual
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    # A DualArray holds many dual numbers, so it cannot stand in for a single number
+    def __float__(self):
+        raise NotVectorisableError("A DualArray cannot be converted to a single number.")
+
+    __int__ = __complex__ = __float__
+
+    # Overloading the arithmetic operators (same rules as Dual, applied elementwise)
+    # Addition
+    def __add__(self, other) -> "DualArray":
+        """Overload + operator to perform elementwise addition.
+
+        Args:
+            other (int, float, array_like, Dual, DualArray): Right hand side of the + operator
+
+        Returns:
+            DualArray: Resulting sum of the addition
+        """
+        c, d = self._parts(other)
+        return self._like(self.real + c, self.dual + d, other)
+
+    def __radd__(self, other) -> "DualArray":
+        """Overload + operator when the DualArray is on the right hand side of the operator."""
+        return self.__add__(other)
+
+    # Subtraction
+    def __sub__(self, other) -> "DualArray":
+        """Overload - operator to perform elementwise subtraction.
+
+        Args:
+            other (int, float, array_like, Dual, DualArray): Right hand side of the - operator
+
+        Returns:
+            DualArray: Resulting difference of the subtraction
+        """
+        c, d = self._parts(other)
+        return self._like(self.real - c, self.dual - d, other)
+
+    def __rsub__(self, other) -> "DualArray":
+        """Overload - operator when the DualArray is on the right hand side of the operator (other - self)."""
+        c, d = self._parts(other)
+        return self._like(c - self.real, d - self.dual, other)
+
+    def __neg__(self) -> "DualArray":
+        return self._like(-self.real, -self.dual)
+
+    # Multiplication
+    def __mul__(self, other) -> "DualArray":
+        """Overload * operator to perform elementwise multiplication.
+
+        Args:
+            other (int, float, array_like, Dual, DualArray): Right hand side of the * operator
+
+        Returns:
+            DualArray: Resulting product of the multiplication
+        """
+        c, d = self._parts(other)
+        return self._like(self.real * c, self.real * d + self.dual * c, other)
+
+    def __rmul__(self, other) -> "DualArray":
+        """Overload * operator when the DualArray is on the right hand side of the operator."""
+        return self.__mul__(other)
+
+    # Division
+    def __truediv__(self, other) -> "DualArray":
+        """Overload / operator to perform elementwise division.
+
+        Args:
+            other (int, float, array_like, Dual, DualArray): Right hand side of the / operator
+
+        Returns:
+            DualArray: Resulting quotient of the division
+        """
+        c, d = self._parts(other)
+        return self._like(self.real / c, (self.dual * c - self.real * d) / (c * c), other)
+
+    def __rtruediv__(self, other) -> "DualArray":
+        """Overload / operator when the DualArray is on the right hand side of the operator (other / self)."""
+        c, d = self._parts(other)
+        return self._like(c / self.real, (d * self.real - c * self.dual) / (self.real * self.real), other)
+
+    # Power
+    def __pow__(self, other) -> "DualArray":
+        """Overload ** operator when the DualArray is the base.
+
+        Args:
+            other (int, float, array_like, Dual, DualArray): Right hand side of ** operator (exponent).
+
+        Raises:
+            ValueError: For when a real part is negative with a dual exponent (logarithm of negative number is undefined)
+
+        Returns:
+            DualArray: Resulting dual array
+        """
+        a, b = self.real, self.dual
+        if isinstance(other, (Dual, DualArray)):
+            # (a + bε) ** (c + dε)
+            c, d = other.real, other.dual
+            if np.any(a < 0):
+                raise ValueError(
+                    "The real part of base cannot be negative for exponents (undefined)"
+                )
+            pow_real = a**c
+            # Guard log(0) where the exponent has no dual part (0 * -inf would give nan)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_term = np.where(np.asarray(d) == 0, 0.0, a * d * np.log(a))
+            pow_dual = a ** (c - 1) * (b * c + log_term)
+            return self._like(pow_real, pow_dual, other)
+        # (a + bε) ** n
+        n = np.asarray(other, dtype=np.float64)
+        return self._like(a**n, n * b * (a ** (n - 1)))
+
+    def __rpow__(self, other) -> "DualArray":
+        """Overload ** operator when the DualArray is the exponent.
+
+        Args:
+            other (int, float, array_like): Left hand side of ** operator (base).
+
+        Returns:
+            DualArray: Resulting dual array
+        """
+        base = np.asarray(other, dtype=np.float64)
+        pow_real = base**self.real
+        return self._like(pow_real, pow_real * self.dual * np.log(base))
+
+    # Matrix multiplication
+    def __matmul__(self, other) -> Union[Dual, "DualArray"]:
+        """Overload @ operator to perform matrix multiplication (see dual_autodiff.linalg.matmul).
+
+        Args:
+            other (array_like, DualArray): Right hand side of the @ operator
+
+        Returns:
+            Dual, DualArray: Resulting matrix product (a Dual for the product of two vectors)
+        """
+        # Imported here as linalg depends on this module
+        from .linalg import matmul
+
+        return matmul(self, other)
+
+    def __rmatmul__(self, other) -> Union[Dual, "DualArray"]:
+        """Overload @ operator when the DualArray is on the right hand side of the operator."""
+        from .linalg import matmul
+
+        return matmul(other, self)
+
+    # Create a representation function for interactive notebooks
+    def __repr__(self) -> str:
+        return f"DualArray({self.real!r}, {self.dual!r})"
+
+    # IMPLEMENT COMMON FUNCTIONS f(x) ELEMENTWISE
+    def sin(self) -> "DualArray":
+        """
+        Returns sin(x) elementwise, where sin(a + bε) = sin(a) + b * cos(a) * ε
+        """
+        return self._like(np.sin(self.real), np.cos(self.real) * self.dual)
+
+    def cos(self) -> "DualArray":
+        """
+        Returns cos(x) elementwise, where cos(a + bε) = cos(a) - b * sin(a) * ε
+        """
+        return self._like(np.cos(self.real), -np.sin(self.real) * self.dual)
+
+    def tan(self) -> "DualArray":
+        """
+        Returns tan(x) elementwise, where tan(a + bε) = tan(a) + b * sec(a) ** 2 * ε
+        """
+        cos_real = np.cos(self.real)
+        return self._like(np.tan(self.real), self.dual / (cos_real * cos_real))
+
+    def log(self) -> "DualArray":
+        """
+        Returns ln(x) elementwise, where ln(a + bε) = ln(a) + (b / a) * ε
+
+        Raises:
+            ValueError: if any argument to ln is not positive
+        """
+        if np.any(self.real <= 0):
+            raise ValueError("The argument to ln must be positive.")
+        return self._like(np.log(self.real), self.dual / self.real)
+
+    def exp(self) -> "DualArray":
+        """
+        Returns exp(x) elementwise, where exp(a + bε) = exp(a) + b * exp(a) * ε
+        """
+        exp_real = np.exp(self.real)
+        return self._like(exp_real, exp_real * self.dual)
+
+    def sqrt(self) -> "DualArray":
+        """
+        Returns sqrt(x) elementwise, where sqrt(a + bε) = sqrt(a) + (b / (2 * sqrt(a))) * ε
+
+        Raises:
+            ValueError: if any argument to sqrt is not positive
+        """
+        if np.any(self.real <= 0):
+            raise ValueError("The argument to sqrt must be positive.")
+        sqrt_real = np.sqrt(self.real)
+        return self._like(sqrt_real, self.dual / (2 * sqrt_real))
+
+    def tanh(self) -> "DualArray":
+        """
+        Returns tanh(x) elementwise, where tanh(a + bε) = tanh(a) + b * (1 - tanh(a) ** 2) * ε
+        """
+        tanh_real = np.tanh(self.real)
+        return self._like(tanh_real, (1 - tanh_real * tanh_real) * self.dual)
+
+    def sigmoid(self) -> "DualArray":
+        """
+        Returns sigmoid(x) elementwise, where sigmoid(a + bε) = s + b * s * (1 - s) * ε with s = 1 / (1 + exp(-a))
+        """
+        sig_real = 0.5 * (1 + np.tanh(0.5 * self.real))
+        return self._like(sig_real, sig_real * (1 - sig_real) * self.dual)
+
+    def arcsin(self) -> "DualArray":
+        """
+        Returns arcsin(x) elementwise, where arcsin(a + bε) = arcsin(a) + (b / sqrt(1 - a ** 2)) * ε
+
+        Raises:
+            ValueError: if any argument to arcsin is not in (-1, 1)
+        """
+        if np.any(np.abs(self.real) >= 1):
+            raise ValueError("The argument to arcsin must be in (-1, 1).")
+        return self._like(np.arcsin(self.real), self.dual / np.sqrt(1 - self.real * self.real))
+
+    def arctan(self) -> "DualArray":
+        """
+        Returns arctan(x) elementwise, where arctan(a + bε) = arctan(a) + (b / (1 + a ** 2)) * ε
+        """
+        return self._like(np.arctan(self.real), self.dual / (1 + self.real * self.real))
+
+    def abs(self) -> "DualArray":
+        """
+        Returns |x| elementwise, where |a + bε| = |a| + b * sign(a) * ε (the tangent at a = 0 is taken to be 0)
+        """
+        return self._like(np.abs(self.real), np.sign(self.real) * self.dual)
+
+    def __abs__(self) -> "DualArray":
+        return self.abs()
+
+    def erf(self) -> "DualArray":
+        """
+        Returns erf(x) elementwise, where erf(a + bε) = erf(a) + b * (2 / sqrt(pi)) * exp(-a ** 2) * ε
+        """
+        tangent = 2 / np.sqrt(np.pi) * np.exp(-self.real * self.real) * self.dual
+        return self._like(_erf(self.real), tangent)
+
+    # NumPy interoperability: route ufuncs such as np.sin(x) to the methods above
+    _UFUNCS = {
+        np.add: "__add__",
+        np.subtract: "__sub__",
+        np.multiply: "__mul__",
+        np.true_divide: "__truediv__",
+        np.power: "__pow__",
+        np.matmul: "__matmul__",
+        np.negative: "__neg__",
+        np.sin: "sin",
+        np.cos: "cos",
+        np.tan: "tan",
+        np.log: "log",
+        np.exp: "exp",
+        np.sqrt: "sqrt",
+        np.tanh: "tanh",
+        np.arcsin: "arcsin",
+        np.arctan: "arctan",
+        np.absolute: "abs",
+    }
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Dispatch supported NumPy ufuncs to the DualArray implementations."""
+        name = self._UFUNCS.get(ufunc)
+        if method != "__call__" or name is None or kwargs:
+            return NotImplemented
+        if len(inputs) == 1:
+            return getattr(self, name)()
+        lhs, rhs = inputs
+        if lhs is self or isinstance(lhs, DualArray):
+            return getattr(lhs, name)(rhs)
+        # DualArray on the right hand side: use the reflected operator
+        return getattr(rhs, name.replace("__", "__r", 1))(lhs)
+
+
+# NumPy's errors for using an array of several numbers as one number, e.g. when func branches on x.real > 0 or
+# calls float(x.real)
+_NUMPY_SCALAR_ERRORS = ("truth value of an array", "converted to Python scalars")
+
+
+def _not_vectorisable(err: Exception) -> bool:
+    """Whether err is the expected failure of a func that only works on single numbers being given a DualArray."""
+    if isinstance(err, NotVectorisableError):
+        return True
+    return isinstance(err, (TypeError, ValueError)) and any(message in str(err) for message in _NUMPY_SCALAR_ERRORS)
+
+
+def _evaluate_points(func: Callable, x: np.ndarray, scalar: type = Dual) -> Tuple[np.ndarray, np.ndarray]:
+    """Evaluate func and its derivative at every point of x.
+
+    All points are seeded at once in a DualArray and func is evaluated a single time. Only if func needs single
+    numbers (it branches on its input, or converts it with float() or math functions) is it evaluated point by point
+    instead; any other error raised by func propagates.
+
+    Args:
+        func (Callable): Function to be differentiated
+        x (np.ndarray): Points, as float64
+        scalar (type, optional): Dual class used for the point by point evaluation. Defaults to Dual.
+
+    Returns:
+        tuple: (values, derivatives) of func at x, both float64 with the shape of x
+    """
+    try:
+        eval_x = func(DualArray(x, 1.0))
+    except (TypeError, ValueError) as err:
+        if not _not_vectorisable(err):
+            raise
+    else:
+        values = np.array(np.broadcast_to(eval_x.real, x.shape), dtype=np.float64)
+        derivs = np.array(np.broadcast_to(eval_x.dual, x.shape), dtype=np.float64)
+        return values, derivs
+    values = np.empty(x.shape)
+    derivs = np.empty(x.shape)
+    for i, xi in enumerate(x.ravel()):
+        eval_x = func(scalar(float(xi), 1.0))
+        values.flat[i], derivs.flat[i] = eval_x.real, eval_x.dual
+    return values, derivs
@@ -0,0 +1,291 @@
+from typing import Callable, Sequence
+import numpy as np
+
+
+class HyperDual:
+    """
+    A class for representing hyper-dual numbers for exact second derivatives
+
+    Each hyper-dual number has the form a + b ε1 + c ε2 + d ε1ε2, where ε1 ** 2 = ε2 ** 2 = 0 but ε1ε2 != 0.
+
+    Seeding x = a + ε1 + ε2 gives f(x) = f(a) + f'(a) ε1 + f'(a) ε2 + f''(a) ε1ε2, so the first and second
+    derivatives are exact (no finite-difference step) and come from a single evaluation.
+
+    Attributes:
+        real: (float): Real part
+        eps1: (float): Coefficient to ε1
+        eps2: (float): Coefficient to ε2
+        eps12: (float): Coefficient to ε1ε2
+    """
+
+    def __init__(
+        self, real: float, eps1: float = 0.0, eps2: float = 0.0, eps12: float = 0.0
+    ):
+        """Input the four components of the hyper-dual number.
+
+        Args:
+            real (float): Real part of the hyper-dual number.
+            eps1 (float, optional): Coefficient to ε1. Defaults to 0.0.
+            eps2 (float, optional): Coefficient to ε2. Defaults to 0.0.
+            eps12 (float, optional): Coefficient to ε1ε2. Defaults to 0.0.
+        """
+        self.real = real
+        self.eps1 = eps1
+        self.eps2 = eps2
+        self.eps12 = eps12
+
+    # Apply a scalar function f with known f(a), f'(a) and f''(a) to the hyper-dual number
+    def _chain(self, f0: float, f1: float, f2: float) -> "HyperDual":
+        """Apply the second order chain rule.
+
+        f(a + b ε1 + c ε2 + d ε1ε2) = f(a) + f'(a) b ε1 + f'(a) c ε2 + (f'(a) d + f''(a) b c) ε1ε2
+
+        Args:
+            f0 (float): f evaluated at the real part
+            f1 (float): f' evaluated at the real part
+            f2 (float): f'' evaluated at the real part
+
+        Returns:
+            HyperDual: Resulting HyperDual number
+        """
+        return HyperDual(
+            f0,
+            f1 * self.eps1,
+            f1 * self.eps2,
+            f1 * self.eps12 + f2 * self.eps1 * self.eps2,
+        )
+
+    # Overloading the arithmetic operators
+    # Addition
+    def __add__(self, other) -> "HyperDual":
+        """Overload + operator to perform addition involving HyperDual numbers
+
+        Args:
+            other (int, float, HyperDual): The right hand side of the + operator
+
+        Returns:
+            HyperDual: Resulting sum of the addition
+        """
+        if not isinstance(other, HyperDual):
+            other = HyperDual(other)
+        return HyperDual(
+            self.real + other.real,
+            self.eps1 + other.eps1,
+            self.eps2 + other.eps2,
+            self.eps12 + other.eps12,
+        )
+
+    def __radd__(self, other) -> "HyperDual":
+        """Overload + operator when the HyperDual number is on the right hand side of the operator."""
+        return self.__add__(other)
+
+    # Subtraction
+    def __sub__(self, other) -> "HyperDual":
+        """Overload - operator to perform subtraction involving HyperDual numbers
+
+        Args:
+            other (int, float, HyperDual): The right hand side of the - operator
+
+        Returns:
+            HyperDual: Resulting difference of the subtraction
+        """
+        if not isinstance(other, HyperDual):
+            other = HyperDual(other)
+        return HyperDual(
+            self.real - other.real,
+            self.eps1 - other.eps1,
+            self.eps2 - other.eps2,
+            self.eps12 - other.eps12,
+        )
+
+    def __rsub__(self, other) -> "HyperDual":
+        """Overload - operator when the HyperDual number is on the right hand side of the operator (other - self)."""
+        if not isinstance(other, HyperDual):
+            other = HyperDual(other)
+        return other.__sub__(self)
+
+    def __neg__(self) -> "HyperDual":
+        return HyperDual(-self.real, -self.eps1, -self.eps2, -self.eps12)
+
+    # Multiplication
+    def __mul__(self, other) -> "HyperDual":
+        """Overload * operator to perform multiplication involving HyperDual numbers
+
+        Args:
+            other (int, float, HyperDual): The right hand side of the * operator
+
+        Returns:
+            HyperDual: Resulting product of the multiplication
+        """
+        if not isinstance(other, HyperDual):
+            other = HyperDual(other)
+        return HyperDual(
+            self.real * other.real,
+            self.real * other.eps1 + self.eps1 * other.real,
+            self.real * other.eps2 + self.eps2 * other.real,
+            self.real * other.eps12
+            + self.eps1 * other.eps2
+            + self.eps2 * other.eps1
+            + self.eps12 * other.real,
+        )
+
+    def __rmul__(self, other) -> "HyperDual":
+        """Overload * operator when the HyperDual number is on the right hand side of the operator."""
+        return self.__mul__(other)
+
+    # Division
+    def __truediv__(self, other) -> "HyperDual":
+        """Overload / operator to perform division involving HyperDual numbers
+
+        Args:
+            other (int, float, HyperDual): The right hand side of the / operator
+
+        Returns:
+            HyperDual: Resulting quotient of the division
+        """
+        if not isinstance(other, HyperDual):
+            other = HyperDual(other)
+        return self.__mul__(other._reciprocal())
+
+    def __rtruediv__(self, other) -> "HyperDual":
+        """Overload / operator when the HyperDual number is on the right hand side of the operator (other / self)."""
+        return self._reciprocal().__mul__(other)
+
+    def _reciprocal(self) -> "HyperDual":
+        """Returns 1 / x, with f'(a) = -1 / a ** 2 and f''(a) = 2 / a ** 3"""
+        a = self.real
+        return self._chain(1 / a, -1 / a**2, 2 / a**3)
+
+    # Power
+    def __pow__(self, other) -> "HyperDual":
+        """Overload ** operator when the HyperDual number is the base.
+
+        Args:
+            other (int, float, HyperDual): Right hand side of ** operator (exponent).
+
+        Raises:
+            ValueError: For when the real part is negative (logarithm of negative number is undefined)
+
+        Returns:
+            HyperDual: Resulting HyperDual number
+        """
+        if isinstance(other, HyperDual):
+            if self.real < 0:
+                raise ValueError(
+                    "The real part of base cannot be negative for exponents (undefined)"
+                )
+            # x ** y = exp(y * ln(x))
+            return (other * self.log()).exp()
+        a, n = self.real, other
+        # Skip the vanishing terms so that e.g. x ** 1 is defined at x = 0
+        f1 = n * a ** (n - 1) if n != 0 else 0.0
+        f2 = n * (n - 1) * a ** (n - 2) if n not in (0, 1) else 0.0
+        return self._chain(a**n, f1, f2)
+
+    def __rpow__(self, other) -> "HyperDual":
+        """Overload ** operator when the HyperDual number is the exponent.
+
+        Args:
+            other (int, float): Left hand side of ** operator (base).
+
+        Raises:
+            ValueError: Prevent base being a non-numerical value.
+
+        Returns:
+            HyperDual: Resulting HyperDual number
+        """
+        if isinstance(other, (int, float)):
+            pow_real = other**self.real
+            log_base = np.log(other)
+            return self._chain(pow_real, pow_real * log_base, pow_real * log_base**2)
+        raise ValueError(
+            f"Unsupported operation between {type(other).__name__} and HyperDual"
+        )
+
+    def __repr__(self) -> str:
+        return f"HyperDual({self.real}, {self.eps1}, {self.eps2}, {self.eps12})"
+
+    # CLASS METHODS FOR HYPER-DUAL NUMBERS
+    @classmethod
+    def second_derivative(cls, func: Callable, x: float) -> float:
+        """Function to be used for computing the exact second derivative of a function of one variable
+
+        Args:
+            func (Callable): Function to be differentiated
+            x (float): Value of x second derivative is to be evaluated at
+
+        Returns:
+            float: Value of second derivative evaluated at x
+        """
+        eval_x = func(cls(x, 1.0, 1.0, 0.0))
+        if not isinstance(eval_x, HyperDual):
+            return 0.0
+        return eval_x.eps12
+
+    @classmethod
+    def hessian(cls, func: Callable, x: Sequence[float]) -> np.ndarray:
+        """Function to be used for computing the exact Hessian of a scalar function of several inputs
+
+        Entry (i, j) is found by seeding ε1 on input i and ε2 on input j; symmetry halves the number of evaluations.
+
+        Args:
+            func (Callable): Function to be differentiated, taking a sequence of inputs and returning a scalar
+            x (Sequence[float]): Point the Hessian is to be evaluated at
+
+        Returns:
+            np.ndarray: Hessian matrix of shape (n, n)
+        """
+        x = np.asarray(x, dtype=np.float64).ravel()
+        n = x.size
+        hess = np.zeros((n, n))
+        for i in range(n):
+            for j in range(i, n):
+                seeded = [
+                    cls(float(x[k]), float(k == i), float(k == j), 0.0) for k in range(n)
+                ]
+                eval_x = func(seeded)
+                if isinstance(eval_x, HyperDual):
+                    hess[i, j] = hess[j, i] = eval_x.eps12
+        return hess
+
+    # IMPLEMENT COMMON FUNCTIONS f(x)
+    def sin(self) -> "HyperDual":
+        """
+        Returns sin(x), with f' = cos and f'' = -sin
+        """
+        sin_a, cos_a = np.sin(self.real), np.cos(self.real)
+        return self._chain(sin_a, cos_a, -sin_a)
+
+    def cos(self) -> "HyperDual":
+        """
+        Returns cos(x), with f' = -sin and f'' = -cos
+        """
+        sin_a, cos_a = np.sin(self.real), np.cos(self.real)
+        return self._chain(cos_a, -sin_a, -cos_a)
+
+    def tan(self) -> "HyperDual":
+        """
+        Returns tan(x), with f' = sec ** 2 and f'' = 2 * sec ** 2 * tan
+        """
+        tan_a = np.tan(self.real)
+        sec2 = (1 / np.cos(self.real)) ** 2
+        return self._chain(tan_a, sec2, 2 * sec2 * tan_a)
+
+    def log(self) -> "HyperDual":
+        """
+        Returns ln(x), with f' = 1 / x and f'' = -1 / x ** 2
+
+        Raises:
+            ValueError: if the argument to ln is not positive
+        """
+        if self.real <= 0:
+            raise ValueError("The argument to ln must be positive.")
+        a = self.real
+        return self._chain(np.log(a), 1 / a, -1 / a**2)
+
+    def exp(self) -> "HyperDual":
+        """
+        Returns exp(x), with f' = f'' = exp
+        """
+        exp_real = np.exp(self.real)
+        return self._chain(exp_real, exp_real, exp_real)
@@ -0,0 +1,329 @@
+from math import factorial
+from typing import Callable
+import numpy as np
+
+
+class Jet:
+    """
+    A class for representing truncated Taylor series (jets) for arbitrary-order derivatives
+
+    A jet of order k holds the normalised Taylor coefficients c_0, ..., c_k of a function about a point, where
+    c_n = f^(n)(a) / n!. Arithmetic and elementary functions are propagated with the standard O(k^2) recurrences,
+    so the first k derivatives cost polynomial rather than exponential work (as nesting Dual k times would).
+
+    Seeding x = [a, 1, 0, ..., 0] and evaluating f gives the Taylor coefficients of f about a.
+
+    Attributes:
+        coeffs: (np.ndarray): Taylor coefficients c_0, ..., c_k
+    """
+
+    def __init__(self, coeffs):
+        """Input the Taylor coefficients of the jet.
+
+        Args:
+            coeffs (array_like): Taylor coefficients c_0, ..., c_k
+        """
+        self.coeffs = np.array(coeffs, dtype=np.float64, ndmin=1)
+
+    @property
+    def order(self) -> int:
+        """Order k of the truncated series."""
+        return self.coeffs.size - 1
+
+    @property
+    def real(self) -> float:
+        """Value of the function (the zeroth coefficient)."""
+        return self.coeffs[0]
+
+    def derivatives(self) -> np.ndarray:
+        """Convert the Taylor coefficients into derivatives.
+
+        Returns:
+            np.ndarray: f(a), f'(a), ..., f^(k)(a)
+        """
+        return self.coeffs * np.array([factorial(n) for n in range(self.coeffs.size)])
+
+    # Convert a plain number into a constant jet of the same order
+    def _coerce(self, other) -> "Jet":
+        """Make sure the other operand is a Jet of the same order.
+
+        Args:
+            other (int, float, Jet): Operand to convert
+
+        Raises:
+            ValueError: If the jets have different orders
+
+        Returns:
+            Jet: Jet representation of the operand
+        """
+        if isinstance(other, Jet):
+            if other.order != self.order:
+                raise ValueError("Jets must have the same order.")
+            return other
+        coeffs = np.zeros_like(self.coeffs)
+        coeffs[0] = other
+        return Jet(coeffs)
+
+    # Overloading the arithmetic operators
+    # Addition
+    def __add__(self, other) -> "Jet":
+        """Overload + operator to perform addition involving Jets
+
+        Args:
+            other (int, float, Jet): The right hand side of the + operator
+
+        Returns:
+            Jet: Resulting sum of the addition
+        """
+        return Jet(self.coeffs + self._coerce(other).coeffs)
+
+    def __radd__(self, other) -> "Jet":
+        """Overload + operator when the Jet is on the right hand side of the operator."""
+        return self.__add__(other)
+
+    # Subtraction
+    def __sub__(self, other) -> "Jet":
+        """Overload - operator to perform subtraction involving Jets
+
+        Args:
+            other (int, float, Jet): The right hand side of the - operator
+
+        Returns:
+            Jet: Resulting difference of the subtraction
+        """
+        return Jet(self.coeffs - self._coerce(other).coeffs)
+
+    def __rsub__(self, other) -> "Jet":
+        """Overload - operator when the Jet is on the right hand side of the operator (other - self)."""
+        return Jet(self._coerce(other).coeffs - self.coeffs)
+
+    def __neg__(self) -> "Jet":
+        return Jet(-self.coeffs)
+
+    # Multiplication
+    def __mul__(self, other) -> "Jet":
+        """Overload * operator to perform multiplication involving Jets
+
+        The product is the Cauchy product truncated at order k: c_n = sum_{i=0}^{n} a_i * b_{n-i}
+
+        Args:
+            other (int, float, Jet): The right hand side of the * operator
+
+        Returns:
+            Jet: Resulting product of the multiplication
+        """
+        if not isinstance(other, Jet):
+            # Scaling by a constant does not need the full convolution
+            return Jet(self.coeffs * other)
+        b = self._coerce(other).coeffs
+        return Jet(np.convolve(self.coeffs, b)[: self.coeffs.size])
+
+    def __rmul__(self, other) -> "Jet":
+        """Overload * operator when the Jet is on the right hand side of the operator."""
+        return self.__mul__(other)
+
+    # Division
+    def __truediv__(self, other) -> "Jet":
+        """Overload / operator to perform division involving Jets
+
+        q_n = (a_n - sum_{i=1}^{n} b_i * q_{n-i}) / b_0
+
+        Args:
+            other (int, float, Jet): The right hand side of the / operator
+
+        Returns:
+            Jet: Resulting quotient of the division
+        """
+        if not isinstance(other, Jet):
+            return Jet(self.coeffs / other)
+        a, b = self.coeffs, self._coerce(other).coeffs
+        q = np.zeros_like(a)
+        for n in range(a.size):
+            i = np.arange(1, n + 1)
+            q[n] = (a[n] - np.sum(b[i] * q[n - i])) / b[0]
+        return Jet(q)
+
+    def __rtruediv__(self, other) -> "Jet":
+        """Overload / operator when the Jet is on the right hand side of the operator (other / self)."""
+        return self._coerce(other).__truediv__(self)
+
+    # Power
+    def __pow__(self, other) -> "Jet":
+        """Overload ** operator when the Jet is the base.
+
+        For a constant exponent p: y_n = sum_{i=1}^{n} ((p + 1) * i - n) * a_i * y_{n-i} / (n * a_0)
+
+        Args:
+            other (int, float, Jet): Right hand side of ** operator (exponent).
+
+        Raises:
+            ValueError: For when the real part is negative with a Jet exponent (logarithm of negative number is undefined)
+
+        Returns:
+            Jet: Resulting Jet
+        """
+        if isinstance(other, Jet):
+            if self.real < 0:
+                raise ValueError(
+                    "The real part of base cannot be negative for exponents (undefined)"
+                )
+            # x ** y = exp(y * ln(x))
+            return (self._coerce(other) * self.log()).exp()
+        a, p = self.coeffs, other
+        if a[0] == 0:
+            if float(p).is_integer() and p >= 0:
+                # The recurrence divides by a_0, so use repeated multiplication instead
+                result = self._coerce(1.0)
+                for _ in range(int(p)):
+                    result = result * self
+                return result
+            raise ValueError("Non-integer powers of a jet need a non-zero real part.")
+        y = np.zeros_like(a)
+        y[0] = a[0] ** p
+        for n in range(1, a.size):
+            i = np.arange(1, n + 1)
+            y[n] = np.sum(((p + 1) * i - n) * a[i] * y[n - i]) / (n * a[0])
+        return Jet(y)
+
+    def __rpow__(self, other) -> "Jet":
+        """Overload ** operator when the Jet is the exponent.
+
+        Args:
+            other (int, float): Left hand side of ** operator (base).
+
+        Raises:
+            ValueError: Prevent base being a non-numerical value.
+
+        Returns:
+            Jet: Resulting Jet
+        """
+        if isinstance(other, (int, float)):
+            # b ** x = exp(x * ln(b))
+            return (self * np.log(other)).exp()
+        raise ValueError(
+            f"Unsupported operation between {type(other).__name__} and Jet"
+        )
+
+    def __repr__(self) -> str:
+        return f"Jet({self.coeffs.tolist()})"
+
+    # CLASS METHODS FOR JETS
+    @classmethod
+    def taylor(cls, func: Callable, x: float, order: int) -> np.ndarray:
+        """Function to be used for computing the first k derivatives of a function of one variable
+
+        Args:
+            func (Callable): Function to be differentiated
+            x (float): Value of x derivatives are to be evaluated at
+            order (int): Highest derivative k to compute
+
+        Returns:
+            np.ndarray: f(x), f'(x), ..., f^(k)(x)
+        """
+        coeffs = np.zeros(order + 1)
+        coeffs[0] = x
+        if order > 0:
+            coeffs[1] = 1.0
+        eval_x = func(cls(coeffs))
+        if not isinstance(eval_x, Jet):
+            # Constant function: only the value is non-zero
+            derivs = np.zeros(order + 1)
+            derivs[0] = eval_x
+            return derivs
+        return eval_x.derivatives()
+
+    # IMPLEMENT COMMON FUNCTIONS f(x) WITH TAYLOR RECURRENCES
+    def _sin_cos(self) -> tuple:
+        """Compute the Taylor coefficients of sin(x) and cos(x) together.
+
+        s_n = (1 / n) * sum_{i=1}^{n} i * x_i * c_{n-i}
+        c_n = -(1 / n) * sum_{i=1}^{n} i * x_i * s_{n-i}
+
+        Returns:
+            tuple: (sin coefficients, cos coefficients)
+        """
+        x = self.coeffs
+        s, c = np.zeros_like(x), np.zeros_like(x)
+        s[0], c[0] = np.sin(x[0]), np.cos(x[0])
+        for n in range(1, x.size):
+            i = np.arange(1, n + 1)
+            s[n] = np.sum(i * x[i] * c[n - i]) / n
+            c[n] = -np.sum(i * x[i] * s[n - i]) / n
+        return s, c
+
+    def sin(self) -> "Jet":
+        """
+        Returns sin(x), where x is a Jet.
+
+        Returns:
+            Jet: returns the Jet representation of sin(x)
+        """
+        return Jet(self._sin_cos()[0])
+
+    def cos(self) -> "Jet":
+        """
+        Returns cos(x), where x is a Jet.
+
+        Returns:
+            Jet: returns the Jet representation of cos(x)
+        """
+        return Jet(self._sin_cos()[1])
+
+    def tan(self) -> "Jet":
+        """
+        Returns tan(x), where x is a Jet.
+
+        Uses t' = (1 + t ** 2) * x', so t_n = (1 / n) * sum_{i=1}^{n} i * x_i * u_{n-i} with u = 1 + t ** 2
+
+        Returns:
+            Jet: returns the Jet representation of tan(x)
+        """
+        x = self.coeffs
+        t, u = np.zeros_like(x), np.zeros_like(x)
+        t[0] = np.tan(x[0])
+        u[0] = 1 + t[0] ** 2
+        for n in range(1, x.size):
+            i = np.arange(1, n + 1)
+            t[n] = np.sum(i * x[i] * u[n - i]) / n
+            # u_n = sum_{j=0}^{n} t_j * t_{n-j}
+            u[n] = np.dot(t[: n + 1], t[n::-1])
+        return Jet(t)
+
+    def log(self) -> "Jet":
+        """
+        Returns ln(x), where x is a Jet.
+
+        l_n = (x_n - (1 / n) * sum_{i=1}^{n-1} i * l_i * x_{n-i}) / x_0
+
+        Raises:
+            ValueError: if the argument to ln is not positive
+
+        Returns:
+            Jet: returns the Jet representation of ln(x)
+        """
+        if self.real <= 0:
+            raise ValueError("The argument to ln must be positive.")
+        x = self.coeffs
+        l = np.zeros_like(x)
+        l[0] = np.log(x[0])
+        for n in range(1, x.size):
+            i = np.arange(1, n)
+            l[n] = (x[n] - np.sum(i * l[i] * x[n - i]) / n) / x[0]
+        return Jet(l)
+
+    def exp(self) -> "Jet":
+        """
+        Returns exp(x), where x is a Jet.
+
+        e_n = (1 / n) * sum_{i=1}^{n} i * x_i * e_{n-i}
+
+        Returns:
+            Jet: returns the Jet representation of exp(x)
+        """
+        x = self.coeffs
+        e = np.zeros_like(x)
+        e[0] = np.exp(x[0])
+        for n in range(1, x.size):
+            i = np.arange(1, n + 1)
+            e[n] = np.sum(i * x[i] * e[n - i]) / n
+        return Jet(e)
@@ -0,0 +1,448 @@
+from typing import Callable
+
+import numpy as np
+
+from .dual import _erf
+from .dual_array import DualArray
+
+
+# Number of elements per block: the working set of a block (two parts per node) stays in cache
+BLOCK_SIZE = 4096
+
+
+class LazyDualArray:
+    """
+    A class for building expressions on arrays of dual numbers that are evaluated later in one fused pass
+
+    Operators and elementary functions applied to a LazyDualArray do no arithmetic; they record a node of an
+    expression tree. ``evaluate`` then walks the inputs in cache-sized blocks and runs the whole expression on each
+    block, computing the real and dual parts together, so no full-size intermediate array is ever created.
+
+    Attributes:
+        op: (str): Operation of this node ("input" for the arrays the expression is evaluated on)
+        args: (tuple): Operands, either LazyDualArray nodes or constants (floats)
+        real, dual: (np.ndarray): The input arrays (input nodes only)
+    """
+
+    # Make NumPy defer to the reflected operators of LazyDualArray (e.g. ndarray * LazyDualArray)
+    __array_priority__ = 1000
+
+    def __init__(self, op: str, args: tuple = (), real=None, dual=None):
+        """Input the operation and operands of the node.
+
+        Args:
+            op (str): Operation of this node
+            args (tuple, optional): Operands of the node. Defaults to ().
+            real (np.ndarray, optional): Real parts, for input nodes
+            dual (np.ndarray, optional): Dual parts, for input nodes
+        """
+        self.op = op
+        self.args = args
+        self.real = real
+        self.dual = dual
+
+    @classmethod
+    def input(cls, x, dual=None) -> "LazyDualArray":
+        """Create an input node of an expression.
+
+        A float32 array keeps its precision (both parts are stored as float32); other values are stored as float64.
+
+        Args:
+            x (array_like, DualArray): Values (or dual numbers) the expression is evaluated on
+            dual (array_like, optional): Dual parts when x is not a DualArray. Defaults to zeros.
+
+        Returns:
+            LazyDualArray: Input node
+        """
+        if not isinstance(x, DualArray):
+            dtype = np.float32 if getattr(x, "dtype", None) == np.float32 else np.float64
+            x = DualArray(x, dual, dtype=dtype)
+        return cls("input", real=x.real, dual=x.dual)
+
+    # Operands are other nodes, constants captured as floats, or arrays that become input nodes without a dual part
+    def _operand(self, other):
+        if isinstance(other, LazyDualArray):
+            return other
+        if isinstance(other, (int, float)):
+            return float(other)
+        if isinstance(other, DualArray):
+            return LazyDualArray.input(other)
+        if np.ndim(other) == 0:
+            return float(other)
+        return LazyDualArray.input(other)
+
+    def _node(self, op: str, *args) -> "LazyDualArray":
+        return LazyDualArray(op, args)
+
+    # Overloading the arithmetic operators (recorded, not evaluated)
+    def __add__(self, other) -> "LazyDualArray":
+        return self._node("add", self, self._operand(other))
+
+    def __radd__(self, other) -> "LazyDualArray":
+        return self._node("add", self._operand(other), self)
+
+    def __sub__(self, other) -> "LazyDualArray":
+        return self._node("sub", self, self._operand(other))
+
+    def __rsub__(self, other) -> "LazyDualArray":
+        return self._node("sub", self._operand(other), self)
+
+    def __neg__(self) -> "LazyDualArray":
+        return self._node("neg", self)
+
+    def __mul__(self, other) -> "LazyDualArray":
+        return self._node("mul", self, self._operand(other))
+
+    def __rmul__(self, other) -> "LazyDualArray":
+        return self._node("mul", self._operand(other), self)
+
+    def __truediv__(self, other) -> "LazyDualArray":
+        return self._node("div", self, self._operand(other))
+
+    def __rtruediv__(self, other) -> "LazyDualArray":
+        return self._node("div", self._operand(other), self)
+
+    def __pow__(self, other) -> "LazyDualArray":
+        return self._node("pow", self, self._operand(other))
+
+    def __rpow__(self, other) -> "LazyDualArray":
+        return self._node("pow", self._operand(other), self)
+
+    def sin(self) -> "LazyDualArray":
+        return self._node("sin", self)
+
+    def cos(self) -> "LazyDualArray":
+        return self._node("cos", self)
+
+    def tan(self) -> "LazyDualArray":
+        return self._node("tan", self)
+
+    def log(self) -> "LazyDualArray":
+        return self._node("log", self)
+
+    def exp(self) -> "LazyDualArray":
+        return self._node("exp", self)
+
+    def sqrt(self) -> "LazyDualArray":
+        return self._node("sqrt", self)
+
+    def tanh(self) -> "LazyDualArray":
+        return self._node("tanh", self)
+
+    def sigmoid(self) -> "LazyDualArray":
+        return self._node("sigmoid", self)
+
+    def arcsin(self) -> "LazyDualArray":
+        return self._node("arcsin", self)
+
+    def arctan(self) -> "LazyDualArray":
+        return self._node("arctan", self)
+
+    def abs(self) -> "LazyDualArray":
+        return self._node("abs", self)
+
+    def __abs__(self) -> "LazyDualArray":
+        return self.abs()
+
+    def erf(self) -> "LazyDualArray":
+        return self._node("erf", self)
+
+    def __repr__(self) -> str:
+        return f"LazyDualArray({self.op!r}, {len(self.args)} operands)"
+
+    # NumPy interoperability: record ufuncs such as np.sin(x) as nodes
+    _UFUNCS = {
+        np.add: "__add__",
+        np.subtract: "__sub__",
+        np.multiply: "__mul__",
+        np.true_divide: "__truediv__",
+        np.power: "__pow__",
+        np.negative: "__neg__",
+        np.sin: "sin",
+        np.cos: "cos",
+        np.tan: "tan",
+        np.log: "log",
+        np.exp: "exp",
+        np.sqrt: "sqrt",
+        np.tanh: "tanh",
+        np.arcsin: "arcsin",
+        np.arctan: "arctan",
+        np.absolute: "abs",
+    }
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Record supported NumPy ufuncs as expression nodes."""
+        name = self._UFUNCS.get(ufunc)
+        if method != "__call__" or name is None or kwargs:
+            return NotImplemented
+        if len(inputs) == 1:
+            return getattr(self, name)()
+        lhs, rhs = inputs
+        if isinstance(lhs, LazyDualArray):
+            return getattr(lhs, name)(rhs)
+        # LazyDualArray on the right hand side: use the reflected operator
+        return getattr(rhs, name.replace("__", "__r", 1))(lhs)
+
+    def evaluate(self, block_size: int = BLOCK_SIZE) -> DualArray:
+        """Evaluate the expression in one fused, blocked pass over its inputs.
+
+        Args:
+            block_size (int, optional): Number of elements per block. Defaults to BLOCK_SIZE.
+
+        Raises:
+            ValueError: If block_size is not positive, the input arrays differ in shape, or the expression is
+                undefined at some point (same checks as Dual)
+
+        Returns:
+            DualArray: Result of the expression
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be a positive integer.")
+        return _Program(self).run(block_size)
+
+
+class _Program:
+    """A LazyDualArray expression flattened into a list of instructions over block-sized registers."""
+
+    def __init__(self, output: LazyDualArray):
+        self.nodes = []
+        slots = {}
+        # Iterative post-order walk, so shared subexpressions get one slot and deep expressions do not recurse
+        stack = [(output, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in slots:
+                continue
+            if expanded:
+                slots[id(node)] = len(self.nodes)
+                self.nodes.append(node)
+                continue
+            stack.append((node, True))
+            for arg in reversed(node.args):
+                if isinstance(arg, LazyDualArray) and id(arg) not in slots:
+                    stack.append((arg, False))
+        # Operands as register indices, or constants
+        self.code = [
+            (node.op, [slots[id(a)] if isinstance(a, LazyDualArray) else a for a in node.args])
+            for node in self.nodes
+        ]
+        inputs = [node for node in self.nodes if node.op == "input"]
+        shapes = {node.real.shape for node in inputs}
+        if len(shapes) != 1:
+            raise ValueError("All array operands of a lazy expression must have the same shape.")
+        self.shape = shapes.pop()
+        self.real_dtype = np.result_type(*[node.real for node in inputs])
+        self.dual_dtype = np.result_type(*[node.dual for node in inputs])
+
+    def run(self, block_size: int) -> DualArray:
+        size = int(np.prod(self.shape))
+        n = len(self.nodes)
+        block_size = max(1, min(block_size, size))
+        # Scratch registers, allocated once and reused for every block
+        real_regs = np.empty((n, block_size), dtype=self.real_dtype)
+        dual_regs = np.empty((n, block_size), dtype=self.dual_dtype)
+        tmp = np.empty(block_size, dtype=self.dual_dtype)
+        out_real = np.empty(size, dtype=self.real_dtype)
+        out_dual = np.empty(size, dtype=self.dual_dtype)
+        for start in range(0, size, block_size):
+            stop = min(start + block_size, size)
+            m = stop - start
+            R = [None] * n
+            D = [None] * n
+            for k, (op, args) in enumerate(self.code):
+                if op == "input":
+                    # Inputs are read in place
+                    node = self.nodes[k]
+                    R[k] = node.real.reshape(-1)[start:stop]
+                    D[k] = node.dual.reshape(-1)[start:stop]
+                    continue
+                R[k], D[k] = real_regs[k, :m], dual_regs[k, :m]
+                _execute(op, args, R, D, k, tmp[:m])
+            out_real[start:stop] = R[-1]
+            out_dual[start:stop] = D[-1]
+        return DualArray(
+            out_real.reshape(self.shape), out_dual.reshape(self.shape),
+            dtype=self.real_dtype, dual_dtype=self.dual_dtype,
+        )
+
+
+def _execute(op: str, args: list, R: list, D: list, k: int, tmp: np.ndarray) -> None:
+    """Run one instruction on a block, writing node k's parts into R[k], D[k] (the outputs never alias the inputs).
+
+    Args:
+        op (str): Operation
+        args (list): Register indices (int) or constants (float)
+        R, D (list): Real and dual registers of the block
+        k (int): Output register
+        tmp (np.ndarray): Scratch buffer
+    """
+    ro, do = R[k], D[k]
+    a = args[0]
+    ra, da = (R[a], D[a]) if isinstance(a, int) else (a, None)
+    if len(args) == 2:
+        b = args[1]
+        rb, db = (R[b], D[b]) if isinstance(b, int) else (b, None)
+    if op == "add":
+        np.add(ra, rb, out=ro)
+        if da is None or db is None:
+            D[k] = da if db is None else db
+        else:
+            np.add(da, db, out=do)
+    elif op == "sub":
+        np.subtract(ra, rb, out=ro)
+        if db is None:
+            D[k] = da
+        elif da is None:
+            np.negative(db, out=do)
+        else:
+            np.subtract(da, db, out=do)
+    elif op == "mul":
+        np.multiply(ra, rb, out=ro)
+        if db is None:
+            np.multiply(da, rb, out=do)
+        elif da is None:
+            np.multiply(ra, db, out=do)
+        else:
+            np.multiply(ra, db, out=do)
+            np.multiply(da, rb, out=tmp)
+            np.add(do, tmp, out=do)
+    elif op == "div":
+        np.divide(ra, rb, out=ro)
+        if db is None:
+            np.divide(da, rb, out=do)
+        else:
+            # (da * rb - ra * db) / rb ** 2 = (da - ro * db) / rb
+            np.multiply(ro, db, out=do)
+            if da is None:
+                np.negative(do, out=do)
+            else:
+                np.subtract(da, do, out=do)
+            np.divide(do, rb, out=do)
+    elif op == "pow":
+        if db is None:
+            # (a + bε) ** n
+            np.power(ra, rb, out=ro)
+            np.power(ra, rb - 1, out=do)
+            np.multiply(do, da, out=do)
+            np.multiply(do, rb, out=do)
+        elif da is None:
+            # c ** (a + bε)
+            np.power(ra, rb, out=ro)
+            np.multiply(ro, db, out=do)
+            np.multiply(do, np.log(ra), out=do)
+        else:
+            if np.any(ra < 0):
+                raise ValueError("The real part of base cannot be negative for exponents (undefined)")
+            np.power(ra, rb, out=ro)
+            # Guard log(0) where the exponent has no dual part (0 * -inf would give nan)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_term = np.where(db == 0, 0.0, ra * db * np.log(ra))
+            np.multiply(da, rb, out=do)
+            np.add(do, log_term, out=do)
+            np.multiply(do, ra ** (rb - 1), out=do)
+    elif op == "neg":
+        np.negative(ra, out=ro)
+        np.negative(da, out=do)
+    elif op == "sin":
+        np.sin(ra, out=ro)
+        np.cos(ra, out=do)
+        np.multiply(do, da, out=do)
+    elif op == "cos":
+        np.cos(ra, out=ro)
+        np.sin(ra, out=do)
+        np.multiply(do, da, out=do)
+        np.negative(do, out=do)
+    elif op == "tan":
+        np.tan(ra, out=ro)
+        np.cos(ra, out=do)
+        np.multiply(do, do, out=do)
+        np.divide(da, do, out=do)
+    elif op == "log":
+        if np.any(ra <= 0):
+            raise ValueError("The argument to ln must be positive.")
+        np.log(ra, out=ro)
+        np.divide(da, ra, out=do)
+    elif op == "exp":
+        np.exp(ra, out=ro)
+        np.multiply(ro, da, out=do)
+    elif op == "sqrt":
+        if np.any(ra <= 0):
+            raise ValueError("The argument to sqrt must be positive.")
+        np.sqrt(ra, out=ro)
+        np.multiply(ro, 2, out=do)
+        np.divide(da, do, out=do)
+    elif op == "tanh":
+        np.tanh(ra, out=ro)
+        np.multiply(ro, ro, out=do)
+        np.subtract(1, do, out=do)
+        np.multiply(do, da, out=do)
+    elif op == "sigmoid":
+        # sigmoid(a) = (1 + tanh(a / 2)) / 2, which does not overflow for large |a|
+        np.multiply(ra, 0.5, out=ro)
+        np.tanh(ro, out=ro)
+        np.add(ro, 1, out=ro)
+        np.multiply(ro, 0.5, out=ro)
+        np.subtract(1, ro, out=do)
+        np.multiply(do, ro, out=do)
+        np.multiply(do, da, out=do)
+    elif op == "arcsin":
+        if np.any(np.abs(ra) >= 1):
+            raise ValueError("The argument to arcsin must be in (-1, 1).")
+        np.arcsin(ra, out=ro)
+        np.multiply(ra, ra, out=do)
+        np.subtract(1, do, out=do)
+        np.sqrt(do, out=do)
+        np.divide(da, do, out=do)
+    elif op == "arctan":
+        np.arctan(ra, out=ro)
+        np.multiply(ra, ra, out=do)
+        np.add(do, 1, out=do)
+        np.divide(da, do, out=do)
+    elif op == "abs":
+        # The tangent at 0 is taken to be 0, as for DualArray
+        np.abs(ra, out=ro)
+        np.sign(ra, out=do)
+        np.multiply(do, da, out=do)
+    elif op == "erf":
+        ro[...] = _erf(ra)
+        np.multiply(ra, ra, out=do)
+        np.negative(do, out=do)
+        np.exp(do, out=do)
+        np.multiply(do, 2 / np.sqrt(np.pi), out=do)
+        np.multiply(do, da, out=do)
+    else:
+        raise ValueError(f"Unknown operation: {op}")
+
+
+def lazy_evaluate(func: Callable, x, dual=1.0, block_size: int = BLOCK_SIZE) -> DualArray:
+    """Function to be used for evaluating func on an array of dual numbers in one fused, cache-blocked pass
+
+    func is run once on a LazyDualArray to record its expression, which is then evaluated block by block, so peak
+    memory is the output plus one block per node instead of one full-size temporary per operation. With the
+    default dual of 1.0 the dual part of the result is the derivative of func at every point of x. A float32 x is
+    evaluated in float32, like DualArray(x, dtype=np.float32).
+
+    Unlike the eager DualArray operators, a lazy expression does not broadcast: every array operand (x, and any
+    array func combines it with) must have the shape of x. Scalars are fine; broadcast other arrays to x.shape first.
+
+    Args:
+        func (Callable): Function built from the Dual operators and elementary functions (or the matching NumPy
+            ufuncs)
+        x (array_like, DualArray): Points func is evaluated at
+        dual (array_like, optional): Dual parts (seed) when x is not a DualArray. Defaults to 1.0.
+        block_size (int, optional): Number of elements per block. Defaults to BLOCK_SIZE.
+
+    Raises:
+        ValueError: If an array operand does not have the shape of x, block_size is not positive, or the expression
+            is undefined at some point (same checks as Dual)
+
+    Returns:
+        DualArray: func evaluated at x
+    """
+    x = LazyDualArray.input(x, None if isinstance(x, DualArray) else dual)
+    result = func(x)
+    if not isinstance(result, LazyDualArray):
+        # func does not depend on x
+        real = np.broadcast_to(np.asarray(result, dtype=x.real.dtype), x.real.shape)
+        return DualArray(real, dtype=x.real.dtype, dual_dtype=x.dual.dtype)
+    return result.evaluate(block_size)
@@ -0,0 +1,151 @@
+from typing import Optional, Tuple, Union
+import warnings
+
+import numpy as np
+
+from .dual import Dual
+from .dual_array import DualArray
+
+
+def _parts(x) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Split an operand into its real and tangent (dual) parts.
+
+    Args:
+        x (DualArray, array_like): Operand; arrays of Dual objects are unpacked (plain numbers among them have a zero
+            tangent), other arrays have no tangent
+
+    Returns:
+        tuple: (real, dual), where dual is None when the operand has no tangent, so its products can be skipped
+    """
+    if isinstance(x, DualArray):
+        return x.real, x.dual
+    x = np.asarray(x)
+    if x.dtype == object:
+        flat = x.ravel()
+        if any(isinstance(v, Dual) for v in flat):
+            array = DualArray.from_duals(v if isinstance(v, Dual) else Dual(float(v), 0.0) for v in flat)
+            return array.real.reshape(x.shape), array.dual.reshape(x.shape)
+    return np.asarray(x, dtype=np.float64), None
+
+
+def _result(real, dual, a, b) -> Union[Dual, DualArray]:
+    """Build a result with the storage types of the DualArray operands (as DualArray._like), float64 otherwise.
+
+    Args:
+        real (np.ndarray): Real parts of the result
+        dual (np.ndarray, optional): Dual parts of the result, None for no tangent
+        a, b: The operands
+
+    Returns:
+        Dual, DualArray: A Dual for a 0-d result (as for a single element of a DualArray), a DualArray otherwise
+    """
+    if np.ndim(real) == 0:
+        return Dual(float(real), 0.0 if dual is None else float(dual))
+    arrays = [x for x in (a, b) if isinstance(x, DualArray)]
+    dtype = np.result_type(*[x.real.dtype for x in arrays]) if arrays else np.float64
+    dual_dtype = np.result_type(*[x.dual.dtype for x in arrays]) if arrays else np.float64
+    return DualArray(real, dual, dtype=dtype, dual_dtype=dual_dtype)
+
+
+def _product(product, a, b) -> Union[Dual, DualArray]:
+    """Apply a bilinear product to dual operands: (A + A'ε)(B + B'ε) = AB + (A'B + AB')ε.
+
+    Args:
+        product (Callable): np.dot or np.matmul
+        a, b (DualArray, array_like): Operands
+
+    Returns:
+        Dual, DualArray: Product, with two extra real products for the tangent (one if only one operand has a
+            tangent); a Dual when the product is a single number
+    """
+    ar, ad = _parts(a)
+    br, bd = _parts(b)
+    real = product(ar, br)
+    if ad is None and bd is None:
+        return _result(real, None, a, b)
+    if ad is None:
+        dual = product(ar, bd)
+    elif bd is None:
+        dual = product(ad, br)
+    else:
+        dual = product(ad, br) + product(ar, bd)
+    return _result(real, dual, a, b)
+
+
+def dot(a, b) -> Union[Dual, DualArray]:
+    """Dot product of dual arrays (as np.dot), with the real and tangent parts computed by BLAS.
+
+    Args:
+        a (DualArray, array_like): Left operand
+        b (DualArray, array_like): Right operand
+
+    Returns:
+        Dual, DualArray: np.dot of the operands, with tangent A'B + AB' (a Dual for two vectors)
+    """
+    return _product(np.dot, a, b)
+
+
+def matmul(a, b) -> Union[Dual, DualArray]:
+    """Matrix product of dual arrays (as np.matmul and the @ operator), with the parts computed by BLAS.
+
+    Args:
+        a (DualArray, array_like): Left operand
+        b (DualArray, array_like): Right operand
+
+    Returns:
+        Dual, DualArray: a @ b, with tangent A'B + AB' (a Dual for two vectors)
+    """
+    return _product(np.matmul, a, b)
+
+
+def solve(a, b) -> DualArray:
+    """Solve the dual linear system (A + A'ε) x = b + b'ε.
+
+    Differentiating A x = b gives A x' = b' - A' x, so the tangent needs another solve with the same matrix. A is
+    LU-factorised once and the factors are reused for both solves (with scipy; without scipy a second
+    factorisation is done). When A has no tangent, x and x' come from a single solve with both right hand sides.
+
+    Args:
+        a (DualArray, array_like): Square matrix of shape (n, n)
+        b (DualArray, array_like): Right hand side of shape (n,) or (n, k)
+
+    Raises:
+        np.linalg.LinAlgError: If A is singular (or not square)
+
+    Returns:
+        DualArray: Solution x with the shape of b, stored with the precision of the DualArray operands
+    """
+    ar, ad = _parts(a)
+    br, bd = _parts(b)
+    if ar.ndim != 2 or ar.shape[0] != ar.shape[1]:
+        raise np.linalg.LinAlgError("solve requires a square matrix.")
+    n = ar.shape[0]
+    b2 = br.reshape(n, -1)
+    k = b2.shape[1]
+    if ad is None:
+        if bd is None:
+            return _result(np.linalg.solve(ar, b2).reshape(br.shape), None, a, b)
+        # Both right hand sides share one factorisation
+        both = np.linalg.solve(ar, np.hstack([b2, bd.reshape(n, -1)]))
+        return _result(both[:, :k].reshape(br.shape), both[:, k:].reshape(br.shape), a, b)
+
+    try:
+        from scipy.linalg import lu_factor, lu_solve
+    except ImportError:
+        factors = None
+    else:
+        with warnings.catch_warnings():
+            # Singular matrices are reported below as LinAlgError, as np.linalg.solve does
+            warnings.simplefilter("ignore")
+            factors = lu_factor(ar)
+        if np.any(np.diag(factors[0]) == 0):
+            raise np.linalg.LinAlgError("Singular matrix")
+
+    def solve_with_a(rhs):
+        return np.linalg.solve(ar, rhs) if factors is None else lu_solve(factors, rhs)
+
+    x = solve_with_a(b2)
+    rhs = -(ad @ x)
+    if bd is not None:
+        rhs += bd.reshape(n, -1)
+    return _result(x.reshape(br.shape), solve_with_a(rhs).reshape(br.shape), a, b)
@@ -0,0 +1,306 @@
+from typing import Callable, Sequence
+import numpy as np
+
+
+class MultiDual:
+    """
+    A class for representing multi-component dual numbers for computing full gradients in one pass
+
+    Each multi-dual number has the form a + b_1 ε_1 + ... + b_n ε_n, where a is the real part and b is a vector of
+    coefficients (the tangent), with ε_i * ε_j = 0 for every i, j.
+
+    Seeding input i with the unit vector e_i propagates all n partial derivatives through a single evaluation.
+
+    Attributes:
+        real: (float): Real part
+        dual: (np.ndarray): Tangent vector, stored as a contiguous float64 array
+    """
+
+    def __init__(self, real: float, dual):
+        """Input the real part and tangent vector of the multi-dual number.
+
+        Args:
+            real (float): Real part of the multi-dual number.
+            dual (array_like): Tangent vector of the multi-dual number.
+        """
+        self.real = real
+        self.dual = np.asarray(dual, dtype=np.float64)
+
+    # Split the other operand into its real part and tangent
+    def _parts(self, other):
+        """Split an operand into its real part and tangent.
+
+        Args:
+            other (int, float, MultiDual): Operand to split
+
+        Returns:
+            tuple: (real, tangent) parts of the operand, or None if the operand is not supported
+        """
+        if isinstance(other, MultiDual):
+            return other.real, other.dual
+        if isinstance(other, (int, float, np.number)):
+            # Plain numbers have a zero tangent
+            return other, 0.0
+        return None
+
+    # Overloading the arithmetic operators
+    # Addition
+    def __add__(self, other) -> "MultiDual":
+        """Overload + operator to perform addition involving MultiDual numbers
+
+        Args:
+            other (int, float, MultiDual): The right hand side of the + operator
+
+        Returns:
+            MultiDual: Resulting sum of the addition
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        c, d = parts
+        return MultiDual(self.real + c, self.dual + d)
+
+    def __radd__(self, other) -> "MultiDual":
+        """Overload + operator when the MultiDual number is on the right hand side of the operator."""
+        return self.__add__(other)
+
+    # Subtraction
+    def __sub__(self, other) -> "MultiDual":
+        """Overload - operator to perform subtraction involving MultiDual numbers
+
+        Args:
+            other (int, float, MultiDual): The right hand side of the - operator
+
+        Returns:
+            MultiDual: Resulting difference of the subtraction
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        c, d = parts
+        return MultiDual(self.real - c, self.dual - d)
+
+    def __rsub__(self, other) -> "MultiDual":
+        """Overload - operator when the MultiDual number is on the right hand side of the operator (other - self)."""
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        c, d = parts
+        return MultiDual(c - self.real, d - self.dual)
+
+    def __neg__(self) -> "MultiDual":
+        return MultiDual(-self.real, -self.dual)
+
+    # Multiplication
+    def __mul__(self, other) -> "MultiDual":
+        """Overload * operator to perform multiplication involving MultiDual numbers
+
+        Args:
+            other (int, float, MultiDual): The right hand side of the * operator
+
+        Returns:
+            MultiDual: Resulting product of the multiplication
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        c, d = parts
+        return MultiDual(self.real * c, self.real * d + self.dual * c)
+
+    def __rmul__(self, other) -> "MultiDual":
+        """Overload * operator when the MultiDual number is on the right hand side of the operator."""
+        return self.__mul__(other)
+
+    # Division
+    def __truediv__(self, other) -> "MultiDual":
+        """Overload / operator to perform division involving MultiDual numbers
+
+        Args:
+            other (int, float, MultiDual): The right hand side of the / operator
+
+        Returns:
+            MultiDual: Resulting quotient of the division
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        c, d = parts
+        return MultiDual(self.real / c, (self.dual * c - self.real * d) / (c**2))
+
+    def __rtruediv__(self, other) -> "MultiDual":
+        """Overload / operator when the MultiDual number is on the right hand side of the operator (other / self)."""
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        c, d = parts
+        return MultiDual(c / self.real, (d * self.real - c * self.dual) / (self.real**2))
+
+    # Power
+    def __pow__(self, other) -> "MultiDual":
+        """Overload ** operator when the MultiDual number is the base.
+
+        Args:
+            other (int, float, MultiDual): Right hand side of ** operator (exponent).
+
+        Raises:
+            ValueError: For when the real part is negative (logarithm of negative number is undefined)
+
+        Returns:
+            MultiDual: Resulting MultiDual number
+        """
+        a, b = self.real, self.dual
+        if isinstance(other, MultiDual):
+            c, d = other.real, other.dual
+            if a < 0:
+                raise ValueError(
+                    "The real part of base cannot be negative for exponents (undefined)"
+                )
+            return MultiDual(a**c, a ** (c - 1) * (b * c + a * d * np.log(a)))
+        return MultiDual(a**other, other * b * (a ** (other - 1)))
+
+    def __rpow__(self, other) -> "MultiDual":
+        """Overload ** operator when the MultiDual number is the exponent.
+
+        Args:
+            other (int, float): Left hand side of ** operator (base).
+
+        Raises:
+            ValueError: Prevent base being a non-numerical value.
+
+        Returns:
+            MultiDual: Resulting MultiDual number
+        """
+        if isinstance(other, (int, float)):
+            pow_real = other**self.real
+            return MultiDual(pow_real, pow_real * self.dual * np.log(other))
+        raise ValueError(
+            f"Unsupported operation between {type(other).__name__} and MultiDual"
+        )
+
+    def __repr__(self) -> str:
+        return f"MultiDual({self.real}, {self.dual.tolist()})"
+
+    # CLASS METHODS FOR MULTI-DUAL NUMBERS
+    @classmethod
+    def seed(cls, x: Sequence[float], start: int = 0, size: int = None) -> list:
+        """Seed the inputs with unit tangent vectors.
+
+        Inputs start, ..., start + size - 1 are seeded with e_0, ..., e_(size - 1) and all other inputs get a zero
+        tangent, so a chunk of directional derivatives is propagated in each evaluation.
+
+        Args:
+            x (Sequence[float]): Point the inputs are evaluated at
+            start (int, optional): Index of the first seeded input. Defaults to 0.
+            size (int, optional): Number of seeded inputs (tangent length). Defaults to all inputs.
+
+        Returns:
+            list: MultiDual numbers, one per input
+        """
+        x = np.asarray(x, dtype=np.float64).ravel()
+        if size is None:
+            size = x.size - start
+        tangents = np.zeros((x.size, size))
+        stop = min(start + size, x.size)
+        tangents[np.arange(start, stop), np.arange(stop - start)] = 1.0
+        return [cls(float(x[i]), tangents[i]) for i in range(x.size)]
+
+    @classmethod
+    def gradient(cls, func: Callable, x: Sequence[float]) -> np.ndarray:
+        """Function to be used for computing the gradient of a scalar function of several inputs in one evaluation
+
+        Args:
+            func (Callable): Function to be differentiated, taking a sequence of inputs and returning a scalar
+            x (Sequence[float]): Point the gradient is to be evaluated at
+
+        Returns:
+            np.ndarray: Gradient of func evaluated at x
+        """
+        n = np.size(x)
+        eval_x = func(cls.seed(x))
+        # Outputs that do not depend on the inputs have a zero gradient
+        if not isinstance(eval_x, MultiDual):
+            return np.zeros(n)
+        return np.array(np.broadcast_to(eval_x.dual, (n,)), dtype=np.float64)
+
+    @classmethod
+    def jacobian(
+        cls, func: Callable, x: Sequence[float], chunk_size: int = 8
+    ) -> np.ndarray:
+        """Function to be used for computing the Jacobian of a vector-valued function with chunked forward mode
+
+        Each evaluation of func propagates chunk_size tangent directions, so the Jacobian of a function with n inputs
+        costs ceil(n / chunk_size) evaluations. Larger chunks mean fewer evaluations but longer tangent vectors.
+
+        Args:
+            func (Callable): Function to be differentiated, taking a sequence of inputs and returning a scalar or a
+                sequence of outputs
+            x (Sequence[float]): Point the Jacobian is to be evaluated at
+            chunk_size (int, optional): Number of tangent directions per evaluation. Defaults to 8.
+
+        Raises:
+            ValueError: If chunk_size is not positive, or func returns tangents of the wrong length or a varying number
+                of outputs
+
+        Returns:
+            np.ndarray: Jacobian of shape (number of outputs, number of inputs); scalar outputs give a single row
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        n = np.size(x)
+        jac = None
+        for start in range(0, n, chunk_size):
+            size = min(chunk_size, n - start)
+            eval_x = func(cls.seed(x, start, size))
+            if not isinstance(eval_x, (list, tuple, np.ndarray)):
+                eval_x = [eval_x]
+            outputs = list(np.ravel(np.asarray(eval_x, dtype=object)))
+            if jac is None:
+                jac = np.zeros((len(outputs), n))
+            elif len(outputs) != jac.shape[0]:
+                raise ValueError("func must return the same number of outputs for every chunk.")
+            for row, out in enumerate(outputs):
+                # Outputs that do not depend on the inputs keep a zero row
+                if isinstance(out, MultiDual):
+                    if out.dual.shape != (size,):
+                        raise ValueError(f"Output {row} has a tangent of length {out.dual.size}, expected {size}.")
+                    jac[row, start : start + size] = out.dual
+        if jac is None:
+            jac = np.zeros((0, n))
+        return jac
+
+    # IMPLEMENT COMMON FUNCTIONS f(x)
+    def sin(self) -> "MultiDual":
+        """
+        Returns sin(x), where sin(a + b·ε) = sin(a) + cos(a) * b·ε
+        """
+        return MultiDual(np.sin(self.real), np.cos(self.real) * self.dual)
+
+    def cos(self) -> "MultiDual":
+        """
+        Returns cos(x), where cos(a + b·ε) = cos(a) - sin(a) * b·ε
+        """
+        return MultiDual(np.cos(self.real), -np.sin(self.real) * self.dual)
+
+    def tan(self) -> "MultiDual":
+        """
+        Returns tan(x), where tan(a + b·ε) = tan(a) + sec(a) ** 2 * b·ε
+        """
+        return MultiDual(np.tan(self.real), ((1 / np.cos(self.real)) ** 2) * self.dual)
+
+    def log(self) -> "MultiDual":
+        """
+        Returns ln(x), where ln(a + b·ε) = ln(a) + (b / a)·ε
+
+        Raises:
+            ValueError: if the argument to ln is not positive
+        """
+        if self.real <= 0:
+            raise ValueError("The argument to ln must be positive.")
+        return MultiDual(np.log(self.real), self.dual / self.real)
+
+    def exp(self) -> "MultiDual":
+        """
+        Returns exp(x), where exp(a + b·ε) = exp(a) + exp(a) * b·ε
+        """
+        exp_real = np.exp(self.real)
+        return MultiDual(exp_real, exp_real * self.dual)
@@ -0,0 +1,114 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import os
+from typing import Callable, Optional
+
+import numpy as np
+
+from .dual import Dual
+
+
+def _attach(name: str, size: int):
+    """Attach to an existing shared memory block and view it as a float64 array.
+
+    Args:
+        name (str): Name of the shared memory block
+        size (int): Number of float64 values in the block
+
+    Returns:
+        tuple: (SharedMemory, np.ndarray view of the block)
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray((size,), dtype=np.float64, buffer=shm.buf)
+
+
+def _derivative_chunk(
+    func: Callable, backend: type, in_name: str, out_name: str, size: int, start: int, stop: int
+) -> None:
+    """Worker task: evaluate the derivative at points [start, stop) of the shared input into the shared output.
+
+    Only the block names and bounds cross the process boundary; the points and results stay in shared memory.
+    """
+    in_shm, x = _attach(in_name, size)
+    out_shm, out = _attach(out_name, size)
+    try:
+        out[start:stop] = backend.derivative(func, x[start:stop])
+    finally:
+        # Drop the views before closing, as the buffers cannot be released while exported
+        del x, out
+        in_shm.close()
+        out_shm.close()
+
+
+def parallel_derivative(
+    func: Callable,
+    xs,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    backend: type = Dual,
+) -> np.ndarray:
+    """Function to be used for evaluating the derivative of func at many points across a pool of processes
+
+    The points are split into chunks that are evaluated concurrently by worker processes with
+    ``backend.derivative``, so arbitrary Python functions (which cannot run without the GIL) use every core. The
+    input and output arrays live in shared memory, so only the chunk bounds are pickled per task.
+
+    func and backend are pickled once per task, so func must be defined at module level (not a lambda or a nested
+    function).
+
+    Args:
+        func (Callable): Function to be differentiated
+        xs (array_like): Points the derivative is to be evaluated at
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        chunksize (int, optional): Number of points per task. Defaults to splitting the points into four tasks per
+            worker.
+        backend (type, optional): Dual class performing the evaluation. Defaults to dual_autodiff.dual.Dual.
+
+    Raises:
+        ValueError: If workers or chunksize is not positive
+
+    Returns:
+        np.ndarray: Derivative of func at each point, with the same shape as xs
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise ValueError("workers must be a positive integer.")
+    x = np.ascontiguousarray(xs, dtype=np.float64)
+    shape, size = x.shape, x.size
+    if chunksize is None:
+        chunksize = max(1, -(-size // (4 * workers)))
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer.")
+    if size == 0:
+        return np.zeros(shape)
+    if workers == 1 or size <= chunksize:
+        # A single task gains nothing from a pool
+        return np.asarray(backend.derivative(func, x.ravel()), dtype=np.float64).reshape(shape)
+
+    nbytes = size * x.itemsize
+    in_shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    out_shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        shared_x = np.ndarray((size,), dtype=np.float64, buffer=in_shm.buf)
+        shared_out = np.ndarray((size,), dtype=np.float64, buffer=out_shm.buf)
+        shared_x[:] = x.ravel()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _derivative_chunk, func, backend, in_shm.name, out_shm.name, size, start,
+                    min(start + chunksize, size),
+                )
+                for start in range(0, size, chunksize)
+            ]
+            for future in futures:
+                # Re-raise the first error from a worker
+                future.result()
+        result = shared_out.copy().reshape(shape)
+    finally:
+        # Drop the views before closing, as the buffers cannot be released while exported
+        shared_x = shared_out = None
+        in_shm.close()
+        in_shm.unlink()
+        out_shm.close()
+        out_shm.unlink()
+    return result
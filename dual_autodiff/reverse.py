@@ -0,0 +1,300 @@
+from array import array
+from typing import Callable, Sequence
+import numpy as np
+
+
+class Tape:
+    """
+    A compact, array-backed record of the operations performed on Var objects for reverse-mode differentiation
+
+    Every node stores at most two parents and the local partial derivative with respect to each of them. The four
+    columns are held in typed arrays (rather than one Python object per node), so recording is cheap and the
+    backward sweep is a single pass over contiguous memory.
+
+    Attributes:
+        parent1, parent2: (array): Indices of the parent nodes (-1 when absent)
+        partial1, partial2: (array): Local partial derivatives with respect to each parent
+    """
+
+    def __init__(self):
+        """Create an empty tape."""
+        self.parent1 = array("q")
+        self.parent2 = array("q")
+        self.partial1 = array("d")
+        self.partial2 = array("d")
+
+    def __len__(self) -> int:
+        return len(self.parent1)
+
+    def record(
+        self, parent1: int = -1, partial1: float = 0.0, parent2: int = -1, partial2: float = 0.0
+    ) -> int:
+        """Append a node to the tape.
+
+        Args:
+            parent1 (int, optional): Index of the first parent. Defaults to -1 (no parent).
+            partial1 (float, optional): Partial derivative with respect to the first parent. Defaults to 0.0.
+            parent2 (int, optional): Index of the second parent. Defaults to -1 (no parent).
+            partial2 (float, optional): Partial derivative with respect to the second parent. Defaults to 0.0.
+
+        Returns:
+            int: Index of the new node
+        """
+        self.parent1.append(parent1)
+        self.partial1.append(partial1)
+        self.parent2.append(parent2)
+        self.partial2.append(partial2)
+        return len(self.parent1) - 1
+
+    def variable(self, value: float) -> "Var":
+        """Create an independent input variable on the tape.
+
+        Args:
+            value (float): Value of the input
+
+        Returns:
+            Var: New input variable
+        """
+        return Var(self, self.record(), value)
+
+    def backward(self, output: int) -> np.ndarray:
+        """Run the backward sweep from a single output node.
+
+        Args:
+            output (int): Index of the output node
+
+        Returns:
+            np.ndarray: Adjoint (derivative of the output) of every node on the tape
+        """
+        adjoint = np.zeros(len(self))
+        adjoint[output] = 1.0
+        parent1, parent2 = self.parent1, self.parent2
+        partial1, partial2 = self.partial1, self.partial2
+        # Nodes are recorded in evaluation order, so a reverse pass visits children before parents
+        for k in range(output, -1, -1):
+            adj = adjoint[k]
+            if adj == 0.0:
+                continue
+            if parent1[k] >= 0:
+                adjoint[parent1[k]] += partial1[k] * adj
+            if parent2[k] >= 0:
+                adjoint[parent2[k]] += partial2[k] * adj
+        return adjoint
+
+
+class Var:
+    """
+    A class for representing variables recorded on a Tape for reverse-mode automatic differentiation
+
+    Attributes:
+        tape: (Tape): Tape the variable is recorded on
+        index: (int): Position of the variable on the tape
+        real: (float): Value of the variable
+    """
+
+    def __init__(self, tape: Tape, index: int, real: float):
+        """Input the tape, tape position and value of the variable.
+
+        Args:
+            tape (Tape): Tape the variable is recorded on
+            index (int): Position of the variable on the tape
+            real (float): Value of the variable
+        """
+        self.tape = tape
+        self.index = index
+        self.real = real
+
+    # Record a node with one parent (self)
+    def _unary(self, real: float, partial: float) -> "Var":
+        return Var(self.tape, self.tape.record(self.index, partial), real)
+
+    # Record a node with two parents (self, other)
+    def _binary(self, other: "Var", real: float, partial1: float, partial2: float) -> "Var":
+        return Var(
+            self.tape, self.tape.record(self.index, partial1, other.index, partial2), real
+        )
+
+    # Overloading the arithmetic operators
+    # Addition
+    def __add__(self, other) -> "Var":
+        """Overload + operator to perform addition involving Vars
+
+        Args:
+            other (int, float, Var): The right hand side of the + operator
+
+        Returns:
+            Var: Resulting sum of the addition
+        """
+        if isinstance(other, Var):
+            return self._binary(other, self.real + other.real, 1.0, 1.0)
+        return self._unary(self.real + other, 1.0)
+
+    def __radd__(self, other) -> "Var":
+        """Overload + operator when the Var is on the right hand side of the operator."""
+        return self.__add__(other)
+
+    # Subtraction
+    def __sub__(self, other) -> "Var":
+        """Overload - operator to perform subtraction involving Vars
+
+        Args:
+            other (int, float, Var): The right hand side of the - operator
+
+        Returns:
+            Var: Resulting difference of the subtraction
+        """
+        if isinstance(other, Var):
+            return self._binary(other, self.real - other.real, 1.0, -1.0)
+        return self._unary(self.real - other, 1.0)
+
+    def __rsub__(self, other) -> "Var":
+        """Overload - operator when the Var is on the right hand side of the operator (other - self)."""
+        return self._unary(other - self.real, -1.0)
+
+    def __neg__(self) -> "Var":
+        return self._unary(-self.real, -1.0)
+
+    # Multiplication
+    def __mul__(self, other) -> "Var":
+        """Overload * operator to perform multiplication involving Vars
+
+        Args:
+            other (int, float, Var): The right hand side of the * operator
+
+        Returns:
+            Var: Resulting product of the multiplication
+        """
+        if isinstance(other, Var):
+            return self._binary(other, self.real * other.real, other.real, self.real)
+        return self._unary(self.real * other, other)
+
+    def __rmul__(self, other) -> "Var":
+        """Overload * operator when the Var is on the right hand side of the operator."""
+        return self.__mul__(other)
+
+    # Division
+    def __truediv__(self, other) -> "Var":
+        """Overload / operator to perform division involving Vars
+
+        Args:
+            other (int, float, Var): The right hand side of the / operator
+
+        Returns:
+            Var: Resulting quotient of the division
+        """
+        if isinstance(other, Var):
+            c = other.real
+            return self._binary(other, self.real / c, 1 / c, -self.real / c**2)
+        return self._unary(self.real / other, 1 / other)
+
+    def __rtruediv__(self, other) -> "Var":
+        """Overload / operator when the Var is on the right hand side of the operator (other / self)."""
+        a = self.real
+        return self._unary(other / a, -other / a**2)
+
+    # Power
+    def __pow__(self, other) -> "Var":
+        """Overload ** operator when the Var is the base.
+
+        Args:
+            other (int, float, Var): Right hand side of ** operator (exponent).
+
+        Raises:
+            ValueError: For when the real part is negative (logarithm of negative number is undefined)
+
+        Returns:
+            Var: Resulting Var
+        """
+        a = self.real
+        if isinstance(other, Var):
+            if a < 0:
+                raise ValueError(
+                    "The real part of base cannot be negative for exponents (undefined)"
+                )
+            c = other.real
+            pow_real = a**c
+            return self._binary(other, pow_real, c * a ** (c - 1), pow_real * np.log(a))
+        return self._unary(a**other, other * a ** (other - 1))
+
+    def __rpow__(self, other) -> "Var":
+        """Overload ** operator when the Var is the exponent.
+
+        Args:
+            other (int, float): Left hand side of ** operator (base).
+
+        Raises:
+            ValueError: Prevent base being a non-numerical value.
+
+        Returns:
+            Var: Resulting Var
+        """
+        if isinstance(other, (int, float)):
+            pow_real = other**self.real
+            return self._unary(pow_real, pow_real * np.log(other))
+        raise ValueError(
+            f"Unsupported operation between {type(other).__name__} and Var"
+        )
+
+    def __repr__(self) -> str:
+        return f"Var({self.real}, index={self.index})"
+
+    # IMPLEMENT COMMON FUNCTIONS f(x), RECORDING f'(x) AS THE LOCAL PARTIAL
+    def sin(self) -> "Var":
+        """
+        Returns sin(x), recording d/dx sin(x) = cos(x)
+        """
+        return self._unary(np.sin(self.real), np.cos(self.real))
+
+    def cos(self) -> "Var":
+        """
+        Returns cos(x), recording d/dx cos(x) = -sin(x)
+        """
+        return self._unary(np.cos(self.real), -np.sin(self.real))
+
+    def tan(self) -> "Var":
+        """
+        Returns tan(x), recording d/dx tan(x) = sec(x) ** 2
+        """
+        return self._unary(np.tan(self.real), (1 / np.cos(self.real)) ** 2)
+
+    def log(self) -> "Var":
+        """
+        Returns ln(x), recording d/dx ln(x) = 1 / x
+
+        Raises:
+            ValueError: if the argument to ln is not positive
+        """
+        if self.real <= 0:
+            raise ValueError("The argument to ln must be positive.")
+        return self._unary(np.log(self.real), 1 / self.real)
+
+    def exp(self) -> "Var":
+        """
+        Returns exp(x), recording d/dx exp(x) = exp(x)
+        """
+        exp_real = np.exp(self.real)
+        return self._unary(exp_real, exp_real)
+
+
+def grad(func: Callable, x: Sequence[float]) -> np.ndarray:
+    """Function to be used for computing the gradient of a scalar function with reverse-mode differentiation
+
+    One forward sweep records the operations on a tape and one backward sweep accumulates the adjoints, so the cost
+    does not grow with the number of inputs.
+
+    Args:
+        func (Callable): Function to be differentiated, taking a sequence of inputs and returning a scalar
+        x (Sequence[float]): Point the gradient is to be evaluated at
+
+    Returns:
+        np.ndarray: Gradient of func evaluated at x
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    tape = Tape()
+    inputs = [tape.variable(float(xi)) for xi in x]
+    output = func(inputs)
+    # Outputs that do not depend on the inputs have a zero gradient
+    if not isinstance(output, Var):
+        return np.zeros(x.size)
+    # Inputs are the first nodes on the tape
+    return tape.backward(output.index)[: x.size]
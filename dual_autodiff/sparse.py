@@ -0,0 +1,217 @@
+from typing import Callable, Sequence
+import numpy as np
+
+from .multi_dual import MultiDual
+
+
+def _outputs(eval_x) -> list:
+    """Flatten the output of a function into a list of scalars.
+
+    Args:
+        eval_x (MultiDual, float, Sequence): Output of the function
+
+    Returns:
+        list: Scalar outputs
+    """
+    if not isinstance(eval_x, (list, tuple, np.ndarray)):
+        eval_x = [eval_x]
+    return list(np.ravel(np.asarray(eval_x, dtype=object)))
+
+
+class _Dependencies:
+    """
+    A class for tracing which inputs a value depends on, without computing the value
+
+    Running a function on these (instead of MultiDual numbers) propagates the set of input indices through the
+    operators and elementary functions, giving the structural sparsity pattern: it does not depend on the point,
+    and entries that merely happen to be zero there (e.g. d(x0 * x1)/dx0 at x1 = 0) are kept.
+
+    Attributes:
+        indices: (frozenset): Indices of the inputs the value depends on
+    """
+
+    def __init__(self, indices: frozenset):
+        """Input the indices of the inputs the value depends on.
+
+        Args:
+            indices (frozenset): Input indices
+        """
+        self.indices = indices
+
+    # Plain numbers depend on no input
+    @staticmethod
+    def _indices(other):
+        if isinstance(other, _Dependencies):
+            return other.indices
+        if isinstance(other, (int, float, np.number)):
+            return frozenset()
+        return None
+
+    def _combine(self, other):
+        indices = self._indices(other)
+        if indices is None:
+            return NotImplemented
+        return _Dependencies(self.indices | indices)
+
+    # Every binary operation depends on both of its operands
+    __add__ = __radd__ = __sub__ = __rsub__ = _combine
+    __mul__ = __rmul__ = __truediv__ = __rtruediv__ = _combine
+    __pow__ = __rpow__ = _combine
+
+    # Elementary functions depend on the inputs of their argument
+    def _same(self) -> "_Dependencies":
+        return self
+
+    __neg__ = sin = cos = tan = log = exp = _same
+
+    def __repr__(self) -> str:
+        return f"_Dependencies({sorted(self.indices)})"
+
+
+def _structure(func: Callable, n: int) -> tuple:
+    """Trace the structural non-zeros of the Jacobian of func.
+
+    Args:
+        func (Callable): Function taking a sequence of inputs and returning a scalar or a sequence of outputs
+        n (int): Number of inputs
+
+    Returns:
+        tuple: (rows, cols, number of outputs), with rows and cols the coordinates of the non-zeros
+    """
+    outputs = _outputs(func([_Dependencies(frozenset((j,))) for j in range(n)]))
+    rows, cols = [], []
+    for row, out in enumerate(outputs):
+        # Outputs that do not depend on the inputs have no non-zeros
+        if isinstance(out, _Dependencies):
+            indices = sorted(out.indices)
+            rows.extend([row] * len(indices))
+            cols.extend(indices)
+    return np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64), len(outputs)
+
+
+def _nonzeros(pattern) -> tuple:
+    """Get the coordinates of the non-zeros of a dense or scipy.sparse pattern.
+
+    Args:
+        pattern (array_like, scipy.sparse matrix): Sparsity pattern of shape (m, n)
+
+    Returns:
+        tuple: (rows, cols, shape)
+    """
+    if hasattr(pattern, "tocoo"):
+        coo = pattern.tocoo(copy=True)
+        coo.sum_duplicates()
+        keep = coo.data != 0
+        return coo.row[keep].astype(np.int64), coo.col[keep].astype(np.int64), coo.shape
+    pattern = np.asarray(pattern, dtype=bool)
+    rows, cols = np.nonzero(pattern)
+    return rows, cols, pattern.shape
+
+
+def detect_sparsity(func: Callable, x: Sequence[float]) -> np.ndarray:
+    """Detect the structural sparsity pattern of the Jacobian of func.
+
+    The inputs each func uses are traced through its operators and elementary functions, so no derivatives are
+    computed and the pattern holds at every point, including entries that happen to be zero at x. Functions whose
+    operations depend on the values of the inputs (e.g. branching) cannot be traced; pass an explicit pattern.
+
+    Args:
+        func (Callable): Function taking a sequence of inputs and returning a scalar or a sequence of outputs
+        x (Sequence[float]): Inputs of func (only their number is used)
+
+    Returns:
+        np.ndarray: Boolean array of shape (number of outputs, number of inputs), True where the Jacobian can be
+            non-zero
+    """
+    n = np.size(x)
+    rows, cols, m = _structure(func, n)
+    pattern = np.zeros((m, n), dtype=bool)
+    pattern[rows, cols] = True
+    return pattern
+
+
+def _color(rows: np.ndarray, cols: np.ndarray, n: int) -> np.ndarray:
+    """Greedily colour the n columns of the pattern with non-zeros at (rows, cols), largest-first."""
+    # Columns of each row and rows of each column, so conflicts are found from the non-zeros alone
+    columns_of_row, rows_of_column = {}, [[] for _ in range(n)]
+    for row, col in zip(rows.tolist(), cols.tolist()):
+        columns_of_row.setdefault(row, []).append(col)
+        rows_of_column[col].append(row)
+    colors = [-1] * n
+    for j in np.argsort(-np.bincount(cols, minlength=n), kind="stable").tolist():
+        used = {colors[k] for row in rows_of_column[j] for k in columns_of_row[row]}
+        color = 0
+        while color in used:
+            color += 1
+        colors[j] = color
+    return np.array(colors, dtype=np.int64)
+
+
+def color_columns(pattern) -> np.ndarray:
+    """Colour the columns of a sparsity pattern so that columns of the same colour are structurally orthogonal.
+
+    Two columns conflict when they have a non-zero in the same row. Columns are coloured greedily in order of
+    decreasing number of non-zeros (largest-first), each taking the smallest colour not used by a conflicting column.
+    Conflicts are found from the non-zeros, so the cost grows with the squared non-zeros per row rather than n ** 2.
+
+    Args:
+        pattern (array_like, scipy.sparse matrix): Boolean sparsity pattern of shape (m, n)
+
+    Returns:
+        np.ndarray: Colour (0, 1, ...) of each of the n columns
+    """
+    rows, cols, shape = _nonzeros(pattern)
+    return _color(rows, cols, shape[1])
+
+
+def sparse_jacobian(func: Callable, x: Sequence[float], sparsity=None):
+    """Function to be used for computing a sparse Jacobian with compressed (coloured) forward mode
+
+    Structurally orthogonal columns share a colour and are seeded with the same tangent direction, so the whole
+    Jacobian comes from one evaluation with as many tangent directions as there are colours, rather than one per
+    input. Without a pattern, the structural pattern is traced first (see detect_sparsity), which computes no
+    derivatives.
+
+    Args:
+        func (Callable): Function taking a sequence of inputs and returning a scalar or a sequence of outputs
+        x (Sequence[float]): Point the Jacobian is to be evaluated at
+        sparsity (array_like, scipy.sparse matrix, optional): Boolean sparsity pattern of shape (m, n). Traced from
+            func when not given.
+
+    Raises:
+        ImportError: If scipy is not installed
+        ValueError: If the pattern does not have one column per input
+
+    Returns:
+        scipy.sparse.csr_matrix: Jacobian of shape (number of outputs, number of inputs)
+    """
+    try:
+        from scipy import sparse
+    except ImportError as err:
+        raise ImportError(
+            "sparse_jacobian requires scipy (pip install dual_autodiff[sparse])"
+        ) from err
+
+    x = np.asarray(x, dtype=np.float64).ravel()
+    if sparsity is None:
+        rows, cols, m = _structure(func, x.size)
+        shape = (m, x.size)
+    else:
+        rows, cols, shape = _nonzeros(sparsity)
+        if len(shape) != 2 or shape[1] != x.size:
+            raise ValueError(f"The sparsity pattern must have shape (m, {x.size}), not {shape}.")
+    colors = _color(rows, cols, x.size)
+    n_colors = int(colors.max()) + 1 if colors.size else 0
+
+    # Input j is seeded with the unit vector of its colour
+    seeds = np.zeros((x.size, n_colors))
+    seeds[np.arange(x.size), colors] = 1.0
+    outputs = _outputs(func([MultiDual(float(x[j]), seeds[j]) for j in range(x.size)]))
+
+    data = np.zeros(rows.size)
+    for k, (row, col) in enumerate(zip(rows, cols)):
+        out = outputs[row]
+        if isinstance(out, MultiDual):
+            # Only column col of this colour touches this row, so the compressed entry is J[row, col]
+            data[k] = out.dual[colors[col]]
+    return sparse.csr_matrix((data, (rows, cols)), shape=shape)
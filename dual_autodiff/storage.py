@@ -0,0 +1,114 @@
+"""
+On-disk format for arrays of dual numbers
+
+A dual array of shape S is stored as a standard ``.npy`` file holding one C-ordered float64 (or float32) array of
+shape (2, *S):
+index 0 along the first axis is the real parts and index 1 the dual parts. Each part is therefore one contiguous
+column after the ``.npy`` header, any ``.npy`` reader (e.g. ``np.load``) can read the file, and the parts can be
+memory-mapped and sliced without copying or deserialising individual Dual objects.
+"""
+
+import os
+from typing import Optional, Union
+
+import numpy as np
+from numpy.lib import format as npy_format
+
+from .dual import Dual
+from .dual_array import DualArray
+
+
+def _as_dual_array(duals) -> DualArray:
+    """Convert the supported inputs to a DualArray.
+
+    Args:
+        duals (DualArray, Dual, Iterable[Dual]): Dual numbers to be saved
+
+    Returns:
+        DualArray: Array holding the real and dual parts
+    """
+    if isinstance(duals, DualArray):
+        return duals
+    if isinstance(duals, Dual):
+        return DualArray(duals.real, duals.dual)
+    return DualArray.from_duals(duals)
+
+
+def _check_stacked(data: np.ndarray, file) -> None:
+    """Raise if a loaded array is not in the dual array layout."""
+    if data.dtype not in (np.float32, np.float64) or data.ndim < 1 or data.shape[0] != 2:
+        raise ValueError(
+            f"{file} does not hold a dual array (expected float32 or float64 with shape (2, ...), "
+            f"got {data.dtype} with shape {data.shape})"
+        )
+
+
+def save(file: Union[str, os.PathLike], duals) -> None:
+    """Save dual numbers to a ``.npy`` file in the dual array layout.
+
+    Both parts are stored with the wider of their two precisions, so a mixed-precision array is saved as float64.
+
+    Args:
+        file (str, os.PathLike): Path of the file to write
+        duals (DualArray, Dual, Iterable[Dual]): Dual numbers to be saved
+    """
+    array = _as_dual_array(duals)
+    dtype = np.promote_types(array.real.dtype, array.dual.dtype)
+    out = npy_format.open_memmap(file, mode="w+", dtype=dtype, shape=(2,) + array.shape)
+    out[0] = array.real
+    out[1] = array.dual
+    out.flush()
+    del out
+
+
+def load(file: Union[str, os.PathLike], mmap_mode: Optional[str] = None) -> DualArray:
+    """Load dual numbers saved with ``save``.
+
+    Args:
+        file (str, os.PathLike): Path of the file to read
+        mmap_mode (str, optional): "r", "r+" or "c" to memory-map the file instead of reading it (as in np.load).
+            The real and dual parts of the result are then views of the file, so slices are read lazily and, with
+            "r+", assignments are written back. Defaults to None (read into memory).
+
+    Raises:
+        ValueError: If the file does not hold a dual array
+
+    Returns:
+        DualArray: The saved dual numbers
+    """
+    data = np.load(file, mmap_mode=mmap_mode, allow_pickle=False)
+    _check_stacked(data, file)
+    # Both parts are contiguous views of data, so DualArray keeps them without copying
+    return DualArray(data[0], data[1], dtype=data.dtype)
+
+
+def open_memmap(
+    file: Union[str, os.PathLike], mode: str = "r+", shape: Optional[tuple] = None, dtype=np.float64
+) -> DualArray:
+    """Open (or create) a memory-mapped dual array file.
+
+    Creating a file allocates it on disk only, so arrays larger than RAM can be filled chunk by chunk
+    (e.g. from ``stream_derivative``).
+
+    Args:
+        file (str, os.PathLike): Path of the file
+        mode (str, optional): "r", "r+", "c", or "w+" to create a new zero-filled file. Defaults to "r+".
+        shape (tuple, optional): Shape of the dual array, required for mode "w+"
+        dtype (np.dtype, optional): float32 or float64 storage for mode "w+". Defaults to float64.
+
+    Raises:
+        ValueError: If shape is missing for mode "w+", or the file does not hold a dual array
+
+    Returns:
+        DualArray: Dual array whose real and dual parts are views of the file
+    """
+    if mode == "w+":
+        if shape is None:
+            raise ValueError("shape is required to create a dual array file.")
+        data = npy_format.open_memmap(
+            file, mode="w+", dtype=DualArray._precision(dtype), shape=(2,) + tuple(shape)
+        )
+    else:
+        data = npy_format.open_memmap(file, mode=mode)
+        _check_stacked(data, file)
+    return DualArray(data[0], data[1], dtype=data.dtype)
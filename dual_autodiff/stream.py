@@ -0,0 +1,111 @@
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, Tuple
+
+import numpy as np
+
+from .dual_array import _evaluate_points
+
+
+# Marks the end of the input in the read-ahead queue
+_DONE = object()
+
+
+def evaluate_chunk(func: Callable, x) -> Tuple[np.ndarray, np.ndarray]:
+    """Evaluate func and its derivative at every point of one chunk.
+
+    All points are seeded at once in a DualArray and func is evaluated a single time. If func needs single numbers
+    (e.g. it branches on its input), it is evaluated point by point with Dual instead.
+
+    Args:
+        func (Callable): Function to be differentiated
+        x (array_like): Points of the chunk
+
+    Returns:
+        tuple: (values, derivatives) of func at x, both with the shape of x
+    """
+    return _evaluate_points(func, np.asarray(x, dtype=np.float64))
+
+
+def _read_ahead(chunks: Iterable, depth: int) -> Iterator:
+    """Pull chunks from an iterator on a background thread, keeping at most depth of them buffered.
+
+    Errors raised by the iterator are re-raised in the consumer. Closing the returned generator stops the reader.
+
+    Args:
+        chunks (Iterable): Source of chunks
+        depth (int): Maximum number of buffered chunks
+
+    Yields:
+        Chunks of the source, in order
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # Wait for space, giving up once the consumer has stopped
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def reader() -> None:
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+        except BaseException as err:
+            put((_DONE, err))
+            return
+        put((_DONE, None))
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if isinstance(item, tuple) and len(item) == 2 and item[0] is _DONE:
+                if item[1] is not None:
+                    raise item[1]
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def stream_derivative(
+    func: Callable, chunks: Iterable, read_ahead: int = 0
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Function to be used for evaluating func and its derivative over a stream of input chunks
+
+    Chunks are pulled from the iterable one at a time and each is evaluated with ``evaluate_chunk``, so only the
+    chunks in flight are held in memory and inputs larger than RAM can be piped from a reader to a writer. With
+    read_ahead > 0 the next chunks are read on a background thread while the current one is evaluated, which overlaps
+    I/O-bound readers with the computation.
+
+    Args:
+        func (Callable): Function to be differentiated
+        chunks (Iterable): Iterable (e.g. a generator reading from a file) of array_like chunks of points
+        read_ahead (int, optional): Number of chunks to read ahead on a background thread. Defaults to 0 (read
+            on demand).
+
+    Raises:
+        ValueError: If read_ahead is negative
+
+    Yields:
+        tuple: (values, derivatives) of func for each chunk, in order
+    """
+    if read_ahead < 0:
+        raise ValueError("read_ahead must be a non-negative integer.")
+    source = _read_ahead(chunks, read_ahead) if read_ahead > 0 else iter(chunks)
+    try:
+        for chunk in source:
+            yield evaluate_chunk(func, chunk)
+    finally:
+        # Stop the reader thread when the consumer stops early
+        if read_ahead > 0:
+            source.close()
@@ -0,0 +1,310 @@
+from typing import Callable, Tuple
+import inspect
+import weakref
+
+import numpy as np
+
+
+class Tracer:
+    """
+    A class for recording the primitive operations applied to a dual number
+
+    Running a function on a Tracer (instead of a Dual) records every operator and elementary function call into a
+    shared graph, in evaluation order. The graph can then be turned into straight-line NumPy code.
+
+    Attributes:
+        graph: (list): Recorded operations as (operation name, arguments) pairs
+        index: (int): Position of this value in the graph
+    """
+
+    def __init__(self, graph: list, index: int):
+        """Input the graph and the position of the value in it.
+
+        Args:
+            graph (list): Recorded operations
+            index (int): Position of this value in the graph
+        """
+        self.graph = graph
+        self.index = index
+
+    def _emit(self, op: str, *args) -> "Tracer":
+        """Record an operation and return the Tracer for its result.
+
+        Args:
+            op (str): Name of the operation
+            *args (Tracer, float): Operands
+
+        Returns:
+            Tracer: Result of the operation
+        """
+        self.graph.append((op, args))
+        return Tracer(self.graph, len(self.graph) - 1)
+
+    # Operands are either other Tracers or constants captured as floats
+    @staticmethod
+    def _operand(other):
+        if isinstance(other, Tracer):
+            return other
+        if isinstance(other, (int, float, np.number)):
+            return float(other)
+        raise TypeError(f"Cannot trace operation with {type(other).__name__}")
+
+    def __add__(self, other) -> "Tracer":
+        return self._emit("add", self, self._operand(other))
+
+    def __radd__(self, other) -> "Tracer":
+        return self._emit("add", self, self._operand(other))
+
+    def __sub__(self, other) -> "Tracer":
+        return self._emit("sub", self, self._operand(other))
+
+    def __rsub__(self, other) -> "Tracer":
+        return self._emit("sub", self._operand(other), self)
+
+    def __neg__(self) -> "Tracer":
+        return self._emit("neg", self)
+
+    def __mul__(self, other) -> "Tracer":
+        return self._emit("mul", self, self._operand(other))
+
+    def __rmul__(self, other) -> "Tracer":
+        return self._emit("mul", self, self._operand(other))
+
+    def __truediv__(self, other) -> "Tracer":
+        return self._emit("div", self, self._operand(other))
+
+    def __rtruediv__(self, other) -> "Tracer":
+        return self._emit("div", self._operand(other), self)
+
+    def __pow__(self, other) -> "Tracer":
+        return self._emit("pow", self, self._operand(other))
+
+    def __rpow__(self, other) -> "Tracer":
+        return self._emit("pow", self._operand(other), self)
+
+    def sin(self) -> "Tracer":
+        return self._emit("sin", self)
+
+    def cos(self) -> "Tracer":
+        return self._emit("cos", self)
+
+    def tan(self) -> "Tracer":
+        return self._emit("tan", self)
+
+    def log(self) -> "Tracer":
+        return self._emit("log", self)
+
+    def exp(self) -> "Tracer":
+        return self._emit("exp", self)
+
+    def __repr__(self) -> str:
+        return f"Tracer(index={self.index})"
+
+
+# Straight-line code for each primitive: r<k>, d<k> are the real and dual parts of node k.
+# Binary operations are specialised on which operands are traced (the other is a captured constant).
+_RULES = {
+    ("add", True, True): ["r{o} = {ra} + {rb}", "d{o} = {da} + {db}"],
+    ("add", True, False): ["r{o} = {ra} + {rb}", "d{o} = {da}"],
+    ("sub", True, True): ["r{o} = {ra} - {rb}", "d{o} = {da} - {db}"],
+    ("sub", True, False): ["r{o} = {ra} - {rb}", "d{o} = {da}"],
+    ("sub", False, True): ["r{o} = {ra} - {rb}", "d{o} = -{db}"],
+    ("mul", True, True): ["r{o} = {ra} * {rb}", "d{o} = {ra} * {db} + {da} * {rb}"],
+    ("mul", True, False): ["r{o} = {ra} * {rb}", "d{o} = {da} * {rb}"],
+    ("div", True, True): [
+        "r{o} = {ra} / {rb}",
+        "d{o} = ({da} * {rb} - {ra} * {db}) / ({rb} * {rb})",
+    ],
+    ("div", True, False): ["r{o} = {ra} / {rb}", "d{o} = {da} / {rb}"],
+    ("div", False, True): ["r{o} = {ra} / {rb}", "d{o} = -{ra} * {db} / ({rb} * {rb})"],
+    ("pow", True, True): [
+        "_check_base({ra})",
+        "r{o} = {ra} ** {rb}",
+        "d{o} = {ra} ** ({rb} - 1) * ({da} * {rb} + {ra} * {db} * np.log({ra}))",
+    ],
+    ("pow", True, False): ["r{o} = {ra} ** {rb}", "d{o} = {rb} * {da} * {ra} ** ({rb} - 1)"],
+    ("pow", False, True): ["r{o} = {ra} ** {rb}", "d{o} = r{o} * {db} * np.log({ra})"],
+    ("neg", True): ["r{o} = -{ra}", "d{o} = -{da}"],
+    ("sin", True): ["r{o} = np.sin({ra})", "d{o} = np.cos({ra}) * {da}"],
+    ("cos", True): ["r{o} = np.cos({ra})", "d{o} = -np.sin({ra}) * {da}"],
+    ("tan", True): ["r{o} = np.tan({ra})", "d{o} = {da} / np.cos({ra}) ** 2"],
+    ("log", True): ["_check_log({ra})", "r{o} = np.log({ra})", "d{o} = {da} / {ra}"],
+    ("exp", True): ["r{o} = np.exp({ra})", "d{o} = r{o} * {da}"],
+}
+
+
+def _check_base(real) -> None:
+    """Raise the same error as Dual for a negative base with a dual exponent."""
+    if np.any(np.asarray(real) < 0):
+        raise ValueError("The real part of base cannot be negative for exponents (undefined)")
+
+
+def _check_log(real) -> None:
+    """Raise the same error as Dual for ln of a non-positive number."""
+    if np.any(np.asarray(real) <= 0):
+        raise ValueError("The argument to ln must be positive.")
+
+
+def trace(func: Callable) -> Tuple[list, object]:
+    """Run func once on a Tracer to record its primitive operation graph.
+
+    Args:
+        func (Callable): Function of one variable built from the Dual operators and elementary functions
+
+    Returns:
+        tuple: (graph, output), where output is the Tracer of the result or a constant
+    """
+    graph = [("input", ())]
+    output = func(Tracer(graph, 0))
+    return graph, output
+
+
+def generate_source(graph: list, output) -> Tuple[str, dict]:
+    """Turn a recorded graph into the source of a straight-line NumPy kernel.
+
+    Args:
+        graph (list): Recorded operations
+        output (Tracer, float): Result of the traced function
+
+    Returns:
+        tuple: (source code of ``kernel(r0, d0)``, namespace holding the captured constants)
+    """
+    namespace = {"np": np, "_check_base": _check_base, "_check_log": _check_log}
+    lines = ["def kernel(r0, d0):"]
+    for o, (op, args) in enumerate(graph):
+        if op == "input":
+            continue
+        names = {"o": o}
+        traced = []
+        for label, arg in zip("ab", args):
+            if isinstance(arg, Tracer):
+                names["r" + label] = f"r{arg.index}"
+                names["d" + label] = f"d{arg.index}"
+                traced.append(True)
+            else:
+                const = f"c{len(namespace)}"
+                namespace[const] = arg
+                names["r" + label] = const
+                traced.append(False)
+        for template in _RULES[(op,) + tuple(traced)]:
+            lines.append("    " + template.format(**names))
+    if isinstance(output, Tracer):
+        lines.append(f"    return r{output.index}, d{output.index}")
+    else:
+        # func does not depend on its input
+        namespace["c_out"] = output
+        lines.append("    return c_out + 0.0 * r0, 0.0 * d0")
+    return "\n".join(lines) + "\n", namespace
+
+
+class CompiledFunction:
+    """
+    A function compiled into straight-line NumPy code computing its value and derivative
+
+    The kernel is traced on first use. The recorded operations do not depend on the input, and the generated NumPy
+    code runs on floats and on arrays of any shape, so one kernel serves every input and func is traced only once.
+
+    Attributes:
+        func: (Callable): The original function
+    """
+
+    def __init__(self, func: Callable):
+        """Input the function to compile.
+
+        Args:
+            func (Callable): Function of one variable built from the Dual operators and elementary functions
+        """
+        self.func = func
+        self._kernel = None
+
+    def kernel(self) -> Callable:
+        """Get the compiled kernel, tracing func if it has not been traced yet.
+
+        Returns:
+            Callable: kernel(real, dual) returning the real and dual parts of func
+        """
+        if self._kernel is None:
+            self._kernel = _cached_kernel(self.func)
+        return self._kernel
+
+    def __call__(self, x) -> tuple:
+        """Evaluate the function and its derivative at x.
+
+        Args:
+            x (float, np.ndarray): Value(s) of x
+
+        Returns:
+            tuple: (value, derivative) of func at x
+        """
+        if np.ndim(x) > 0:
+            real = np.asarray(x, dtype=np.float64)
+            dual = np.ones_like(real)
+        else:
+            real, dual = float(x), 1.0
+        return self.kernel()(real, dual)
+
+    def derivative(self, x):
+        """Evaluate the derivative of the function at x.
+
+        Args:
+            x (float, np.ndarray): Value(s) of x
+
+        Returns:
+            float, np.ndarray: Derivative of func at x
+        """
+        return self(x)[1]
+
+
+# Kernels are cached per function object and dropped with it (a kernel holds no reference to its function, so the
+# cache does not keep functions alive). A bound method is a new object on every attribute access, so methods are
+# cached per instance and underlying function instead.
+_CACHE = weakref.WeakKeyDictionary()
+_METHOD_CACHE = weakref.WeakKeyDictionary()
+
+
+def _cached_kernel(func: Callable) -> Callable:
+    """Get the kernel of func from the cache, tracing and caching it on a miss.
+
+    Functions that cannot be weakly referenced (e.g. NumPy ufuncs) are traced every time.
+
+    Args:
+        func (Callable): Function to be compiled
+
+    Returns:
+        Callable: kernel(real, dual) returning the real and dual parts of func
+    """
+    try:
+        if inspect.ismethod(func):
+            cache = _METHOD_CACHE.setdefault(func.__self__, weakref.WeakKeyDictionary())
+            key = func.__func__
+        else:
+            cache, key = _CACHE, func
+        kernel = cache.get(key)
+    except TypeError:
+        cache = kernel = None
+    if kernel is None:
+        source, namespace = generate_source(*trace(func))
+        exec(source, namespace)
+        kernel = namespace["kernel"]
+        if cache is not None:
+            cache[key] = kernel
+    return kernel
+
+
+def trace_compile(func: Callable) -> CompiledFunction:
+    """Function to be used for compiling a function of one variable into a cached straight-line NumPy kernel
+
+    func is run once on a Tracer to record its operations (the operators and sin/cos/tan/log/exp of Dual), and the
+    recording is replayed as plain NumPy code on the real and dual parts, so repeated derivative evaluations pay no
+    operator dispatch or Dual allocation. The kernel is cached for func (for a bound method, for its instance and
+    function), so compiling the same function again does not retrace it.
+
+    Functions whose operations depend on the value of x (e.g. branching) cannot be traced.
+
+    Args:
+        func (Callable): Function to be compiled
+
+    Returns:
+        CompiledFunction: Callable returning (value, derivative)
+    """
+    return CompiledFunction(func)
@@ -1,14 +1,72 @@
+import os
+import tempfile
+
 from setuptools import setup, Extension
+from setuptools._distutils.ccompiler import new_compiler
+from setuptools.errors import CompileError, LinkError
+from setuptools._distutils.sysconfig import customize_compiler
 from Cython.Build import cythonize
 import numpy as np
 
+
+def openmp_flags():
+    """Compiler and linker flags for OpenMP, or empty lists when the compiler does not support it.
+
+    Set DUAL_AUTODIFF_NO_OPENMP=1 to force a serial build.
+    """
+    if os.environ.get("DUAL_AUTODIFF_NO_OPENMP"):
+        return [], []
+    compiler = new_compiler()
+    customize_compiler(compiler)
+    flag = "/openmp" if compiler.compiler_type == "msvc" else "-fopenmp"
+    link_flags = [] if compiler.compiler_type == "msvc" else [flag]
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "check_openmp.c")
+        with open(src, "w") as f:
+            f.write("#include <omp.h>\nint main(void) { return omp_get_max_threads() > 0 ? 0 : 1; }\n")
+        try:
+            objects = compiler.compile([src], output_dir=tmp, extra_postargs=[flag])
+            compiler.link_executable(objects, os.path.join(tmp, "check_openmp"), extra_postargs=link_flags)
+        except (CompileError, LinkError):
+            return [], []
+    return [flag], link_flags
+
+
+openmp_compile_args, openmp_link_args = openmp_flags()
+
 extensions = [
     Extension(
         "dual_autodiff_x.dual",
         ["src/dual_autodiff_x/dual.pyx"],
         include_dirs=[np.get_include()],
         define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
-    )
+    ),
+    Extension(
+        "dual_autodiff_x.hyper_dual",
+        ["src/dual_autodiff_x/hyper_dual.pyx"],
+        include_dirs=[np.get_include()],
+        define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
+    ),
+    Extension(
+        "dual_autodiff_x.kernels",
+        ["src/dual_autodiff_x/kernels.pyx"],
+        include_dirs=[np.get_include()],
+        define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
+        extra_compile_args=openmp_compile_args,
+        extra_link_args=openmp_link_args,
+    ),
+    Extension(
+        "dual_autodiff_x.multi_dual",
+        ["src/dual_autodiff_x/multi_dual.pyx"],
+        include_dirs=[np.get_include()],
+        define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
+    ),
+    Extension(
+        "dual_autodiff_x.ufuncs",
+        ["src/dual_autodiff_x/ufuncs.pyx"],
+        include_dirs=[np.get_include()],
+        define_macros=[("NPY_NO_DEPRECATED_API", "NPY_1_7_API_VERSION")],
+    ),
 ]
 
 setup(
@@ -20,7 +78,7 @@ setup(
     }),
     package_dir={"": "src"},
     packages=["dual_autodiff_x"],
-    package_data={"dual_autodiff_x": ["*.so", "*.pyd"]},
+    package_data={"dual_autodiff_x": ["*.so", "*.pyd", "*.pxd"]},
     exclude_package_data={"dual_autodiff_x": ["*.pyx", "*.py"]},
     zip_safe=False,
-)
\ No newline at end of file
+)
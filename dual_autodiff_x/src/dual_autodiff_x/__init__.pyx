@@ -1,3 +1,6 @@
-from .dual import Dual
+from .dual import Dual, dual_sum, dual_dot, dual_prod
+from .hyper_dual import HyperDual
+from .multi_dual import MultiDual
+from .ufuncs import dual_dtype, DualNDArray
 
-__all__ = ['Dual']
+__all__ = ['Dual', 'dual_sum', 'dual_dot', 'dual_prod', 'HyperDual', 'MultiDual', 'dual_dtype', 'DualNDArray']
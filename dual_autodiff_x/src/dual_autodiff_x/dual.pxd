@@ -0,0 +1,154 @@
+# Public C-level API of dual_autodiff_x.dual
+#
+# Downstream Cython code can ``cimport dual_autodiff_x.dual`` (or ``from dual_autodiff_x.dual cimport ...``) to
+# work with dual numbers without Python dispatch, either through the Dual extension type or through the plain
+# dual_t struct and the nogil helpers below.
+#
+# The struct helpers do no error checking (they cannot raise without the GIL): log or sqrt of a non-positive real
+# part, arcsin outside (-1, 1) and a negative base with a dual exponent give nan or inf, where the Dual methods
+# raise ValueError.
+
+from libc.math cimport sin, cos, tan, log, exp, pow, sqrt, tanh, asin, atan, fabs, erf, M_PI
+
+
+cdef class Dual:
+    cdef public double real
+    cdef public double dual
+
+    cpdef Dual sin(self)
+    cpdef Dual cos(self)
+    cpdef Dual tan(self)
+    cpdef Dual log(self)
+    cpdef Dual exp(self)
+    cpdef Dual sqrt(self)
+    cpdef Dual tanh(self)
+    cpdef Dual sigmoid(self)
+    cpdef Dual arcsin(self)
+    cpdef Dual arctan(self)
+    cpdef Dual abs(self)
+    cpdef Dual erf(self)
+
+
+# Plain C dual number a + bε
+ctypedef struct dual_t:
+    double real
+    double dual
+
+
+# Build a Dual without going through Python-level __init__
+cdef inline Dual make_dual(double real, double dual):
+    cdef Dual out = Dual.__new__(Dual)
+    out.real = real
+    out.dual = dual
+    return out
+
+
+cdef inline Dual dual_from_struct(dual_t x):
+    return make_dual(x.real, x.dual)
+
+
+cdef inline dual_t dual_to_struct(Dual x) noexcept:
+    cdef dual_t out
+    out.real = x.real
+    out.dual = x.dual
+    return out
+
+
+# STRUCT ARITHMETIC
+cdef inline dual_t dual_new(double real, double dual) noexcept nogil:
+    cdef dual_t out
+    out.real = real
+    out.dual = dual
+    return out
+
+
+cdef inline dual_t dual_add(dual_t x, dual_t y) noexcept nogil:
+    return dual_new(x.real + y.real, x.dual + y.dual)
+
+
+cdef inline dual_t dual_sub(dual_t x, dual_t y) noexcept nogil:
+    return dual_new(x.real - y.real, x.dual - y.dual)
+
+
+cdef inline dual_t dual_neg(dual_t x) noexcept nogil:
+    return dual_new(-x.real, -x.dual)
+
+
+cdef inline dual_t dual_mul(dual_t x, dual_t y) noexcept nogil:
+    return dual_new(x.real * y.real, x.real * y.dual + x.dual * y.real)
+
+
+cdef inline dual_t dual_scale(dual_t x, double c) noexcept nogil:
+    return dual_new(x.real * c, x.dual * c)
+
+
+cdef inline dual_t dual_div(dual_t x, dual_t y) noexcept nogil:
+    return dual_new(x.real / y.real, (x.dual * y.real - x.real * y.dual) / (y.real * y.real))
+
+
+# (a + bε) ** n
+cdef inline dual_t dual_pow(dual_t x, double n) noexcept nogil:
+    return dual_new(pow(x.real, n), n * x.dual * pow(x.real, n - 1.0))
+
+
+# (a + bε) ** (c + dε) = a ** c + a ** (c - 1) * (b * c + a * d * log(a)) ε
+cdef inline dual_t dual_pow_dual(dual_t x, dual_t y) noexcept nogil:
+    cdef double dual = x.dual * y.real
+    if y.dual != 0.0:
+        dual = dual + x.real * y.dual * log(x.real)
+    return dual_new(pow(x.real, y.real), pow(x.real, y.real - 1.0) * dual)
+
+
+# STRUCT ELEMENTARY FUNCTIONS
+cdef inline dual_t dual_sin(dual_t x) noexcept nogil:
+    return dual_new(sin(x.real), cos(x.real) * x.dual)
+
+
+cdef inline dual_t dual_cos(dual_t x) noexcept nogil:
+    return dual_new(cos(x.real), -sin(x.real) * x.dual)
+
+
+cdef inline dual_t dual_tan(dual_t x) noexcept nogil:
+    cdef double cos_x = cos(x.real)
+    return dual_new(tan(x.real), x.dual / (cos_x * cos_x))
+
+
+cdef inline dual_t dual_log(dual_t x) noexcept nogil:
+    return dual_new(log(x.real), x.dual / x.real)
+
+
+cdef inline dual_t dual_exp(dual_t x) noexcept nogil:
+    cdef double exp_x = exp(x.real)
+    return dual_new(exp_x, exp_x * x.dual)
+
+
+cdef inline dual_t dual_sqrt(dual_t x) noexcept nogil:
+    cdef double sqrt_x = sqrt(x.real)
+    return dual_new(sqrt_x, x.dual / (2.0 * sqrt_x))
+
+
+cdef inline dual_t dual_tanh(dual_t x) noexcept nogil:
+    cdef double tanh_x = tanh(x.real)
+    return dual_new(tanh_x, (1.0 - tanh_x * tanh_x) * x.dual)
+
+
+cdef inline dual_t dual_sigmoid(dual_t x) noexcept nogil:
+    cdef double sig_x = 0.5 * (1.0 + tanh(0.5 * x.real))
+    return dual_new(sig_x, sig_x * (1.0 - sig_x) * x.dual)
+
+
+cdef inline dual_t dual_arcsin(dual_t x) noexcept nogil:
+    return dual_new(asin(x.real), x.dual / sqrt(1.0 - x.real * x.real))
+
+
+cdef inline dual_t dual_arctan(dual_t x) noexcept nogil:
+    return dual_new(atan(x.real), x.dual / (1.0 + x.real * x.real))
+
+
+cdef inline dual_t dual_abs(dual_t x) noexcept nogil:
+    cdef double sign = 1.0 if x.real > 0 else (-1.0 if x.real < 0 else 0.0)
+    return dual_new(fabs(x.real), sign * x.dual)
+
+
+cdef inline dual_t dual_erf(dual_t x) noexcept nogil:
+    return dual_new(erf(x.real), 2.0 / sqrt(M_PI) * exp(-x.real * x.real) * x.dual)
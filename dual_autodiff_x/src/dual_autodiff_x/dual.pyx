@@ -5,129 +5,398 @@
 
 import numpy as np
 cimport numpy as np
-from libc.math cimport sin, cos, tan, log, exp
+cimport cython
+from libc.math cimport sin, cos, tan, log, exp, pow, sqrt, tanh, asin, atan, fabs, erf, M_PI
 
+from itertools import zip_longest
+from numbers import Real
+
+from .ufuncs import DualNDArray, NotVectorisableError, dual_dtype
+
+
+# NumPy's errors for using an array of several numbers as one number, e.g. when func branches on x.real > 0 or
+# calls float(x.real)
+_NUMPY_SCALAR_ERRORS = ("truth value of an array", "converted to Python scalars")
+
+
+cdef bint _not_vectorisable(err):
+    # Whether err is the expected failure of a func that only works on single numbers being given a DualNDArray
+    if isinstance(err, NotVectorisableError):
+        return True
+    return any(message in str(err) for message in _NUMPY_SCALAR_ERRORS)
+
+
+cdef inline bint _is_number(other):
+    # Plain real numbers, including NumPy scalars; int and float are checked first as the common case
+    return isinstance(other, (int, float)) or isinstance(other, Real)
+
+
+@cython.freelist(32)
 cdef class Dual:
     """
     A Cython implementation of the Dual number class for automatic differentiation
+
+    The attributes and the C-level helpers are declared in dual.pxd, so other Cython modules can cimport them.
     """
-    cdef public double real
-    cdef public double dual
     
     def __init__(self, double real, double dual=0.0):
         self.real = real
         self.dual = dual
     
+    # Numbers are read as a typed double (a + 0ε) rather than wrapped in a temporary Dual. Other operands return
+    # NotImplemented, so Python tries their reflected operator.
     def __add__(self, other):
-        if not isinstance(other, Dual):
-            other = Dual(other)
-        return Dual(self.real + other.real, self.dual + other.dual)
+        cdef Dual x = self
+        if isinstance(other, Dual):
+            return make_dual(x.real + (<Dual>other).real, x.dual + (<Dual>other).dual)
+        if not _is_number(other):
+            return NotImplemented
+        cdef double c = other
+        return make_dual(x.real + c, x.dual)
     
     def __radd__(self, other):
         return self.__add__(other)
     
     def __sub__(self, other):
-        if not isinstance(other, Dual):
-            other = Dual(other)
-        return Dual(self.real - other.real, self.dual - other.dual)
+        cdef Dual x = self
+        if isinstance(other, Dual):
+            return make_dual(x.real - (<Dual>other).real, x.dual - (<Dual>other).dual)
+        if not _is_number(other):
+            return NotImplemented
+        cdef double c = other
+        return make_dual(x.real - c, x.dual)
     
     def __rsub__(self, other):
-        if not isinstance(other, Dual):
-            other = Dual(other)
-        return Dual(other.real - self.real, other.dual - self.dual)
+        cdef Dual x = self
+        if isinstance(other, Dual):
+            return make_dual((<Dual>other).real - x.real, (<Dual>other).dual - x.dual)
+        if not _is_number(other):
+            return NotImplemented
+        cdef double c = other
+        return make_dual(c - x.real, -x.dual)
+    
+    def __neg__(self):
+        return make_dual(-self.real, -self.dual)
     
     def __mul__(self, other):
-        if not isinstance(other, Dual):
-            other = Dual(other)
-        return Dual(
-            self.real * other.real,
-            self.real * other.dual + self.dual * other.real
-        )
+        cdef Dual x = self
+        cdef Dual y
+        if isinstance(other, Dual):
+            y = <Dual>other
+            return make_dual(x.real * y.real, x.real * y.dual + x.dual * y.real)
+        if not _is_number(other):
+            return NotImplemented
+        cdef double c = other
+        return make_dual(x.real * c, x.dual * c)
     
     def __rmul__(self, other):
         return self.__mul__(other)
     
     def __truediv__(self, other):
-        if not isinstance(other, Dual):
-            other = Dual(other)
-        cdef double real = self.real / other.real
-        cdef double dual = (self.dual * other.real - self.real * other.dual) / (other.real * other.real)
-        return Dual(real, dual)
+        cdef Dual x = self
+        cdef Dual y
+        if isinstance(other, Dual):
+            y = <Dual>other
+            return make_dual(x.real / y.real, (x.dual * y.real - x.real * y.dual) / (y.real * y.real))
+        if not _is_number(other):
+            return NotImplemented
+        cdef double c = other
+        return make_dual(x.real / c, x.dual / c)
     
     def __rtruediv__(self, other):
-        if not isinstance(other, Dual):
-            other = Dual(other)
-        cdef double real = other.real / self.real
-        cdef double dual = (other.dual * self.real - other.real * self.dual) / (self.real * self.real)
-        return Dual(real, dual)
+        cdef Dual x = self
+        cdef Dual y
+        if isinstance(other, Dual):
+            y = <Dual>other
+            return make_dual(y.real / x.real, (y.dual * x.real - y.real * x.dual) / (x.real * x.real))
+        if not _is_number(other):
+            return NotImplemented
+        cdef double c = other
+        return make_dual(c / x.real, -c * x.dual / (x.real * x.real))
     
     def __pow__(self, other):
-        cdef double a, b, c, d
-        cdef double pow_real, pow_dual
+        cdef Dual x = self
+        cdef Dual y
+        cdef double a = x.real, b = x.dual, c, d
         
         if isinstance(other, Dual):
-            if self.real < 0:
+            if a < 0:
                 raise ValueError("The real part of base cannot be negative for exponents")
-            a = self.real
-            b = self.dual
-            c = other.real
-            d = other.dual
-            pow_real = a ** c
-            pow_dual = a ** (c - 1) * (b * c + a * d * log(a))
-            return Dual(pow_real, pow_dual)
-        else:
-            a = self.real
-            b = self.dual
-            pow_real = a ** other
-            pow_dual = other * b * (a ** (other - 1))
-            return Dual(pow_real, pow_dual)
+            y = <Dual>other
+            c = y.real
+            d = y.dual
+            return make_dual(pow(a, c), pow(a, c - 1.0) * (b * c + a * d * log(a)))
+        if not _is_number(other):
+            return NotImplemented
+        c = other
+        return make_dual(pow(a, c), c * b * pow(a, c - 1.0))
+    
+    def __rpow__(self, other):
+        cdef Dual x = self
+        cdef double c, pow_real
+        if isinstance(other, Dual):
+            return other.__pow__(x)
+        if not _is_number(other):
+            raise ValueError(f"Unsupported operation between {type(other).__name__} and Dual")
+        # c ** (a + bε) = c ** a + c ** a * log(c) * b ε
+        c = other
+        pow_real = pow(c, x.real)
+        return make_dual(pow_real, pow_real * log(c) * x.dual)
     
     def __repr__(self):
         return f"Dual({self.real}, {self.dual})"
     
+    def __reduce__(self):
+        return Dual, (self.real, self.dual)
+    
     @classmethod
-    def derivative(cls, func, double x):
+    def derivative(cls, func, x):
+        # Plain numbers skip the NumPy array check
+        if not isinstance(x, (int, float)) and np.ndim(x) > 0:
+            return cls._derivative_array(func, np.asarray(x, dtype=np.float64))
         cdef Dual dual_x = cls(x, 1.0)
         cdef Dual eval_x = func(dual_x)
         return eval_x.dual
     
+    @classmethod
+    def _derivative_array(cls, func, x):
+        # Seed every point at once in a dual-dtype array and evaluate func a single time
+        try:
+            eval_x = func(DualNDArray(x, 1.0))
+        except (TypeError, ValueError) as err:
+            if not _not_vectorisable(err):
+                raise
+            # func needs single numbers, so fall back to one evaluation per point
+            derivs = [cls.derivative(func, xi) for xi in x.ravel().tolist()]
+            return np.asarray(derivs, dtype=np.float64).reshape(x.shape)
+        return np.array(np.broadcast_to(eval_x.dual, x.shape), dtype=np.float64)
+    
     cpdef Dual sin(self):
-        return Dual(sin(self.real), cos(self.real) * self.dual)
+        return make_dual(sin(self.real), cos(self.real) * self.dual)
     
     @staticmethod
-    def sin_derivative(double x):
+    def sin_derivative(x):
         return Dual.derivative(np.sin, x)
     
     cpdef Dual cos(self):
-        return Dual(cos(self.real), -sin(self.real) * self.dual)
+        return make_dual(cos(self.real), -sin(self.real) * self.dual)
     
     @staticmethod
-    def cos_derivative(double x):
+    def cos_derivative(x):
         return Dual.derivative(np.cos, x)
     
     cpdef Dual tan(self):
         cdef double cos_x = cos(self.real)
-        return Dual(tan(self.real), (1.0 / (cos_x * cos_x)) * self.dual)
+        return make_dual(tan(self.real), (1.0 / (cos_x * cos_x)) * self.dual)
     
     @staticmethod
-    def tan_derivative(double x):
+    def tan_derivative(x):
         return Dual.derivative(np.tan, x)
     
     cpdef Dual log(self):
         if self.real <= 0:
             raise ValueError("The argument to ln must be positive.")
-        return Dual(log(self.real), self.dual / self.real)
+        return make_dual(log(self.real), self.dual / self.real)
     
     @staticmethod
-    def log_derivative(double x):
+    def log_derivative(x):
         return Dual.derivative(np.log, x)
     
     cpdef Dual exp(self):
         cdef double exp_real = exp(self.real)
-        return Dual(exp_real, exp_real * self.dual)
+        return make_dual(exp_real, exp_real * self.dual)
     
     @staticmethod
-    def exp_derivative(double x):
+    def exp_derivative(x):
         return Dual.derivative(np.exp, x)
     
-    
\ No newline at end of file
+    cpdef Dual sqrt(self):
+        if self.real <= 0:
+            raise ValueError("The argument to sqrt must be positive.")
+        cdef double sqrt_real = sqrt(self.real)
+        return make_dual(sqrt_real, self.dual / (2.0 * sqrt_real))
+    
+    @staticmethod
+    def sqrt_derivative(x):
+        return Dual.derivative(lambda x: x.sqrt(), x)
+    
+    cpdef Dual tanh(self):
+        cdef double tanh_real = tanh(self.real)
+        return make_dual(tanh_real, (1.0 - tanh_real * tanh_real) * self.dual)
+    
+    @staticmethod
+    def tanh_derivative(x):
+        return Dual.derivative(lambda x: x.tanh(), x)
+    
+    cpdef Dual sigmoid(self):
+        # 1 / (1 + exp(-a)) written with tanh, which cannot overflow for large |a|
+        cdef double sig_real = 0.5 * (1.0 + tanh(0.5 * self.real))
+        return make_dual(sig_real, sig_real * (1.0 - sig_real) * self.dual)
+    
+    @staticmethod
+    def sigmoid_derivative(x):
+        return Dual.derivative(lambda x: x.sigmoid(), x)
+    
+    cpdef Dual arcsin(self):
+        if self.real <= -1 or self.real >= 1:
+            raise ValueError("The argument to arcsin must be in (-1, 1).")
+        return make_dual(asin(self.real), self.dual / sqrt(1.0 - self.real * self.real))
+    
+    @staticmethod
+    def arcsin_derivative(x):
+        return Dual.derivative(lambda x: x.arcsin(), x)
+    
+    cpdef Dual arctan(self):
+        return make_dual(atan(self.real), self.dual / (1.0 + self.real * self.real))
+    
+    @staticmethod
+    def arctan_derivative(x):
+        return Dual.derivative(lambda x: x.arctan(), x)
+    
+    cpdef Dual abs(self):
+        # The tangent at 0 is taken to be 0
+        cdef double sign = 1.0 if self.real > 0 else (-1.0 if self.real < 0 else 0.0)
+        return make_dual(fabs(self.real), sign * self.dual)
+    
+    def __abs__(self):
+        return self.abs()
+    
+    @staticmethod
+    def abs_derivative(x):
+        return Dual.derivative(lambda x: x.abs(), x)
+    
+    cpdef Dual erf(self):
+        return make_dual(erf(self.real), 2.0 / sqrt(M_PI) * exp(-self.real * self.real) * self.dual)
+    
+    @staticmethod
+    def erf_derivative(x):
+        return Dual.derivative(lambda x: x.erf(), x)
+
+
+# REDUCTIONS
+# Running totals are kept in C doubles, so no intermediate Dual is created per element. Dual-dtype arrays (e.g.
+# DualNDArray) and numeric NumPy arrays are read through typed memoryviews without the GIL.
+cdef tuple _array_parts(values):
+    # (real, dual) float64 views of a dual-dtype or numeric array (dual is None for the latter), or None otherwise
+    if not isinstance(values, np.ndarray):
+        return None
+    if values.dtype == dual_dtype:
+        flat = np.ravel(np.asarray(values))
+        return flat["real"], flat["dual"]
+    if values.dtype.kind in "biuf":
+        return np.ravel(values).astype(np.float64, copy=False), None
+    return None
+
+
+def dual_sum(values):
+    """Sum of an iterable or array of dual numbers (Dual, plain numbers or a dual-dtype array)."""
+    cdef double real = 0.0, dual = 0.0
+    cdef const double[:] r
+    cdef const double[:] d
+    cdef Py_ssize_t i
+    cdef tuple parts = _array_parts(values)
+    if parts is not None:
+        r = parts[0]
+        with nogil:
+            for i in range(r.shape[0]):
+                real += r[i]
+        if parts[1] is not None:
+            d = parts[1]
+            with nogil:
+                for i in range(d.shape[0]):
+                    dual += d[i]
+        return make_dual(real, dual)
+    for v in values:
+        if isinstance(v, Dual):
+            real += (<Dual>v).real
+            dual += (<Dual>v).dual
+        else:
+            real += <double>v
+    return make_dual(real, dual)
+
+
+def dual_dot(a, b):
+    """Dot product of two equal-length iterables or arrays of dual numbers; raises ValueError on a length mismatch."""
+    cdef double real = 0.0, dual = 0.0, c
+    cdef const double[:] ar
+    cdef const double[:] ad
+    cdef const double[:] br
+    cdef const double[:] bd
+    cdef Py_ssize_t i
+    cdef Dual x, y
+    cdef tuple a_parts = _array_parts(a)
+    cdef tuple b_parts = _array_parts(b)
+    if a_parts is not None and b_parts is not None:
+        ar = a_parts[0]
+        br = b_parts[0]
+        if ar.shape[0] != br.shape[0]:
+            raise ValueError("dual_dot requires operands of the same length.")
+        with nogil:
+            for i in range(ar.shape[0]):
+                real += ar[i] * br[i]
+        if a_parts[1] is not None:
+            ad = a_parts[1]
+            with nogil:
+                for i in range(ad.shape[0]):
+                    dual += ad[i] * br[i]
+        if b_parts[1] is not None:
+            bd = b_parts[1]
+            with nogil:
+                for i in range(bd.shape[0]):
+                    dual += ar[i] * bd[i]
+        return make_dual(real, dual)
+    missing = object()
+    for u, v in zip_longest(a, b, fillvalue=missing):
+        if u is missing or v is missing:
+            raise ValueError("dual_dot requires operands of the same length.")
+        if isinstance(u, Dual):
+            x = <Dual>u
+            if isinstance(v, Dual):
+                y = <Dual>v
+                real += x.real * y.real
+                dual += x.real * y.dual + x.dual * y.real
+            else:
+                c = v
+                real += x.real * c
+                dual += x.dual * c
+        elif isinstance(v, Dual):
+            y = <Dual>v
+            c = u
+            real += c * y.real
+            dual += c * y.dual
+        else:
+            real += <double>u * <double>v
+    return make_dual(real, dual)
+
+
+def dual_prod(values):
+    """Product of an iterable or array of dual numbers, with the dual part from the product rule."""
+    cdef double real = 1.0, dual = 0.0, c
+    cdef const double[:] r
+    cdef const double[:] d
+    cdef Py_ssize_t i
+    cdef Dual x
+    cdef tuple parts = _array_parts(values)
+    if parts is not None:
+        r = parts[0]
+        if parts[1] is None:
+            with nogil:
+                for i in range(r.shape[0]):
+                    real *= r[i]
+            return make_dual(real, 0.0)
+        d = parts[1]
+        with nogil:
+            for i in range(r.shape[0]):
+                dual = real * d[i] + dual * r[i]
+                real *= r[i]
+        return make_dual(real, dual)
+    for v in values:
+        if isinstance(v, Dual):
+            x = <Dual>v
+            dual = real * x.dual + dual * x.real
+            real *= x.real
+        else:
+            c = v
+            real *= c
+            dual *= c
+    return make_dual(real, dual)
@@ -0,0 +1,159 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+
+import numpy as np
+cimport numpy as np
+from libc.math cimport sin, cos, tan, log, exp, pow
+
+
+cdef inline HyperDual _make(double real, double eps1, double eps2, double eps12):
+    cdef HyperDual out = HyperDual.__new__(HyperDual)
+    out.real = real
+    out.eps1 = eps1
+    out.eps2 = eps2
+    out.eps12 = eps12
+    return out
+
+
+cdef class HyperDual:
+    """
+    A Cython implementation of hyper-dual numbers a + b ε1 + c ε2 + d ε1ε2 for exact second derivatives
+    """
+    cdef public double real
+    cdef public double eps1
+    cdef public double eps2
+    cdef public double eps12
+
+    def __init__(self, double real, double eps1=0.0, double eps2=0.0, double eps12=0.0):
+        self.real = real
+        self.eps1 = eps1
+        self.eps2 = eps2
+        self.eps12 = eps12
+
+    # f(a + b ε1 + c ε2 + d ε1ε2) = f(a) + f'(a) b ε1 + f'(a) c ε2 + (f'(a) d + f''(a) b c) ε1ε2
+    cdef inline HyperDual _chain(self, double f0, double f1, double f2):
+        return _make(f0, f1 * self.eps1, f1 * self.eps2, f1 * self.eps12 + f2 * self.eps1 * self.eps2)
+
+    cdef inline HyperDual _reciprocal(self):
+        cdef double a = self.real
+        return self._chain(1.0 / a, -1.0 / (a * a), 2.0 / (a * a * a))
+
+    def __add__(self, other):
+        if not isinstance(other, HyperDual):
+            other = HyperDual(other)
+        cdef HyperDual y = other
+        return _make(self.real + y.real, self.eps1 + y.eps1, self.eps2 + y.eps2, self.eps12 + y.eps12)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if not isinstance(other, HyperDual):
+            other = HyperDual(other)
+        cdef HyperDual y = other
+        return _make(self.real - y.real, self.eps1 - y.eps1, self.eps2 - y.eps2, self.eps12 - y.eps12)
+
+    def __rsub__(self, other):
+        if not isinstance(other, HyperDual):
+            other = HyperDual(other)
+        return other.__sub__(self)
+
+    def __neg__(self):
+        return _make(-self.real, -self.eps1, -self.eps2, -self.eps12)
+
+    def __mul__(self, other):
+        if not isinstance(other, HyperDual):
+            other = HyperDual(other)
+        cdef HyperDual y = other
+        return _make(
+            self.real * y.real,
+            self.real * y.eps1 + self.eps1 * y.real,
+            self.real * y.eps2 + self.eps2 * y.real,
+            self.real * y.eps12 + self.eps1 * y.eps2 + self.eps2 * y.eps1 + self.eps12 * y.real,
+        )
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        if not isinstance(other, HyperDual):
+            other = HyperDual(other)
+        return self.__mul__((<HyperDual>other)._reciprocal())
+
+    def __rtruediv__(self, other):
+        return self._reciprocal().__mul__(other)
+
+    def __pow__(self, other):
+        cdef double a = self.real, n, f1 = 0.0, f2 = 0.0
+        if isinstance(other, HyperDual):
+            if a < 0:
+                raise ValueError("The real part of base cannot be negative for exponents")
+            # x ** y = exp(y * ln(x))
+            return (other * self.log()).exp()
+        n = other
+        if n != 0.0:
+            f1 = n * pow(a, n - 1.0)
+        if n != 0.0 and n != 1.0:
+            f2 = n * (n - 1.0) * pow(a, n - 2.0)
+        return self._chain(pow(a, n), f1, f2)
+
+    def __rpow__(self, other):
+        cdef double base, pow_real, log_base
+        if isinstance(other, (int, float)):
+            base = other
+            pow_real = pow(base, self.real)
+            log_base = log(base)
+            return self._chain(pow_real, pow_real * log_base, pow_real * log_base * log_base)
+        raise ValueError(f"Unsupported operation between {type(other).__name__} and HyperDual")
+
+    def __repr__(self):
+        return f"HyperDual({self.real}, {self.eps1}, {self.eps2}, {self.eps12})"
+
+    @classmethod
+    def second_derivative(cls, func, double x):
+        eval_x = func(_make(x, 1.0, 1.0, 0.0))
+        if not isinstance(eval_x, HyperDual):
+            return 0.0
+        return (<HyperDual>eval_x).eps12
+
+    @classmethod
+    def hessian(cls, func, x):
+        cdef double[::1] values = np.ascontiguousarray(x, dtype=np.float64).ravel()
+        cdef Py_ssize_t i, j, k, n = values.shape[0]
+        cdef np.ndarray[np.float64_t, ndim=2] hess = np.zeros((n, n))
+        for i in range(n):
+            for j in range(i, n):
+                seeded = [_make(values[k], <double>(k == i), <double>(k == j), 0.0) for k in range(n)]
+                eval_x = func(seeded)
+                if isinstance(eval_x, HyperDual):
+                    hess[i, j] = (<HyperDual>eval_x).eps12
+                    hess[j, i] = hess[i, j]
+        return hess
+
+    cpdef HyperDual sin(self):
+        cdef double sin_a = sin(self.real)
+        cdef double cos_a = cos(self.real)
+        return self._chain(sin_a, cos_a, -sin_a)
+
+    cpdef HyperDual cos(self):
+        cdef double sin_a = sin(self.real)
+        cdef double cos_a = cos(self.real)
+        return self._chain(cos_a, -sin_a, -cos_a)
+
+    cpdef HyperDual tan(self):
+        cdef double tan_a = tan(self.real)
+        cdef double cos_a = cos(self.real)
+        cdef double sec2 = 1.0 / (cos_a * cos_a)
+        return self._chain(tan_a, sec2, 2.0 * sec2 * tan_a)
+
+    cpdef HyperDual log(self):
+        if self.real <= 0:
+            raise ValueError("The argument to ln must be positive.")
+        cdef double a = self.real
+        return self._chain(log(a), 1.0 / a, -1.0 / (a * a))
+
+    cpdef HyperDual exp(self):
+        cdef double exp_real = exp(self.real)
+        return self._chain(exp_real, exp_real, exp_real)
@@ -0,0 +1,335 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+
+"""
+Batch kernels for arrays of dual numbers.
+
+Every kernel takes the real and dual parts as separate contiguous buffers and writes into preallocated output
+buffers, so no Python objects are created per element and the loops run without the GIL. Output buffers may alias
+the inputs for in-place updates.
+
+Real parts and dual parts may each be float64 or float32 (all real buffers of a call share one type, as do all dual
+buffers), so single and mixed precision (float64 real, float32 dual) arrays are processed without conversion. Each
+element is computed in double precision and rounded once when it is stored.
+
+With ``parallel=True`` the loops are split across threads with OpenMP ``prange``. The thread count is set at runtime
+with ``set_num_threads``; when the extension was built without OpenMP the parallel loops run serially.
+"""
+
+import os
+
+from cython.parallel cimport prange
+
+from .dual cimport (
+    dual_t, dual_new, dual_add, dual_sub, dual_mul, dual_div, dual_pow_dual,
+    dual_sin, dual_cos, dual_tan, dual_log, dual_exp,
+)
+
+
+cdef extern from *:
+    """
+    #ifdef _OPENMP
+    #define DUAL_AUTODIFF_HAVE_OPENMP 1
+    #else
+    #define DUAL_AUTODIFF_HAVE_OPENMP 0
+    #endif
+    """
+    const int DUAL_AUTODIFF_HAVE_OPENMP
+
+
+# Storage types of the real and dual buffers
+ctypedef fused real_f:
+    float
+    double
+
+ctypedef fused tangent_f:
+    float
+    double
+
+
+cdef int _num_threads = os.cpu_count() or 1
+
+
+def openmp_enabled():
+    """Whether the extension was compiled with OpenMP support."""
+    return bool(DUAL_AUTODIFF_HAVE_OPENMP)
+
+
+def set_num_threads(int num_threads):
+    """Set the number of threads used by the parallel kernels.
+
+    Args:
+        num_threads (int): Number of threads (at least 1)
+    """
+    global _num_threads
+    if num_threads < 1:
+        raise ValueError("num_threads must be a positive integer.")
+    _num_threads = num_threads
+
+
+def get_num_threads():
+    """Number of threads the parallel kernels will use (1 without OpenMP)."""
+    return _num_threads if DUAL_AUTODIFF_HAVE_OPENMP else 1
+
+
+# Operation tags. Each kernel is specialised per operation like any other fused type, so the per-element rule (one
+# of the nogil struct helpers of dual.pxd) is chosen at compile time and can be inlined into the loop, rather than
+# being called through a function pointer for every element.
+ctypedef struct add_op:
+    char tag
+
+ctypedef struct sub_op:
+    char tag
+
+ctypedef struct mul_op:
+    char tag
+
+ctypedef struct div_op:
+    char tag
+
+ctypedef struct pow_op:
+    char tag
+
+ctypedef struct sin_op:
+    char tag
+
+ctypedef struct cos_op:
+    char tag
+
+ctypedef struct tan_op:
+    char tag
+
+ctypedef struct log_op:
+    char tag
+
+ctypedef struct exp_op:
+    char tag
+
+ctypedef fused binary_op:
+    add_op
+    sub_op
+    mul_op
+    div_op
+    pow_op
+
+ctypedef fused unary_op:
+    sin_op
+    cos_op
+    tan_op
+    log_op
+    exp_op
+
+cdef add_op ADD
+cdef sub_op SUB
+cdef mul_op MUL
+cdef div_op DIV
+cdef pow_op POW
+cdef sin_op SIN
+cdef cos_op COS
+cdef tan_op TAN
+cdef log_op LOG
+cdef exp_op EXP
+
+
+cdef inline dual_t _apply_binary(binary_op op, dual_t x, dual_t y) noexcept nogil:
+    if binary_op is add_op:
+        return dual_add(x, y)
+    elif binary_op is sub_op:
+        return dual_sub(x, y)
+    elif binary_op is mul_op:
+        return dual_mul(x, y)
+    elif binary_op is div_op:
+        return dual_div(x, y)
+    else:
+        return dual_pow_dual(x, y)
+
+
+cdef inline dual_t _apply_unary(unary_op op, dual_t x) noexcept nogil:
+    if unary_op is sin_op:
+        return dual_sin(x)
+    elif unary_op is cos_op:
+        return dual_cos(x)
+    elif unary_op is tan_op:
+        return dual_tan(x)
+    elif unary_op is log_op:
+        return dual_log(x)
+    else:
+        return dual_exp(x)
+
+
+cdef Py_ssize_t _check_lengths(tuple buffers) except -1:
+    cdef Py_ssize_t n = len(buffers[0])
+    for buf in buffers:
+        if len(buf) != n:
+            raise ValueError("All real, dual and output buffers must have the same length.")
+    return n
+
+
+# The rules take their inputs by value before writing, so the outputs may alias the inputs
+cdef int _binary(binary_op op, const real_f[::1] xr, const tangent_f[::1] xd,
+                 const real_f[::1] yr, const tangent_f[::1] yd,
+                 real_f[::1] out_r, tangent_f[::1] out_d, bint parallel) except -1:
+    cdef Py_ssize_t i, n = _check_lengths((xr, xd, yr, yd, out_r, out_d))
+    cdef int threads = get_num_threads() if parallel else 1
+    cdef dual_t z
+    with nogil:
+        if threads > 1:
+            for i in prange(n, num_threads=threads, schedule="static"):
+                z = _apply_binary(op, dual_new(xr[i], xd[i]), dual_new(yr[i], yd[i]))
+                out_r[i] = <real_f>z.real
+                out_d[i] = <tangent_f>z.dual
+        else:
+            for i in range(n):
+                z = _apply_binary(op, dual_new(xr[i], xd[i]), dual_new(yr[i], yd[i]))
+                out_r[i] = <real_f>z.real
+                out_d[i] = <tangent_f>z.dual
+    return 0
+
+
+cdef int _unary(unary_op op, const real_f[::1] xr, const tangent_f[::1] xd,
+                real_f[::1] out_r, tangent_f[::1] out_d, bint parallel) except -1:
+    cdef Py_ssize_t i, n = _check_lengths((xr, xd, out_r, out_d))
+    cdef int threads = get_num_threads() if parallel else 1
+    cdef dual_t z
+    with nogil:
+        if threads > 1:
+            for i in prange(n, num_threads=threads, schedule="static"):
+                z = _apply_unary(op, dual_new(xr[i], xd[i]))
+                out_r[i] = <real_f>z.real
+                out_d[i] = <tangent_f>z.dual
+        else:
+            for i in range(n):
+                z = _apply_unary(op, dual_new(xr[i], xd[i]))
+                out_r[i] = <real_f>z.real
+                out_d[i] = <tangent_f>z.dual
+    return 0
+
+
+# Seed a unit dual part and keep only the dual part of the result
+cdef int _derivative(unary_op op, const real_f[::1] x, real_f[::1] out, bint parallel) except -1:
+    cdef Py_ssize_t i, n = _check_lengths((x, out))
+    cdef int threads = get_num_threads() if parallel else 1
+    with nogil:
+        if threads > 1:
+            for i in prange(n, num_threads=threads, schedule="static"):
+                out[i] = <real_f>_apply_unary(op, dual_new(x[i], 1.0)).dual
+        else:
+            for i in range(n):
+                out[i] = <real_f>_apply_unary(op, dual_new(x[i], 1.0)).dual
+    return 0
+
+
+cdef int _check_positive(const real_f[::1] xr) except -1:
+    cdef Py_ssize_t i
+    cdef bint bad = False
+    with nogil:
+        for i in range(xr.shape[0]):
+            if xr[i] <= 0:
+                bad = True
+                break
+    if bad:
+        raise ValueError("The argument to ln must be positive.")
+    return 0
+
+
+def add(const real_f[::1] xr, const tangent_f[::1] xd, const real_f[::1] yr, const tangent_f[::1] yd,
+        real_f[::1] out_r, tangent_f[::1] out_d, bint parallel=False):
+    """Elementwise (xr + xd ε) + (yr + yd ε) into (out_r, out_d)."""
+    _binary(ADD, xr, xd, yr, yd, out_r, out_d, parallel)
+
+
+def sub(const real_f[::1] xr, const tangent_f[::1] xd, const real_f[::1] yr, const tangent_f[::1] yd,
+        real_f[::1] out_r, tangent_f[::1] out_d, bint parallel=False):
+    """Elementwise (xr + xd ε) - (yr + yd ε) into (out_r, out_d)."""
+    _binary(SUB, xr, xd, yr, yd, out_r, out_d, parallel)
+
+
+def mul(const real_f[::1] xr, const tangent_f[::1] xd, const real_f[::1] yr, const tangent_f[::1] yd,
+        real_f[::1] out_r, tangent_f[::1] out_d, bint parallel=False):
+    """Elementwise (xr + xd ε) * (yr + yd ε) into (out_r, out_d)."""
+    _binary(MUL, xr, xd, yr, yd, out_r, out_d, parallel)
+
+
+def div(const real_f[::1] xr, const tangent_f[::1] xd, const real_f[::1] yr, const tangent_f[::1] yd,
+        real_f[::1] out_r, tangent_f[::1] out_d, bint parallel=False):
+    """Elementwise (xr + xd ε) / (yr + yd ε) into (out_r, out_d)."""
+    _binary(DIV, xr, xd, yr, yd, out_r, out_d, parallel)
+
+
+def pow(const real_f[::1] xr, const tangent_f[::1] xd, const real_f[::1] yr, const tangent_f[::1] yd,
+        real_f[::1] out_r, tangent_f[::1] out_d, bint parallel=False):
+    """Elementwise (xr + xd ε) ** (yr + yd ε) into (out_r, out_d).
+
+    Every exponent is a dual number, so, as Dual does for a Dual exponent, raises ValueError for any negative base
+    (even where the exponent's dual part is zero).
+    """
+    cdef Py_ssize_t i
+    cdef bint bad = False
+    with nogil:
+        for i in range(xr.shape[0]):
+            if xr[i] < 0:
+                bad = True
+                break
+    if bad:
+        raise ValueError("The real part of base cannot be negative for exponents")
+    _binary(POW, xr, xd, yr, yd, out_r, out_d, parallel)
+
+
+def sin(const real_f[::1] xr, const tangent_f[::1] xd, real_f[::1] out_r, tangent_f[::1] out_d,
+        bint parallel=False):
+    """Elementwise sin(xr + xd ε) into (out_r, out_d)."""
+    _unary(SIN, xr, xd, out_r, out_d, parallel)
+
+
+def cos(const real_f[::1] xr, const tangent_f[::1] xd, real_f[::1] out_r, tangent_f[::1] out_d,
+        bint parallel=False):
+    """Elementwise cos(xr + xd ε) into (out_r, out_d)."""
+    _unary(COS, xr, xd, out_r, out_d, parallel)
+
+
+def tan(const real_f[::1] xr, const tangent_f[::1] xd, real_f[::1] out_r, tangent_f[::1] out_d,
+        bint parallel=False):
+    """Elementwise tan(xr + xd ε) into (out_r, out_d)."""
+    _unary(TAN, xr, xd, out_r, out_d, parallel)
+
+
+def log(const real_f[::1] xr, const tangent_f[::1] xd, real_f[::1] out_r, tangent_f[::1] out_d,
+        bint parallel=False):
+    """Elementwise ln(xr + xd ε) into (out_r, out_d).
+
+    Raises ValueError if any real part is not positive, as Dual does.
+    """
+    _check_positive(xr)
+    _unary(LOG, xr, xd, out_r, out_d, parallel)
+
+
+def exp(const real_f[::1] xr, const tangent_f[::1] xd, real_f[::1] out_r, tangent_f[::1] out_d,
+        bint parallel=False):
+    """Elementwise exp(xr + xd ε) into (out_r, out_d)."""
+    _unary(EXP, xr, xd, out_r, out_d, parallel)
+
+
+def derivative(str name, const real_f[::1] x, real_f[::1] out, bint parallel=False):
+    """Derivative of a built-in elementary function at every point of x, into out.
+
+    Args:
+        name (str): One of "sin", "cos", "tan", "log" or "exp"
+        x (float[::1], double[::1]): Evaluation points
+        out (float[::1], double[::1]): Output buffer for the derivatives, with the type of x
+        parallel (bool, optional): Split the loop across threads. Defaults to False.
+    """
+    if name == "sin":
+        _derivative(SIN, x, out, parallel)
+    elif name == "cos":
+        _derivative(COS, x, out, parallel)
+    elif name == "tan":
+        _derivative(TAN, x, out, parallel)
+    elif name == "log":
+        _check_positive(x)
+        _derivative(LOG, x, out, parallel)
+    elif name == "exp":
+        _derivative(EXP, x, out, parallel)
+    else:
+        raise ValueError(f"Unknown elementary function: {name}")
@@ -0,0 +1,236 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+
+import numpy as np
+cimport numpy as np
+from libc.math cimport sin, cos, tan, log, exp, pow
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
+
+from numbers import Real
+
+
+cdef inline bint _is_number(other):
+    # Plain real numbers, including NumPy scalars; int and float are checked first as the common case
+    return isinstance(other, (int, float)) or isinstance(other, Real)
+
+
+cdef class MultiDual:
+    """
+    A Cython implementation of multi-component dual numbers for computing full gradients in one pass
+
+    The tangent vector is held in a single C buffer of doubles owned by the object.
+    """
+    cdef public double real
+    cdef double* _dual
+    cdef Py_ssize_t n
+
+    def __cinit__(self):
+        self._dual = NULL
+        self.n = 0
+
+    def __init__(self, double real, dual):
+        cdef double[::1] view = np.ascontiguousarray(dual, dtype=np.float64).ravel()
+        self.real = real
+        self._alloc(view.shape[0])
+        if self.n > 0:
+            memcpy(self._dual, &view[0], self.n * sizeof(double))
+
+    def __dealloc__(self):
+        free(self._dual)
+
+    cdef int _alloc(self, Py_ssize_t n) except -1:
+        self.n = n
+        self._dual = <double*>malloc(max(n, 1) * sizeof(double))
+        if self._dual == NULL:
+            raise MemoryError()
+        return 0
+
+    @property
+    def dual(self):
+        """Tangent vector as a NumPy array (copy)."""
+        cdef np.ndarray[np.float64_t, ndim=1] out = np.empty(self.n, dtype=np.float64)
+        if self.n > 0:
+            memcpy(<double*>out.data, self._dual, self.n * sizeof(double))
+        return out
+
+    def __repr__(self):
+        return f"MultiDual({self.real}, {self.dual.tolist()})"
+
+    # Result = real + (cx * x.tangent + cy * y.tangent) ε, with y optional
+    @staticmethod
+    cdef MultiDual _combine(double real, MultiDual x, double cx, MultiDual y, double cy):
+        cdef MultiDual out = MultiDual.__new__(MultiDual)
+        cdef Py_ssize_t i
+        out.real = real
+        out._alloc(x.n)
+        if y is None:
+            for i in range(x.n):
+                out._dual[i] = cx * x._dual[i]
+        else:
+            if y.n != x.n:
+                raise ValueError("MultiDual tangent vectors must have the same length")
+            for i in range(x.n):
+                out._dual[i] = cx * x._dual[i] + cy * y._dual[i]
+        return out
+
+    def __add__(self, other):
+        if isinstance(other, MultiDual):
+            return MultiDual._combine(self.real + (<MultiDual>other).real, self, 1.0, other, 1.0)
+        if _is_number(other):
+            return MultiDual._combine(self.real + other, self, 1.0, None, 0.0)
+        return NotImplemented
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, MultiDual):
+            return MultiDual._combine(self.real - (<MultiDual>other).real, self, 1.0, other, -1.0)
+        if _is_number(other):
+            return MultiDual._combine(self.real - other, self, 1.0, None, 0.0)
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if _is_number(other):
+            return MultiDual._combine(other - self.real, self, -1.0, None, 0.0)
+        return NotImplemented
+
+    def __neg__(self):
+        return MultiDual._combine(-self.real, self, -1.0, None, 0.0)
+
+    def __mul__(self, other):
+        cdef MultiDual y
+        if isinstance(other, MultiDual):
+            y = other
+            return MultiDual._combine(self.real * y.real, self, y.real, y, self.real)
+        if _is_number(other):
+            return MultiDual._combine(self.real * other, self, other, None, 0.0)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        cdef MultiDual y
+        cdef double c
+        if isinstance(other, MultiDual):
+            y = other
+            c = y.real
+            return MultiDual._combine(self.real / c, self, 1.0 / c, y, -self.real / (c * c))
+        if _is_number(other):
+            c = other
+            return MultiDual._combine(self.real / c, self, 1.0 / c, None, 0.0)
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        cdef double c, a = self.real
+        if _is_number(other):
+            c = other
+            return MultiDual._combine(c / a, self, -c / (a * a), None, 0.0)
+        return NotImplemented
+
+    def __pow__(self, other):
+        cdef MultiDual y
+        cdef double a = self.real, c, pow_real
+        if isinstance(other, MultiDual):
+            if a < 0:
+                raise ValueError("The real part of base cannot be negative for exponents")
+            y = other
+            c = y.real
+            pow_real = pow(a, c)
+            # a ** (c - 1) * (b * c + a * d * log(a))
+            return MultiDual._combine(pow_real, self, c * pow(a, c - 1), y, pow_real * log(a))
+        if _is_number(other):
+            c = other
+            return MultiDual._combine(pow(a, c), self, c * pow(a, c - 1), None, 0.0)
+        return NotImplemented
+
+    def __rpow__(self, other):
+        cdef double base, pow_real
+        if _is_number(other):
+            base = other
+            pow_real = pow(base, self.real)
+            return MultiDual._combine(pow_real, self, pow_real * log(base), None, 0.0)
+        raise ValueError(f"Unsupported operation between {type(other).__name__} and MultiDual")
+
+    @classmethod
+    def seed(cls, x, Py_ssize_t start=0, size=None):
+        # Inputs start, ..., start + size - 1 get unit tangents, all other inputs a zero tangent
+        cdef double[::1] values = np.ascontiguousarray(x, dtype=np.float64).ravel()
+        cdef Py_ssize_t i, j, n = values.shape[0]
+        cdef Py_ssize_t width = n - start if size is None else size
+        cdef MultiDual md
+        seeded = []
+        for i in range(n):
+            md = MultiDual.__new__(MultiDual)
+            md.real = values[i]
+            md._alloc(width)
+            for j in range(width):
+                md._dual[j] = 0.0
+            if start <= i < start + width:
+                md._dual[i - start] = 1.0
+            seeded.append(md)
+        return seeded
+
+    @classmethod
+    def gradient(cls, func, x):
+        cdef Py_ssize_t n = np.size(x)
+        eval_x = func(cls.seed(x))
+        if not isinstance(eval_x, MultiDual):
+            return np.zeros(n)
+        return np.array(np.broadcast_to(eval_x.dual, (n,)), dtype=np.float64)
+
+    @classmethod
+    def jacobian(cls, func, x, Py_ssize_t chunk_size=8):
+        # Chunked forward mode: ceil(n / chunk_size) evaluations of func, chunk_size tangents each
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        cdef Py_ssize_t n = np.size(x)
+        cdef Py_ssize_t start, size, row, j
+        cdef MultiDual md
+        cdef double[:, ::1] jac_view
+        jac = None
+        for start in range(0, n, chunk_size):
+            size = min(chunk_size, n - start)
+            eval_x = func(cls.seed(x, start, size))
+            if not isinstance(eval_x, (list, tuple, np.ndarray)):
+                eval_x = [eval_x]
+            outputs = list(np.ravel(np.asarray(eval_x, dtype=object)))
+            if jac is None:
+                jac = np.zeros((len(outputs), n))
+                jac_view = jac
+            elif len(outputs) != jac.shape[0]:
+                raise ValueError("func must return the same number of outputs for every chunk.")
+            for row, out in enumerate(outputs):
+                if isinstance(out, MultiDual):
+                    md = out
+                    # The buffer is read directly, so a shorter tangent would be read past its end
+                    if md.n != size:
+                        raise ValueError(f"Output {row} has a tangent of length {md.n}, expected {size}.")
+                    for j in range(size):
+                        jac_view[row, start + j] = md._dual[j]
+        if jac is None:
+            jac = np.zeros((0, n))
+        return jac
+
+    cpdef MultiDual sin(self):
+        return MultiDual._combine(sin(self.real), self, cos(self.real), None, 0.0)
+
+    cpdef MultiDual cos(self):
+        return MultiDual._combine(cos(self.real), self, -sin(self.real), None, 0.0)
+
+    cpdef MultiDual tan(self):
+        cdef double cos_x = cos(self.real)
+        return MultiDual._combine(tan(self.real), self, 1.0 / (cos_x * cos_x), None, 0.0)
+
+    cpdef MultiDual log(self):
+        if self.real <= 0:
+            raise ValueError("The argument to ln must be positive.")
+        return MultiDual._combine(log(self.real), self, 1.0 / self.real, None, 0.0)
+
+    cpdef MultiDual exp(self):
+        cdef double exp_real = exp(self.real)
+        return MultiDual._combine(exp_real, self, exp_real, None, 0.0)
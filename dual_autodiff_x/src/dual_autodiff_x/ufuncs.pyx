@@ -0,0 +1,481 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+
+"""
+A native NumPy dtype for dual numbers with compiled ufunc loops.
+
+Each element of a ``dual_dtype`` array is a C struct of two doubles (real, dual), so whole arrays of dual
+numbers are processed by C loops without creating any per-element Python objects.
+
+The elementwise loops are registered directly on ``np.power``, ``np.sin``, ``np.cos``, ``np.tan``, ``np.log``,
+``np.exp``, ``np.tanh``, ``np.arcsin``, ``np.arctan`` and ``np.absolute``, so e.g. ``np.sin(arr)`` works on a
+dual-dtype array. The sigmoid and erf, which have no NumPy ufunc, are the ufuncs ``sigmoid`` and ``erf`` of this
+module. NumPy's arithmetic ufuncs use type
+resolvers that reject structured dtypes, so addition, subtraction, multiplication and division are exposed
+as the ufuncs ``add``, ``subtract``, ``multiply`` and ``divide`` of this module. ``DualNDArray`` is a thin
+ndarray view that maps the Python operators onto these ufuncs, with methods for the elementary functions (as
+on ``Dual``).
+
+As with NumPy floats, invalid inputs (e.g. ln of a non-positive real part) give nan rather than raising.
+"""
+
+import numpy as np
+cimport numpy as cnp
+from libc.math cimport sin, cos, tan, log, exp, pow, sqrt, tanh, asin, atan, fabs, erf as c_erf, M_PI
+
+cnp.import_array()
+cnp.import_ufunc()
+
+
+ctypedef struct dual_t:
+    double real
+    double dual
+
+
+cdef extern from "numpy/ufuncobject.h":
+    ctypedef struct PyArray_Descr_t "PyArray_Descr":
+        pass
+    ctypedef void (*loop_t)(char**, const cnp.npy_intp*, const cnp.npy_intp*, void*) noexcept nogil
+    int PyUFunc_RegisterLoopForDescr(cnp.ufunc ufunc, PyArray_Descr_t* user_dtype, loop_t function,
+                                     PyArray_Descr_t** arg_dtypes, void* data) except -1
+
+
+# Layout matches dual_t (two aligned float64 fields)
+dual_dtype = np.dtype([("real", np.float64), ("dual", np.float64)], align=True)
+
+
+# BINARY LOOPS: args = (x, y, out)
+cdef void _add_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *py = args[1]
+    cdef char *po = args[2]
+    cdef dual_t *x
+    cdef dual_t *y
+    cdef dual_t *o
+    for i in range(dims[0]):
+        x = <dual_t*>px
+        y = <dual_t*>py
+        o = <dual_t*>po
+        o.real = x.real + y.real
+        o.dual = x.dual + y.dual
+        px += steps[0]
+        py += steps[1]
+        po += steps[2]
+
+
+cdef void _subtract_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *py = args[1]
+    cdef char *po = args[2]
+    cdef dual_t *x
+    cdef dual_t *y
+    cdef dual_t *o
+    for i in range(dims[0]):
+        x = <dual_t*>px
+        y = <dual_t*>py
+        o = <dual_t*>po
+        o.real = x.real - y.real
+        o.dual = x.dual - y.dual
+        px += steps[0]
+        py += steps[1]
+        po += steps[2]
+
+
+cdef void _multiply_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *py = args[1]
+    cdef char *po = args[2]
+    cdef dual_t *x
+    cdef dual_t *y
+    cdef dual_t *o
+    cdef double real, dual
+    for i in range(dims[0]):
+        x = <dual_t*>px
+        y = <dual_t*>py
+        o = <dual_t*>po
+        # Temporaries so the loop is safe when the output aliases an input
+        real = x.real * y.real
+        dual = x.real * y.dual + x.dual * y.real
+        o.real = real
+        o.dual = dual
+        px += steps[0]
+        py += steps[1]
+        po += steps[2]
+
+
+cdef void _divide_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *py = args[1]
+    cdef char *po = args[2]
+    cdef dual_t *x
+    cdef dual_t *y
+    cdef dual_t *o
+    cdef double real, dual
+    for i in range(dims[0]):
+        x = <dual_t*>px
+        y = <dual_t*>py
+        o = <dual_t*>po
+        real = x.real / y.real
+        dual = (x.dual * y.real - x.real * y.dual) / (y.real * y.real)
+        o.real = real
+        o.dual = dual
+        px += steps[0]
+        py += steps[1]
+        po += steps[2]
+
+
+cdef void _power_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *py = args[1]
+    cdef char *po = args[2]
+    cdef dual_t *x
+    cdef dual_t *y
+    cdef dual_t *o
+    cdef double a, b, c, d, dual
+    for i in range(dims[0]):
+        x = <dual_t*>px
+        y = <dual_t*>py
+        o = <dual_t*>po
+        a = x.real
+        b = x.dual
+        c = y.real
+        d = y.dual
+        # (a + bε) ** (c + dε) = a ** c + a ** (c - 1) * (b * c + a * d * log(a)) ε
+        dual = b * c
+        if d != 0.0:
+            dual = dual + a * d * log(a)
+        o.real = pow(a, c)
+        o.dual = pow(a, c - 1.0) * dual
+        px += steps[0]
+        py += steps[1]
+        po += steps[2]
+
+
+# UNARY LOOPS: args = (x, out)
+cdef void _sin_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *po = args[1]
+    cdef double a, b
+    for i in range(dims[0]):
+        a = (<dual_t*>px).real
+        b = (<dual_t*>px).dual
+        (<dual_t*>po).real = sin(a)
+        (<dual_t*>po).dual = cos(a) * b
+        px += steps[0]
+        po += steps[1]
+
+
+cdef void _cos_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *po = args[1]
+    cdef double a, b
+    for i in range(dims[0]):
+        a = (<dual_t*>px).real
+        b = (<dual_t*>px).dual
+        (<dual_t*>po).real = cos(a)
+        (<dual_t*>po).dual = -sin(a) * b
+        px += steps[0]
+        po += steps[1]
+
+
+cdef void _tan_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *po = args[1]
+    cdef double a, b, cos_a
+    for i in range(dims[0]):
+        a = (<dual_t*>px).real
+        b = (<dual_t*>px).dual
+        cos_a = cos(a)
+        (<dual_t*>po).real = tan(a)
+        (<dual_t*>po).dual = b / (cos_a * cos_a)
+        px += steps[0]
+        po += steps[1]
+
+
+cdef void _log_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *po = args[1]
+    cdef double a, b
+    for i in range(dims[0]):
+        a = (<dual_t*>px).real
+        b = (<dual_t*>px).dual
+        (<dual_t*>po).real = log(a)
+        (<dual_t*>po).dual = b / a
+        px += steps[0]
+        po += steps[1]
+
+
+cdef void _exp_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *po = args[1]
+    cdef double exp_a, b
+    for i in range(dims[0]):
+        exp_a = exp((<dual_t*>px).real)
+        b = (<dual_t*>px).dual
+        (<dual_t*>po).real = exp_a
+        (<dual_t*>po).dual = exp_a * b
+        px += steps[0]
+        po += steps[1]
+
+
+cdef void _tanh_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *po = args[1]
+    cdef double tanh_a, b
+    for i in range(dims[0]):
+        tanh_a = tanh((<dual_t*>px).real)
+        b = (<dual_t*>px).dual
+        (<dual_t*>po).real = tanh_a
+        (<dual_t*>po).dual = (1.0 - tanh_a * tanh_a) * b
+        px += steps[0]
+        po += steps[1]
+
+
+cdef void _sigmoid_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *po = args[1]
+    cdef double sig_a, b
+    for i in range(dims[0]):
+        # 1 / (1 + exp(-a)) written with tanh, which cannot overflow for large |a|
+        sig_a = 0.5 * (1.0 + tanh(0.5 * (<dual_t*>px).real))
+        b = (<dual_t*>px).dual
+        (<dual_t*>po).real = sig_a
+        (<dual_t*>po).dual = sig_a * (1.0 - sig_a) * b
+        px += steps[0]
+        po += steps[1]
+
+
+cdef void _arcsin_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *po = args[1]
+    cdef double a, b
+    for i in range(dims[0]):
+        a = (<dual_t*>px).real
+        b = (<dual_t*>px).dual
+        (<dual_t*>po).real = asin(a)
+        (<dual_t*>po).dual = b / sqrt(1.0 - a * a)
+        px += steps[0]
+        po += steps[1]
+
+
+cdef void _arctan_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *po = args[1]
+    cdef double a, b
+    for i in range(dims[0]):
+        a = (<dual_t*>px).real
+        b = (<dual_t*>px).dual
+        (<dual_t*>po).real = atan(a)
+        (<dual_t*>po).dual = b / (1.0 + a * a)
+        px += steps[0]
+        po += steps[1]
+
+
+cdef void _absolute_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *po = args[1]
+    cdef double a, b
+    for i in range(dims[0]):
+        a = (<dual_t*>px).real
+        b = (<dual_t*>px).dual
+        # The tangent at 0 is taken to be 0
+        (<dual_t*>po).real = fabs(a)
+        (<dual_t*>po).dual = b if a > 0 else (-b if a < 0 else 0.0)
+        px += steps[0]
+        po += steps[1]
+
+
+cdef void _erf_loop(char** args, const cnp.npy_intp* dims, const cnp.npy_intp* steps, void* data) noexcept nogil:
+    cdef cnp.npy_intp i
+    cdef char *px = args[0]
+    cdef char *po = args[1]
+    cdef double a, b
+    for i in range(dims[0]):
+        a = (<dual_t*>px).real
+        b = (<dual_t*>px).dual
+        (<dual_t*>po).real = c_erf(a)
+        (<dual_t*>po).dual = 2.0 / sqrt(M_PI) * exp(-a * a) * b
+        px += steps[0]
+        po += steps[1]
+
+
+# REGISTRATION
+cdef PyArray_Descr_t* _descr = <PyArray_Descr_t*>dual_dtype
+cdef PyArray_Descr_t* _types[3]
+_types[0] = _descr
+_types[1] = _descr
+_types[2] = _descr
+
+
+# Empty ufuncs whose only loop is the dual_dtype loop registered below
+# (name and doc must be C string literals as NumPy keeps the pointers)
+add = cnp.PyUFunc_FromFuncAndData(NULL, NULL, NULL, 0, 2, 1, cnp.PyUFunc_None, "add",
+                                  "Elementwise addition of dual-dtype arrays.", 0)
+subtract = cnp.PyUFunc_FromFuncAndData(NULL, NULL, NULL, 0, 2, 1, cnp.PyUFunc_None, "subtract",
+                                       "Elementwise subtraction of dual-dtype arrays.", 0)
+multiply = cnp.PyUFunc_FromFuncAndData(NULL, NULL, NULL, 0, 2, 1, cnp.PyUFunc_None, "multiply",
+                                       "Elementwise multiplication of dual-dtype arrays.", 0)
+divide = cnp.PyUFunc_FromFuncAndData(NULL, NULL, NULL, 0, 2, 1, cnp.PyUFunc_None, "divide",
+                                     "Elementwise division of dual-dtype arrays.", 0)
+sigmoid = cnp.PyUFunc_FromFuncAndData(NULL, NULL, NULL, 0, 1, 1, cnp.PyUFunc_None, "sigmoid",
+                                      "Elementwise logistic sigmoid of dual-dtype arrays.", 0)
+erf = cnp.PyUFunc_FromFuncAndData(NULL, NULL, NULL, 0, 1, 1, cnp.PyUFunc_None, "erf",
+                                  "Elementwise error function of dual-dtype arrays.", 0)
+
+PyUFunc_RegisterLoopForDescr(add, _descr, _add_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(subtract, _descr, _subtract_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(multiply, _descr, _multiply_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(divide, _descr, _divide_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(sigmoid, _descr, _sigmoid_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(erf, _descr, _erf_loop, _types, NULL)
+
+# NumPy's own ufuncs accept loops for the structured dtype
+PyUFunc_RegisterLoopForDescr(np.power, _descr, _power_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(np.sin, _descr, _sin_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(np.cos, _descr, _cos_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(np.tan, _descr, _tan_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(np.log, _descr, _log_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(np.exp, _descr, _exp_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(np.tanh, _descr, _tanh_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(np.arcsin, _descr, _arcsin_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(np.arctan, _descr, _arctan_loop, _types, NULL)
+PyUFunc_RegisterLoopForDescr(np.absolute, _descr, _absolute_loop, _types, NULL)
+
+# Exposed alongside the arithmetic ufuncs for a uniform namespace
+power = np.power
+
+
+def as_dual(real, dual=0.0):
+    """Build a dual-dtype array from real and dual parts.
+
+    Args:
+        real (array_like): Real parts
+        dual (array_like, optional): Dual parts, broadcast against the real parts. Defaults to 0.0.
+
+    Returns:
+        np.ndarray: Array with dtype dual_dtype
+    """
+    real = np.asarray(real, dtype=np.float64)
+    out = np.empty(real.shape, dtype=dual_dtype)
+    out["real"] = real
+    out["dual"] = dual
+    return out
+
+
+# Map NumPy's arithmetic ufuncs onto the dual-dtype ufuncs above
+_ARITHMETIC = {
+    np.add: add,
+    np.subtract: subtract,
+    np.multiply: multiply,
+    np.true_divide: divide,
+}
+
+# NumPy rewrites x ** 2, x ** 0.5 and x ** -1 into these ufuncs
+_POWER_SHORTCUTS = {
+    np.square: 2.0,
+    np.sqrt: 0.5,
+    np.reciprocal: -1.0,
+}
+
+
+class NotVectorisableError(TypeError):
+    """Raised when a DualNDArray is used where a single number is needed (e.g. by float() or math.sin)."""
+
+
+class DualNDArray(np.ndarray):
+    """
+    A view of a dual-dtype array that supports the Python arithmetic operators
+
+    Plain numbers and float arrays are promoted to duals with zero dual part before the compiled loops run.
+    """
+
+    def __new__(cls, real, dual=0.0):
+        return as_dual(real, dual).view(cls)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if ufunc in _POWER_SHORTCUTS:
+            inputs = inputs + (_POWER_SHORTCUTS[ufunc],)
+            ufunc = np.power
+        ufunc = _ARITHMETIC.get(ufunc, ufunc)
+        args = []
+        for x in inputs:
+            if isinstance(x, np.ndarray) and x.dtype == dual_dtype:
+                args.append(x.view(np.ndarray))
+            else:
+                args.append(as_dual(x))
+        if "out" in kwargs:
+            kwargs["out"] = tuple(o.view(np.ndarray) for o in kwargs["out"])
+        result = getattr(ufunc, method)(*args, **kwargs)
+        if isinstance(result, np.ndarray) and result.dtype == dual_dtype:
+            return result.view(DualNDArray)
+        return result
+
+    @property
+    def real(self):
+        """Real parts as a float64 view."""
+        return self.view(np.ndarray)["real"]
+
+    @property
+    def dual(self):
+        """Dual parts as a float64 view."""
+        return self.view(np.ndarray)["dual"]
+
+    # A DualNDArray holds many dual numbers, so it cannot stand in for a single number
+    def __float__(self):
+        raise NotVectorisableError("A DualNDArray cannot be converted to a single number.")
+
+    __int__ = __complex__ = __float__
+
+    # Elementary functions with the method names of Dual, so functions written as x.sin() etc. vectorise
+    def sin(self):
+        return np.sin(self)
+
+    def cos(self):
+        return np.cos(self)
+
+    def tan(self):
+        return np.tan(self)
+
+    def log(self):
+        return np.log(self)
+
+    def exp(self):
+        return np.exp(self)
+
+    def sqrt(self):
+        return np.sqrt(self)
+
+    def tanh(self):
+        return np.tanh(self)
+
+    def sigmoid(self):
+        return sigmoid(self)
+
+    def arcsin(self):
+        return np.arcsin(self)
+
+    def arctan(self):
+        return np.arctan(self)
+
+    def abs(self):
+        return np.absolute(self)
+
+    def erf(self):
+        return erf(self)
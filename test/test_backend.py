@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+
+
+def run(code: str, backend: str = None) -> subprocess.CompletedProcess:
+    # Backend selection happens at import time, so every case runs in a fresh interpreter
+    env = dict(os.environ)
+    env.pop("DUAL_AUTODIFF_BACKEND", None)
+    if backend is not None:
+        env["DUAL_AUTODIFF_BACKEND"] = backend
+    return subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+
+def test_python_backend() -> None:
+    result = run(
+        "import dual_autodiff, dual_autodiff.dual as d\n"
+        "assert dual_autodiff.Dual is d.Dual\n"
+        "assert dual_autodiff.dual_sum is d.dual_sum\n"
+        "assert dual_autodiff.backend == 'python'",
+        backend="python",
+    )
+    assert result.returncode == 0, result.stderr
+
+def test_auto_backend() -> None:
+    result = run(
+        "try:\n"
+        "    from dual_autodiff_x.dual import Dual as Compiled\n"
+        "except ImportError:\n"
+        "    Compiled = None\n"
+        "import dual_autodiff\n"
+        "assert dual_autodiff.backend == ('python' if Compiled is None else 'cython')\n"
+        "assert dual_autodiff.Dual(2.0, 1.0) * 3 is not None"
+    )
+    assert result.returncode == 0, result.stderr
+
+def test_invalid_backend() -> None:
+    result = run("import dual_autodiff", backend="fortran")
+    assert result.returncode != 0
+    assert "DUAL_AUTODIFF_BACKEND" in result.stderr
+
+def test_forced_cython_backend_missing() -> None:
+    result = run(
+        "try:\n"
+        "    import dual_autodiff_x.dual\n"
+        "except ImportError:\n"
+        "    try:\n"
+        "        import dual_autodiff\n"
+        "    except ImportError:\n"
+        "        pass\n"
+        "    else:\n"
+        "        raise SystemExit('expected ImportError')",
+        backend="cython",
+    )
+    assert result.returncode == 0, result.stderr
+
+def test_import_does_not_load_numpy() -> None:
+    result = run(
+        "import sys, dual_autodiff\n"
+        "x = dual_autodiff.Dual(0.5, 1.0)\n"
+        "y = (x * x + 1).sin().exp().log()\n"
+        "assert 'numpy' not in sys.modules",
+        backend="python",
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+from dual_autodiff.cache import DerivativeCache
+from dual_autodiff.dual import Dual
+
+
+def f(x):
+    return x**3
+
+def test_hit_and_miss() -> None:
+    cache = DerivativeCache()
+    assert cache.derivative(f, 2.0) == 12
+    assert cache.derivative(f, 2.0) == 12
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+def test_lru_eviction() -> None:
+    cache = DerivativeCache(maxsize=2)
+    cache.derivative(f, 1.0)
+    cache.derivative(f, 2.0)
+    cache.derivative(f, 1.0)      # 1.0 is now most recently used
+    cache.derivative(f, 3.0)      # evicts 2.0
+    assert len(cache) == 2
+    cache.derivative(f, 1.0)
+    assert cache.hits == 2
+    cache.derivative(f, 2.0)
+    assert cache.misses == 4
+
+def test_tolerance() -> None:
+    cache = DerivativeCache(tolerance=1e-3)
+    cache.derivative(f, 2.0)
+    cache.derivative(f, 2.0001)
+    assert cache.hits == 1
+
+def test_tolerance_error() -> None:
+    # A hit returns the derivative stored for the first input of its key, not the derivative at x
+    cache = DerivativeCache(tolerance=0.1)
+    first = cache.derivative(f, 0.96)
+    second = cache.derivative(f, 1.04)
+    assert cache.hits == 1
+    assert second == first == pytest.approx(3 * 0.96**2)
+    error = abs(second - 3 * 1.04**2)
+    assert error == pytest.approx(0.48)
+    # Bounded by max|f''| over the two inputs times their distance (under one tolerance)
+    assert error <= 6 * 1.04 * 0.1
+
+def test_decimals() -> None:
+    cache = DerivativeCache(decimals=2)
+    cache.derivative(f, 1.001)
+    cache.derivative(f, 1.004)
+    cache.derivative(f, 1.1)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+def test_array_input_copied() -> None:
+    cache = DerivativeCache()
+    x = np.array([1.0, 2.0])
+    first = cache.derivative(f, x)
+    first[0] = 100
+    assert np.array_equal(cache.derivative(f, x), [3, 12])
+    assert cache.hits == 1
+
+def test_invalidate() -> None:
+    cache = DerivativeCache()
+    cache.derivative(f, 1.0)
+    cache.derivative(np.sin, 1.0)
+    assert cache.invalidate(f) == 1
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
+    assert len(cache) == 0
+
+def test_backend_in_key() -> None:
+    class OtherDual(Dual):
+        pass
+
+    cache = DerivativeCache()
+    cache.derivative(f, 1.0)
+    cache.derivative(f, 1.0, backend=OtherDual)
+    assert cache.misses == 2
+
+def test_invalid_config() -> None:
+    with pytest.raises(ValueError):
+        DerivativeCache(maxsize=0)
+    with pytest.raises(ValueError):
+        DerivativeCache(tolerance=0.1, decimals=2)
+    for tolerance in (0.0, -0.1, float("nan")):
+        with pytest.raises(ValueError, match="tolerance must be positive"):
+            DerivativeCache(tolerance=tolerance)
+    for decimals in (-1, 1.5, True):
+        with pytest.raises(ValueError, match="decimals must be a non-negative integer"):
+            DerivativeCache(decimals=decimals)
@@ -0,0 +1,120 @@
+import pickle
+import pytest
+import numpy as np
+from dual_autodiff.dual import Dual, dual_dot, dual_prod, dual_sum
+
+compiled = pytest.importorskip("dual_autodiff_x.dual")
+ufuncs = pytest.importorskip("dual_autodiff_x.ufuncs")
+CDual = compiled.Dual
+
+
+def assert_same(result, expected) -> None:
+    # Compare a compiled Dual with the pure-Python reference
+    assert type(result) is CDual
+    assert result.real == pytest.approx(expected.real)
+    assert result.dual == pytest.approx(expected.dual)
+
+OPERATORS = [
+    lambda a, b: a + b,
+    lambda a, b: a - b,
+    lambda a, b: a * b,
+    lambda a, b: a / b,
+    lambda a, b: a ** b,
+]
+
+@pytest.mark.parametrize("op", OPERATORS)
+def test_operators_match_python(op) -> None:
+    # Dual operands go through make_dual, plain numbers through the typed double fast path
+    for c in (2, 0.5, 1.5):
+        assert_same(op(CDual(3.0, 2.0), CDual(c, -0.5)), op(Dual(3.0, 2.0), Dual(c, -0.5)))
+        assert_same(op(CDual(3.0, 2.0), c), op(Dual(3.0, 2.0), c))
+        assert_same(op(c, CDual(3.0, 2.0)), op(c, Dual(3.0, 2.0)))
+
+def test_neg_and_rpow() -> None:
+    assert_same(-CDual(1.0, -2.0), -Dual(1.0, -2.0))
+    assert_same(2.0 ** CDual(1.5, 1.0), 2.0 ** Dual(1.5, 1.0))
+    with pytest.raises(ValueError):
+        "a" ** CDual(1.0, 1.0)
+    with pytest.raises(ValueError):
+        CDual(-1.0, 1.0) ** CDual(2.0, 1.0)
+    # Operands that are neither Dual nor numbers are rejected
+    with pytest.raises(TypeError):
+        CDual(1.0, 1.0) + "a"
+
+def test_unsupported_operands_defer() -> None:
+    class Other:
+        def __radd__(self, other):
+            return "radd"
+
+        def __rmul__(self, other):
+            return "rmul"
+
+        def __rpow__(self, other):
+            return "rpow"
+
+    # NotImplemented lets Python try the reflected operator of the other operand
+    assert CDual(1.0, 1.0) + Other() == "radd"
+    assert CDual(1.0, 1.0) * Other() == "rmul"
+    assert CDual(1.0, 1.0) ** Other() == "rpow"
+    # NumPy scalars are plain numbers
+    assert_same(CDual(3.0, 2.0) * np.float32(0.5), Dual(3.0, 2.0) * 0.5)
+    assert_same(CDual(3.0, 2.0) - np.int64(2), Dual(3.0, 2.0) - 2)
+    assert_same(CDual(3.0, 2.0) ** np.float64(2.0), Dual(3.0, 2.0) ** 2.0)
+
+def test_pickle() -> None:
+    x = pickle.loads(pickle.dumps(CDual(1.5, -2.0)))
+    assert type(x) is CDual
+    assert (x.real, x.dual) == (1.5, -2.0)
+    assert CDual(1.5, -2.0).__reduce__() == (CDual, (1.5, -2.0))
+
+@pytest.mark.parametrize("name", [
+    "sin", "cos", "tan", "log", "exp", "sqrt", "tanh", "sigmoid", "arcsin", "arctan", "abs", "erf",
+])
+def test_functions_match_python(name) -> None:
+    for x in (0.3, 0.8) if name in ("log", "sqrt") else (-0.6, 0.3):
+        assert_same(getattr(CDual(x, 2.0), name)(), getattr(Dual(x, 2.0), name)())
+        assert getattr(CDual, name + "_derivative")(x) == pytest.approx(getattr(Dual, name + "_derivative")(x))
+
+def test_function_domains() -> None:
+    with pytest.raises(ValueError, match="ln must be positive"):
+        CDual(0.0, 1.0).log()
+    with pytest.raises(ValueError, match="sqrt must be positive"):
+        CDual(0.0, 1.0).sqrt()
+    with pytest.raises(ValueError, match="arcsin"):
+        CDual(1.0, 1.0).arcsin()
+    assert abs(CDual(-2.0, 1.0)).dual == -1.0
+    assert CDual(0.0, 1.0).abs().dual == 0.0
+    assert CDual(-1000.0, 1.0).sigmoid().real == 0.0
+
+def test_derivative() -> None:
+    def f(x):
+        return (x * x + 1).sin() / x.exp()
+
+    for x in (0.5, 2.0):
+        assert CDual.derivative(f, x) == pytest.approx(Dual.derivative(f, x))
+    assert CDual.derivative(f, np.float64(0.5)) == pytest.approx(Dual.derivative(f, 0.5))
+    assert np.allclose(CDual.derivative(f, [0.5, 2.0]), Dual.derivative(f, np.array([0.5, 2.0])))
+
+def test_reductions_match_python() -> None:
+    reals, duals = [2.0, 0.0, 3.0, 5.0], [1.0, 2.0, 3.0, 4.0]
+    xs = [Dual(a, b) for a, b in zip(reals, duals)]
+    cxs = [CDual(a, b) for a, b in zip(reals, duals)]
+    # Sequences are traversed once; dual-dtype arrays are read without creating Duals
+    array = ufuncs.DualNDArray(reals, duals)
+    for values in (cxs, iter(cxs), array):
+        assert_same(compiled.dual_sum(values), dual_sum(xs))
+    for values in (cxs, iter(cxs), array):
+        assert_same(compiled.dual_prod(values), dual_prod(xs))
+    for values in (cxs, array):
+        assert_same(compiled.dual_dot(values, values), dual_dot(xs, xs))
+        assert_same(compiled.dual_dot(values, np.array(reals)), dual_dot(xs, reals))
+        assert_same(compiled.dual_dot(np.array(reals), values), dual_dot(reals, xs))
+    # Plain numbers count as c + 0ε
+    assert_same(compiled.dual_sum([CDual(1.0, 2.0), 3]), dual_sum([Dual(1.0, 2.0), 3]))
+    assert_same(compiled.dual_prod(np.array([2, 3])), Dual(6.0, 0.0))
+    assert_same(compiled.dual_sum([]), Dual(0.0, 0.0))
+    assert_same(compiled.dual_prod([]), Dual(1.0, 0.0))
+    with pytest.raises(ValueError):
+        compiled.dual_dot(cxs, reals[:2])
+    with pytest.raises(ValueError):
+        compiled.dual_dot(array, np.array(reals[:2]))
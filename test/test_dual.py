@@ -1,6 +1,8 @@
+import math
 import pytest
 import numpy as np
-from dual_autodiff.dual import Dual
+from dual_autodiff.dual import Dual, dual_dot, dual_prod, dual_sum
+from dual_autodiff.dual_array import DualArray
 
     
 def test_init() -> None:
@@ -195,7 +197,171 @@ def test_dual_exp_derivative() -> None:
     dual = Dual(1, 1)
     assert dual.exp_derivative(2) == np.exp(2)
 
+def test_dual_derivative_array() -> None:
+    def f(x):
+        return np.log(np.sin(x)) + x**2 * np.cos(x)
+
+    x = np.linspace(0.5, 1.5, 5)
+    d_dx = Dual.derivative(f, x)
+    expected = 1 / np.tan(x) + 2 * x * np.cos(x) - x**2 * np.sin(x)
+    assert isinstance(d_dx, np.ndarray)
+    assert d_dx.shape == x.shape
+    assert np.allclose(d_dx, expected)
+
+def test_dual_derivative_array_fallback() -> None:
+    # Branching on the input cannot be vectorised, so each point is evaluated separately
+    def f(x):
+        return x * 3 if x.real > 0 else x * 2
+
+    d_dx = Dual.derivative(f, np.array([-1.0, 2.0]))
+    assert np.array_equal(d_dx, [2, 3])
+
+def test_dual_derivative_array_math_fallback() -> None:
+    # math functions need single numbers, so each point is evaluated separately
+    d_dx = Dual.derivative(lambda x: x * math.cos(x.real), np.array([0.0, 1.0]))
+    assert np.allclose(d_dx, np.cos([0.0, 1.0]))
+
+def test_dual_derivative_array_errors_propagate() -> None:
+    # Errors other than needing single numbers are not retried point by point
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        raise ValueError("bug in f")
+
+    with pytest.raises(ValueError, match="bug in f"):
+        Dual.derivative(f, np.array([1.0, 2.0]))
+    assert len(calls) == 1
+
+def test_dual_sin_derivative_array() -> None:
+    x = np.array([0, np.pi])
+    assert np.allclose(Dual.sin_derivative(x), [1, -1])
+
+def test_scalar_functions_use_math() -> None:
+    # Plain floats stay plain floats rather than becoming NumPy scalars
+    result = Dual(0.5, 1).sin().exp()
+    assert type(result.real) is float
+    assert type(result.dual) is float
+    assert result.real == pytest.approx(np.exp(np.sin(0.5)))
+
+def test_array_parts_use_numpy() -> None:
+    result = Dual(np.array([0.0, np.pi / 2]), np.ones(2)).sin()
+    assert np.allclose(result.real, [0.0, 1.0])
+    assert np.allclose(result.dual, [1.0, 0.0])
+
+def test_slots() -> None:
+    dual = Dual(1, 2)
+    assert not hasattr(dual, "__dict__")
+    with pytest.raises(AttributeError):
+        dual.other = 3
+
+def test_number_fast_paths_match_dual_operands() -> None:
+    x = Dual(3.0, 2.0)
+    for c in (2, 0.5, -4.0):
+        for op in (lambda a, b: a + b, lambda a, b: a - b, lambda a, b: a * b, lambda a, b: a / b):
+            fast, slow = op(x, c), op(x, Dual(c))
+            assert (fast.real, fast.dual) == pytest.approx((slow.real, slow.dual))
+            fast, slow = op(c, x), op(Dual(c), x)
+            assert (fast.real, fast.dual) == pytest.approx((slow.real, slow.dual))
+
+@pytest.mark.parametrize("name,func,deriv", [
+    ("sqrt", np.sqrt, lambda x: 0.5 / np.sqrt(x)),
+    ("tanh", np.tanh, lambda x: 1 - np.tanh(x) ** 2),
+    ("sigmoid", lambda x: 1 / (1 + np.exp(-x)), lambda x: np.exp(-x) / (1 + np.exp(-x)) ** 2),
+    ("arcsin", np.arcsin, lambda x: 1 / np.sqrt(1 - x**2)),
+    ("arctan", np.arctan, lambda x: 1 / (1 + x**2)),
+    ("abs", np.abs, np.sign),
+    ("erf", lambda x: np.vectorize(math.erf)(x), lambda x: 2 / np.sqrt(np.pi) * np.exp(-x**2)),
+])
+def test_extra_functions(name, func, deriv) -> None:
+    for x in (0.3, -0.6):
+        if name == "sqrt" and x < 0:
+            continue
+        result = getattr(Dual(x, 2.0), name)()
+        assert result.real == pytest.approx(func(x))
+        assert result.dual == pytest.approx(2 * deriv(x))
+    xs = np.array([0.2, 0.4, 0.7])
+    assert np.allclose(getattr(Dual, name + "_derivative")(xs), deriv(xs))
+
+def test_extra_function_domains() -> None:
+    with pytest.raises(ValueError):
+        Dual(0.0, 1.0).sqrt()
+    with pytest.raises(ValueError):
+        Dual(1.0, 1.0).arcsin()
+    assert abs(Dual(-2.0, 1.0)).dual == -1.0
+    assert Dual(0.0, 1.0).abs().dual == 0.0
+    # The sigmoid does not overflow for large arguments
+    assert Dual(-1000.0, 1.0).sigmoid().real == 0.0
+
+def test_augmented_assignment_keeps_aliases() -> None:
+    # Dual numbers are values: +=, -=, *= and /= rebind the name and leave other references unchanged
+    a = Dual(1.0, 1.0)
+    b = a
+    b += 1
+    b -= Dual(0.5, 2.0)
+    b *= b
+    b /= 2
+    assert b is not a
+    assert (a.real, a.dual) == (1.0, 1.0)
+
+    def f(x):
+        y = x
+        y *= x
+        return y + x
+
+    # d/dx (x ** 2 + x) = 2x + 1
+    assert Dual.derivative(f, 3.0) == 7.0
+
+def test_reductions() -> None:
+    reals, duals = [2.0, 0.0, 3.0, 5.0], [1.0, 2.0, 3.0, 4.0]
+    xs = [Dual(a, b) for a, b in zip(reals, duals)]
+    total = Dual(0.0)
+    product = Dual(1.0)
+    dot = Dual(0.0)
+    for x in xs:
+        total = total + x
+        product = product * x
+        dot = dot + x * x
+    for result, expected in ((dual_sum(xs), total), (dual_prod(xs), product), (dual_dot(xs, xs), dot)):
+        assert (result.real, result.dual) == pytest.approx((expected.real, expected.dual))
+    # Plain numbers count as c + 0ε, and generators are traversed once
+    mixed = dual_sum(x for x in [Dual(1.0, 2.0), 3])
+    assert (mixed.real, mixed.dual) == (4.0, 2.0)
+    weighted = dual_dot(xs, reals)
+    assert (weighted.real, weighted.dual) == pytest.approx((38.0, 31.0))
+    assert (dual_sum([]).real, dual_prod([]).real) == (0.0, 1.0)
+    with pytest.raises(ValueError):
+        dual_dot(xs, reals[:2])
+
+def test_reductions_of_arrays_match_sequences() -> None:
+    reals, duals = np.array([2.0, 0.0, 3.0, 5.0]), np.array([1.0, 2.0, 3.0, 4.0])
+    array = DualArray(reals, duals)
+    xs = array.to_duals()
+    for reduce in (dual_sum, dual_prod, lambda v: dual_dot(v, v), lambda v: dual_dot(v, reals)):
+        fast, slow = reduce(array), reduce(xs)
+        assert isinstance(fast.real, float)
+        assert (fast.real, fast.dual) == pytest.approx((slow.real, slow.dual))
+    with pytest.raises(ValueError):
+        dual_dot(array, reals[:2])
+
+def test_neg() -> None:
+    result = -Dual(1.0, 2.0)
+    assert (result.real, result.dual) == (-1.0, -2.0)
+    assert Dual.derivative(lambda x: -x * x, 3.0) == -6.0
+
+def test_scalar_edge_cases_match_numpy() -> None:
+    # Plain numbers use math, but overflow and invalid inputs give NumPy's inf or nan (with a warning) rather than
+    # raising
+    with pytest.warns(RuntimeWarning):
+        result = Dual(1000, 1.0).exp()
+    assert result.real == np.inf and result.dual == np.inf
+    with pytest.warns(RuntimeWarning):
+        result = Dual(np.inf, 1.0).sin()
+    assert np.isnan(result.real) and np.isnan(result.dual)
+    with pytest.warns(RuntimeWarning):
+        result = 0.0 ** Dual(2.0, 1.0)
+    assert result.real == 0.0 and np.isnan(result.dual)
+
 
-    
 if __name__ == "__main__":
-    pytest.main()
\ No newline at end of file
+    pytest.main()
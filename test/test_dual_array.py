@@ -0,0 +1,149 @@
+import math
+import pytest
+import numpy as np
+from dual_autodiff.dual import Dual
+from dual_autodiff.dual_array import DualArray, NotVectorisableError
+
+
+def test_init() -> None:
+    arr = DualArray([1, 2, 3], [4, 5, 6])
+    assert arr.real.dtype == np.float64
+    assert arr.dual.dtype == np.float64
+    assert arr.shape == (3,)
+    assert np.array_equal(arr.dual, [4, 5, 6])
+
+def test_init_real_only() -> None:
+    arr = DualArray([1, 2])
+    assert np.array_equal(arr.dual, [0, 0])
+
+def test_getitem() -> None:
+    arr = DualArray([1, 2, 3], [4, 5, 6])
+    elem = arr[1]
+    assert isinstance(elem, Dual)
+    assert elem.real == 2
+    assert elem.dual == 5
+    assert isinstance(arr[1:], DualArray)
+
+def test_from_duals() -> None:
+    arr = DualArray.from_duals([Dual(1, 2), Dual(3, 4)])
+    assert np.array_equal(arr.real, [1, 3])
+    assert np.array_equal(arr.dual, [2, 4])
+
+def test_add_sub() -> None:
+    arr = DualArray([3, 5], [4, 6])
+    addition = arr + DualArray([5, 1], [6, 1])
+    assert np.array_equal(addition.real, [8, 6])
+    assert np.array_equal(addition.dual, [10, 7])
+    sub = 5 - arr
+    assert np.array_equal(sub.real, [2, 0])
+    assert np.array_equal(sub.dual, [-4, -6])
+
+def test_mul_dual_scalar() -> None:
+    arr = DualArray([2, 3], [3, 1])
+    prod = arr * Dual(4, 5)
+    assert np.array_equal(prod.real, [8, 12])
+    assert np.array_equal(prod.dual, [22, 19])
+
+def test_rmul_ndarray() -> None:
+    arr = DualArray([2, 3], [3, 1])
+    prod = np.array([2.0, 3.0]) * arr
+    assert isinstance(prod, DualArray)
+    assert np.array_equal(prod.dual, [6, 3])
+
+def test_div() -> None:
+    arr = DualArray([3], [4]) / DualArray([1], [2])
+    assert arr.real[0] == 3
+    assert arr.dual[0] == -2
+    rdiv = 4 / DualArray([3], [4])
+    assert rdiv.real[0] == (4 / 3)
+    assert rdiv.dual[0] == (-16 / 9)
+
+def test_pow() -> None:
+    power = DualArray([1], [2]) ** Dual(3, 4)
+    assert power.real[0] == 1
+    assert power.dual[0] == 6
+    power = DualArray([1], [2]) ** 2
+    assert power.dual[0] == 4
+    power = 2 ** DualArray([1], [2])
+    assert power.dual[0] == 4 * np.log(2)
+
+def test_pow_negative_base() -> None:
+    with pytest.raises(ValueError):
+        DualArray([-1], [1]) ** Dual(2, 1)
+
+def test_log_non_positive() -> None:
+    with pytest.raises(ValueError):
+        DualArray([1, 0], [1, 1]).log()
+
+def test_functions_match_dual() -> None:
+    x = np.linspace(0.1, 1.2, 7)
+    arr = DualArray(x, 2.0)
+    for name in ["sin", "cos", "tan", "log", "exp"]:
+        result = getattr(arr, name)()
+        expected = [getattr(Dual(v, 2.0), name)() for v in x]
+        assert np.allclose(result.real, [e.real for e in expected])
+        assert np.allclose(result.dual, [e.dual for e in expected])
+
+def test_numpy_ufuncs() -> None:
+    arr = DualArray([1.5], [1.0])
+    result = np.log(np.sin(arr)) + arr**2 * np.cos(arr)
+    expected = (1 / np.tan(1.5)) + 2 * 1.5 * np.cos(1.5) - 1.5**2 * np.sin(1.5)
+    assert isinstance(result, DualArray)
+    assert pytest.approx(result.dual[0]) == expected
+
+def test_parts_are_writable() -> None:
+    array = DualArray(np.zeros(3), np.ones(3))
+    array[0] = Dual(1.0, 2.0)
+    assert array.dual[0] == 2.0
+    seeded = DualArray(np.zeros(1), 1.0)
+    seeded.dual[0] = 3.0
+    assert seeded.dual[0] == 3.0
+
+def test_float32_storage() -> None:
+    x = DualArray(np.linspace(0.1, 1, 5), 1.0, dtype=np.float32)
+    assert x.real.dtype == x.dual.dtype == np.float32
+    y = (x * x + 2.0).sin() / x
+    assert y.real.dtype == y.dual.dtype == np.float32
+    assert x[1:3].real.dtype == np.float32
+    expected = DualArray(np.linspace(0.1, 1, 5), 1.0)
+    expected = (expected * expected + 2.0).sin() / expected
+    assert np.allclose(y.dual, expected.dual, rtol=1e-5)
+
+def test_mixed_precision() -> None:
+    x = DualArray(np.linspace(0.1, 1, 5), 1.0, dual_dtype=np.float32)
+    y = (x**3).exp()
+    assert y.real.dtype == np.float64
+    assert y.dual.dtype == np.float32
+    full = DualArray(np.linspace(0.1, 1, 5), 1.0)
+    assert np.array_equal(y.real, (full**3).exp().real)
+
+def test_precision_promotes() -> None:
+    single = DualArray([1.0, 2.0], 1.0, dtype=np.float32)
+    double = DualArray([1.0, 2.0], 1.0)
+    assert (single * double).real.dtype == np.float64
+    assert (double + single).dual.dtype == np.float64
+    assert single.astype(np.float64).real.dtype == np.float64
+
+def test_invalid_precision() -> None:
+    with pytest.raises(ValueError):
+        DualArray([1.0], dtype=np.float16)
+    with pytest.raises(ValueError):
+        DualArray([1.0], dual_dtype=np.int64)
+
+def test_extra_functions_match_dual() -> None:
+    xs = np.array([-0.5, 0.1, 0.6])
+    array = DualArray(xs, 1.0)
+    for name in ("tanh", "sigmoid", "arcsin", "arctan", "abs", "erf"):
+        result = getattr(array, name)()
+        for i, x in enumerate(xs):
+            expected = getattr(Dual(x, 1.0), name)()
+            assert result.real[i] == pytest.approx(expected.real)
+            assert result.dual[i] == pytest.approx(expected.dual)
+    assert np.allclose(np.sqrt(DualArray([4.0], 1.0)).dual, 0.25)
+    assert np.allclose(abs(DualArray([-1.0], 1.0)).dual, -1.0)
+
+def test_not_a_single_number() -> None:
+    with pytest.raises(NotVectorisableError):
+        float(DualArray([1.0, 2.0]))
+    with pytest.raises(TypeError):
+        math.sin(DualArray([1.0]))
@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+from dual_autodiff import hyper_dual
+
+
+# Every test runs against the pure-Python class and, when dual_autodiff_x is installed, the Cython port
+@pytest.fixture(params=["python", "cython"])
+def HyperDual(request):
+    if request.param == "python":
+        return hyper_dual.HyperDual
+    return pytest.importorskip("dual_autodiff_x.hyper_dual").HyperDual
+
+
+def test_init(HyperDual) -> None:
+    hd = HyperDual(1, 2, 3, 4)
+    assert (hd.real, hd.eps1, hd.eps2, hd.eps12) == (1, 2, 3, 4)
+
+def test_add_sub(HyperDual) -> None:
+    hd = HyperDual(1, 2, 3, 4) + HyperDual(5, 6, 7, 8)
+    assert (hd.real, hd.eps1, hd.eps2, hd.eps12) == (6, 8, 10, 12)
+    hd = 10 - HyperDual(1, 2, 3, 4)
+    assert (hd.real, hd.eps1, hd.eps2, hd.eps12) == (9, -2, -3, -4)
+
+def test_mul(HyperDual) -> None:
+    hd = HyperDual(2, 1, 1, 0) * HyperDual(2, 1, 1, 0)
+    assert (hd.real, hd.eps1, hd.eps2, hd.eps12) == (4, 4, 4, 2)
+
+def test_div(HyperDual) -> None:
+    hd = 1 / HyperDual(2, 1, 1, 0)
+    assert hd.real == 0.5
+    assert hd.eps1 == -0.25
+    assert hd.eps12 == 0.25
+
+def test_pow(HyperDual) -> None:
+    hd = HyperDual(3, 1, 1, 0) ** 3
+    assert (hd.real, hd.eps1, hd.eps2, hd.eps12) == (27, 27, 27, 18)
+    hd = HyperDual(0, 1, 1, 0) ** 1
+    assert hd.eps12 == 0
+
+def test_pow_negative_base(HyperDual) -> None:
+    with pytest.raises(ValueError):
+        HyperDual(-1, 1, 1, 0) ** HyperDual(2)
+
+def test_log_non_positive(HyperDual) -> None:
+    with pytest.raises(ValueError):
+        HyperDual(0).log()
+
+@pytest.mark.parametrize(
+    "name, second",
+    [
+        ("sin", lambda a: -np.sin(a)),
+        ("cos", lambda a: -np.cos(a)),
+        ("tan", lambda a: 2 * np.tan(a) / np.cos(a) ** 2),
+        ("log", lambda a: -1 / a**2),
+        ("exp", np.exp),
+    ],
+)
+def test_functions_second_derivative(HyperDual, name, second) -> None:
+    d2 = HyperDual.second_derivative(lambda x: getattr(x, name)(), 0.7)
+    assert pytest.approx(d2) == second(0.7)
+
+def test_second_derivative(HyperDual) -> None:
+    def f(x):
+        return np.log(np.sin(x)) + x**2 * np.cos(x)
+
+    a = 1.5
+    expected = -1 / np.sin(a) ** 2 + 2 * np.cos(a) - 4 * a * np.sin(a) - a**2 * np.cos(a)
+    assert pytest.approx(HyperDual.second_derivative(f, a)) == expected
+
+def test_rpow_second_derivative(HyperDual) -> None:
+    assert pytest.approx(HyperDual.second_derivative(lambda x: 2**x, 1.0)) == 2 * np.log(2) ** 2
+
+def test_hessian(HyperDual) -> None:
+    def f(x):
+        return x[0] ** 2 * x[1] + np.exp(x[1]) * x[2]
+
+    hess = HyperDual.hessian(f, [1.0, 2.0, 3.0])
+    expected = np.array([
+        [2 * 2.0, 2 * 1.0, 0.0],
+        [2 * 1.0, np.exp(2.0) * 3.0, np.exp(2.0)],
+        [0.0, np.exp(2.0), 0.0],
+    ])
+    assert np.allclose(hess, expected)
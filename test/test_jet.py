@@ -0,0 +1,77 @@
+from math import factorial
+
+import pytest
+import numpy as np
+from dual_autodiff.jet import Jet
+
+
+def test_init() -> None:
+    jet = Jet([1, 2, 3])
+    assert jet.order == 2
+    assert jet.real == 1
+    assert jet.coeffs.dtype == np.float64
+
+def test_add_sub() -> None:
+    jet = Jet([1, 2, 3]) + 4
+    assert np.array_equal(jet.coeffs, [5, 2, 3])
+    jet = 4 - Jet([1, 2, 3])
+    assert np.array_equal(jet.coeffs, [3, -2, -3])
+
+def test_mismatched_order() -> None:
+    with pytest.raises(ValueError):
+        Jet([1, 2]) + Jet([1, 2, 3])
+
+def test_mul() -> None:
+    # (1 + h) * (1 + h) = 1 + 2h + h^2
+    jet = Jet([1, 1, 0]) * Jet([1, 1, 0])
+    assert np.array_equal(jet.coeffs, [1, 2, 1])
+
+def test_div() -> None:
+    # 1 / (1 - h) = 1 + h + h^2 + h^3
+    jet = 1 / Jet([1, -1, 0, 0])
+    assert np.allclose(jet.coeffs, [1, 1, 1, 1])
+
+def test_pow() -> None:
+    derivs = Jet.taylor(lambda x: x**3, 2.0, order=4)
+    assert np.allclose(derivs, [8, 12, 12, 6, 0])
+    derivs = Jet.taylor(lambda x: x**3, 0.0, order=4)
+    assert np.allclose(derivs, [0, 0, 0, 6, 0])
+    derivs = Jet.taylor(lambda x: x**0.5, 4.0, order=2)
+    assert np.allclose(derivs, [2, 0.25, -1 / 32])
+
+def test_rpow() -> None:
+    derivs = Jet.taylor(lambda x: 2**x, 1.0, order=3)
+    assert np.allclose(derivs, 2 * np.log(2) ** np.arange(4))
+
+def test_log_non_positive() -> None:
+    with pytest.raises(ValueError):
+        Jet([0, 1]).log()
+
+@pytest.mark.parametrize(
+    "name, derivs",
+    [
+        ("sin", [np.sin(0.3), np.cos(0.3), -np.sin(0.3), -np.cos(0.3), np.sin(0.3)]),
+        ("cos", [np.cos(0.3), -np.sin(0.3), -np.cos(0.3), np.sin(0.3), np.cos(0.3)]),
+        ("exp", [np.exp(0.3)] * 5),
+        ("log", [np.log(0.3)] + [(-1) ** (n - 1) * factorial(n - 1) / 0.3**n for n in range(1, 5)]),
+    ],
+)
+def test_functions(name, derivs) -> None:
+    assert np.allclose(Jet.taylor(lambda x: getattr(x, name)(), 0.3, order=4), derivs)
+
+def test_tan() -> None:
+    t = np.tan(0.3)
+    sec2 = 1 + t**2
+    expected = [t, sec2, 2 * t * sec2, 2 * sec2 * (1 + 3 * t**2)]
+    assert np.allclose(Jet.taylor(lambda x: x.tan(), 0.3, order=3), expected)
+
+def test_taylor_composite() -> None:
+    def f(x):
+        return np.log(np.sin(x)) + x**2 * np.cos(x)
+
+    a = 1.5
+    derivs = Jet.taylor(f, a, order=2)
+    assert pytest.approx(derivs[1]) == 1 / np.tan(a) + 2 * a * np.cos(a) - a**2 * np.sin(a)
+    assert pytest.approx(derivs[2]) == (
+        -1 / np.sin(a) ** 2 + 2 * np.cos(a) - 4 * a * np.sin(a) - a**2 * np.cos(a)
+    )
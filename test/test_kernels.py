@@ -0,0 +1,112 @@
+import pytest
+import numpy as np
+from dual_autodiff.dual import Dual
+
+kernels = pytest.importorskip("dual_autodiff_x.kernels")
+
+N = 1001
+PRECISIONS = [(np.float64, np.float64), (np.float32, np.float32), (np.float64, np.float32)]
+
+
+def tolerance(dtype) -> float:
+    return 1e-12 if dtype == np.float64 else 1e-5
+
+def parts(real_dtype, dual_dtype, low=0.1, high=0.9, seed=0):
+    rng = np.random.default_rng(seed)
+    real = rng.uniform(low, high, N).astype(real_dtype)
+    dual = rng.uniform(-1.0, 1.0, N).astype(dual_dtype)
+    return real, dual
+
+# Expected (real, dual) parts computed with NumPy in float64
+BINARY = {
+    "add": lambda a, b, c, d: (a + c, b + d),
+    "sub": lambda a, b, c, d: (a - c, b - d),
+    "mul": lambda a, b, c, d: (a * c, a * d + b * c),
+    "div": lambda a, b, c, d: (a / c, (b * c - a * d) / c**2),
+    "pow": lambda a, b, c, d: (a**c, a ** (c - 1) * (b * c + a * d * np.log(a))),
+}
+UNARY = {
+    "sin": lambda a, b: (np.sin(a), np.cos(a) * b),
+    "cos": lambda a, b: (np.cos(a), -np.sin(a) * b),
+    "tan": lambda a, b: (np.tan(a), b / np.cos(a) ** 2),
+    "log": lambda a, b: (np.log(a), b / a),
+    "exp": lambda a, b: (np.exp(a), np.exp(a) * b),
+}
+
+@pytest.fixture(autouse=True)
+def restore_threads():
+    threads = kernels.get_num_threads()
+    yield
+    kernels.set_num_threads(max(threads, 1))
+
+@pytest.mark.parametrize("parallel", [False, True])
+@pytest.mark.parametrize("real_dtype,dual_dtype", PRECISIONS)
+@pytest.mark.parametrize("name", list(BINARY))
+def test_binary_kernels_match_numpy(name, real_dtype, dual_dtype, parallel) -> None:
+    kernels.set_num_threads(4)
+    xr, xd = parts(real_dtype, dual_dtype, seed=1)
+    yr, yd = parts(real_dtype, dual_dtype, seed=2)
+    out_r, out_d = np.empty_like(xr), np.empty_like(xd)
+    getattr(kernels, name)(xr, xd, yr, yd, out_r, out_d, parallel=parallel)
+    real, dual = BINARY[name](*(v.astype(np.float64) for v in (xr, xd, yr, yd)))
+    assert out_r.dtype == real_dtype and out_d.dtype == dual_dtype
+    assert np.allclose(out_r, real, rtol=tolerance(real_dtype), atol=0)
+    assert np.allclose(out_d, dual, rtol=tolerance(dual_dtype), atol=tolerance(dual_dtype))
+
+@pytest.mark.parametrize("parallel", [False, True])
+@pytest.mark.parametrize("real_dtype,dual_dtype", PRECISIONS)
+@pytest.mark.parametrize("name", list(UNARY))
+def test_unary_kernels_match_numpy(name, real_dtype, dual_dtype, parallel) -> None:
+    kernels.set_num_threads(4)
+    xr, xd = parts(real_dtype, dual_dtype)
+    out_r, out_d = np.empty_like(xr), np.empty_like(xd)
+    getattr(kernels, name)(xr, xd, out_r, out_d, parallel=parallel)
+    real, dual = UNARY[name](xr.astype(np.float64), xd.astype(np.float64))
+    assert np.allclose(out_r, real, rtol=tolerance(real_dtype), atol=0)
+    assert np.allclose(out_d, dual, rtol=tolerance(dual_dtype), atol=tolerance(dual_dtype))
+
+@pytest.mark.parametrize("parallel", [False, True])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("name", list(UNARY))
+def test_derivative_matches_numpy(name, dtype, parallel) -> None:
+    kernels.set_num_threads(3)
+    x, _ = parts(dtype, dtype)
+    out = np.empty_like(x)
+    kernels.derivative(name, x, out, parallel=parallel)
+    expected = UNARY[name](x.astype(np.float64), np.ones(N))[1]
+    assert out.dtype == dtype
+    assert np.allclose(out, expected, rtol=tolerance(dtype), atol=0)
+
+def test_outputs_may_alias_inputs() -> None:
+    xr, xd = parts(np.float64, np.float64)
+    real, dual = UNARY["sin"](xr, xd)
+    kernels.sin(xr, xd, xr, xd)
+    assert np.allclose(xr, real) and np.allclose(xd, dual)
+
+def test_errors() -> None:
+    xr, xd = parts(np.float64, np.float64)
+    with pytest.raises(ValueError):
+        kernels.add(xr, xd, xr[:-1], xd[:-1], np.empty_like(xr), np.empty_like(xd))
+    with pytest.raises(ValueError, match="ln must be positive"):
+        kernels.log(-xr, xd, np.empty_like(xr), np.empty_like(xd))
+    with pytest.raises(ValueError, match="ln must be positive"):
+        kernels.derivative("log", -xr, np.empty_like(xr))
+    with pytest.raises(ValueError):
+        kernels.pow(-xr, xd, xr, xd, np.empty_like(xr), np.empty_like(xd))
+    # As Dual ** Dual, a negative base raises even where the exponent has no dual part
+    with pytest.raises(ValueError, match="base cannot be negative"):
+        Dual(-xr[0], 1.0) ** Dual(2.0, 0.0)
+    with pytest.raises(ValueError, match="base cannot be negative"):
+        kernels.pow(-xr, xd, np.full(N, 2.0), np.zeros(N), np.empty_like(xr), np.empty_like(xd))
+    with pytest.raises(ValueError):
+        kernels.derivative("sinh", xr, np.empty_like(xr))
+    # Real buffers must share one type, as must dual buffers
+    with pytest.raises(ValueError, match="Buffer dtype mismatch"):
+        kernels.sin(xr, xd, np.empty(N, dtype=np.float32), np.empty_like(xd))
+
+def test_threads() -> None:
+    assert isinstance(kernels.openmp_enabled(), bool)
+    kernels.set_num_threads(2)
+    assert kernels.get_num_threads() == (2 if kernels.openmp_enabled() else 1)
+    with pytest.raises(ValueError):
+        kernels.set_num_threads(0)
@@ -0,0 +1,94 @@
+import tracemalloc
+
+import pytest
+import numpy as np
+from dual_autodiff.dual_array import DualArray
+from dual_autodiff.lazy import LazyDualArray, lazy_evaluate
+
+
+def demo(x):
+    return np.log(np.sin(x)) + x**2 * np.cos(x)
+
+def test_matches_eager() -> None:
+    x = np.linspace(0.1, 3.0, 1001)
+    lazy = lazy_evaluate(demo, x, block_size=64)
+    eager = demo(DualArray(x, 1.0))
+    assert np.allclose(lazy.real, eager.real)
+    assert np.allclose(lazy.dual, eager.dual)
+
+@pytest.mark.parametrize("func", [
+    lambda x: 2 - x / 3 + 1 / x,
+    lambda x: (x * x - x).exp() * x.tan(),
+    lambda x: -x ** 0.5 + 2 ** x,
+    lambda x: x ** x,
+    lambda x: x,
+])
+def test_operations(func) -> None:
+    x = np.linspace(0.2, 1.2, 37)
+    lazy = lazy_evaluate(func, x, block_size=8)
+    eager = func(DualArray(x, 1.0))
+    assert np.allclose(lazy.real, eager.real)
+    assert np.allclose(lazy.dual, eager.dual)
+
+@pytest.mark.parametrize("name", ["sqrt", "tanh", "sigmoid", "arcsin", "arctan", "abs", "erf"])
+def test_functions_match_eager(name) -> None:
+    x = np.linspace(-0.9, 0.9, 37) if name != "sqrt" else np.linspace(0.1, 2.0, 37)
+    lazy = lazy_evaluate(lambda v: getattr(v, name)() * v, x, block_size=8)
+    eager = getattr(DualArray(x, 1.0), name)() * DualArray(x, 1.0)
+    assert np.allclose(lazy.real, eager.real)
+    assert np.allclose(lazy.dual, eager.dual)
+
+def test_numpy_ufuncs() -> None:
+    x = np.linspace(0.1, 0.9, 11)
+    for ufunc in (np.sqrt, np.tanh, np.arcsin, np.arctan, np.absolute):
+        lazy = lazy_evaluate(ufunc, x)
+        eager = ufunc(DualArray(x, 1.0))
+        assert np.allclose(lazy.real, eager.real)
+        assert np.allclose(lazy.dual, eager.dual)
+    assert np.array_equal(lazy_evaluate(abs, [-1.0, 0.0, 2.0]).dual, [-1.0, 0.0, 1.0])
+
+def test_float32_input_keeps_precision() -> None:
+    x = np.linspace(0.1, 3.0, 101, dtype=np.float32)
+    result = lazy_evaluate(demo, x, block_size=16)
+    assert result.real.dtype == np.float32 and result.dual.dtype == np.float32
+    eager = demo(DualArray(x, 1.0, dtype=np.float32))
+    assert np.allclose(result.real, eager.real, rtol=1e-5)
+    assert np.allclose(result.dual, eager.dual, rtol=1e-5, atol=1e-5)
+    constant = lazy_evaluate(lambda v: 2.0, x)
+    assert constant.real.dtype == np.float32 and np.array_equal(constant.real, np.full(101, 2.0))
+
+def test_multiple_inputs_and_shape() -> None:
+    x = np.linspace(1, 2, 12).reshape(3, 4)
+    y = LazyDualArray.input(np.ones((3, 4)) * 2)
+    result = (LazyDualArray.input(x, np.ones((3, 4))) * y + np.ones((3, 4))).evaluate(block_size=5)
+    assert result.shape == (3, 4)
+    assert np.allclose(result.real, 2 * x + 1)
+    assert np.allclose(result.dual, 2)
+
+def test_errors() -> None:
+    with pytest.raises(ValueError):
+        lazy_evaluate(lambda x: x.log(), [-1.0, 1.0])
+    with pytest.raises(ValueError):
+        (LazyDualArray.input(np.ones(3)) + LazyDualArray.input(np.ones(4))).evaluate()
+    with pytest.raises(ValueError):
+        lazy_evaluate(demo, [1.0], block_size=0)
+    with pytest.raises(ValueError, match="sqrt must be positive"):
+        lazy_evaluate(lambda x: x.sqrt(), [0.0, 1.0])
+    with pytest.raises(ValueError, match="arcsin"):
+        lazy_evaluate(lambda x: x.arcsin(), [0.5, 1.0])
+    # Operands are not broadcast
+    with pytest.raises(ValueError, match="same shape"):
+        lazy_evaluate(lambda x: x * np.ones((2, 3)), np.ones(3))
+
+def test_no_full_size_temporaries() -> None:
+    x = np.linspace(0.1, 3.0, 200_000)
+    tracemalloc.start()
+    lazy_evaluate(demo, x)
+    lazy_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    tracemalloc.start()
+    demo(DualArray(x, 1.0))
+    eager_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    # The output and seed take 3 arrays of x.nbytes; the eager version holds several more temporaries
+    assert lazy_peak < 4 * x.nbytes < eager_peak
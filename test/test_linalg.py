@@ -0,0 +1,85 @@
+import pytest
+import numpy as np
+from dual_autodiff.dual import Dual
+from dual_autodiff.dual_array import DualArray
+from dual_autodiff.linalg import dot, matmul, solve
+
+
+rng = np.random.default_rng(7)
+A = rng.normal(size=(4, 4)) + 4 * np.eye(4)
+dA = rng.normal(size=(4, 4))
+B = rng.normal(size=(4, 3))
+dB = rng.normal(size=(4, 3))
+b = rng.normal(size=4)
+db = rng.normal(size=4)
+
+def finite_difference(func, h=1e-6):
+    return (func(h) - func(-h)) / (2 * h)
+
+def test_matmul() -> None:
+    result = matmul(DualArray(A, dA), DualArray(B, dB))
+    assert np.allclose(result.real, A @ B)
+    assert np.allclose(result.dual, finite_difference(lambda t: (A + t * dA) @ (B + t * dB)))
+
+def test_matmul_operator_and_constant_operands() -> None:
+    x = DualArray(B, dB)
+    assert np.allclose((A @ x).dual, A @ dB)
+    assert np.allclose((DualArray(B.T, dB.T) @ A).dual, dB.T @ A)
+    assert np.allclose(np.matmul(A, x).dual, A @ dB)
+    assert np.allclose(matmul(A, B).dual, 0)
+
+def test_dot_vectors_and_duals() -> None:
+    u = [Dual(1.0, 1.0), Dual(2.0, 0.0)]
+    v = np.array([3.0, 4.0])
+    result = dot(np.array(u, dtype=object), v)
+    assert (result.real, result.dual) == (11.0, 3.0)
+
+def test_vector_products_are_scalars() -> None:
+    # As np.dot, the product of two vectors is a single number (a Dual, as for a DualArray element)
+    u, v = DualArray([1.0, 2.0], [1.0, 0.0]), DualArray([3.0, 4.0], [0.0, 1.0])
+    for result in (dot(u, v), matmul(u, v), u @ v, dot([1.0, 2.0], [3.0, 4.0])):
+        assert isinstance(result, Dual)
+    assert (dot(u, v).real, dot(u, v).dual) == (11.0, 5.0)
+    assert dot(DualArray(B.T, dB.T), b).shape == (3,)
+
+def test_mixed_lists() -> None:
+    # Plain numbers among Duals have no tangent
+    result = dot([Dual(1.0, 1.0), 2.0], [3.0, 4.0])
+    assert (result.real, result.dual) == (11.0, 3.0)
+    result = matmul(np.array([[Dual(1.0, 1.0), 2], [0, Dual(3.0, 2.0)]], dtype=object), np.eye(2))
+    assert np.array_equal(result.real, [[1.0, 2.0], [0.0, 3.0]])
+    assert np.array_equal(result.dual, [[1.0, 0.0], [0.0, 2.0]])
+
+@pytest.mark.parametrize("dtype,dual_dtype", [(np.float32, np.float32), (np.float64, np.float32)])
+def test_precision_is_kept(dtype, dual_dtype) -> None:
+    a = DualArray(A, dA, dtype=dtype, dual_dtype=dual_dtype)
+    rhs = DualArray(b, db, dtype=dtype, dual_dtype=dual_dtype)
+    for result in (matmul(a, B), dot(B.T, a), solve(a, b), solve(A, rhs)):
+        assert result.real.dtype == dtype and result.dual.dtype == dual_dtype
+    # Operands of different precision give the wider one, as for the elementwise operators
+    result = matmul(a, DualArray(B, dB))
+    assert result.real.dtype == np.float64 and result.dual.dtype == np.float64
+    assert matmul(A, B).real.dtype == np.float64
+
+@pytest.mark.parametrize("a_dual,b_dual", [(True, True), (True, False), (False, True), (False, False)])
+def test_solve(a_dual, b_dual) -> None:
+    da = dA if a_dual else np.zeros_like(A)
+    dbv = db if b_dual else np.zeros_like(b)
+    a = DualArray(A, dA) if a_dual else A
+    rhs = DualArray(b, db) if b_dual else b
+    result = solve(a, rhs)
+    assert np.allclose(result.real, np.linalg.solve(A, b))
+    expected = finite_difference(lambda t: np.linalg.solve(A + t * da, b + t * dbv))
+    assert np.allclose(result.dual, expected, atol=1e-6)
+
+def test_solve_matrix_rhs() -> None:
+    result = solve(DualArray(A, dA), DualArray(B, dB))
+    assert result.shape == (4, 3)
+    expected = finite_difference(lambda t: np.linalg.solve(A + t * dA, B + t * dB))
+    assert np.allclose(result.dual, expected, atol=1e-6)
+
+def test_solve_singular() -> None:
+    with pytest.raises(np.linalg.LinAlgError):
+        solve(DualArray(np.ones((2, 2)), np.eye(2)), np.ones(2))
+    with pytest.raises(np.linalg.LinAlgError):
+        solve(np.ones((2, 3)), np.ones(2))
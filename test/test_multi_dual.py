@@ -0,0 +1,114 @@
+import pytest
+import numpy as np
+from dual_autodiff import multi_dual
+
+
+# Every test runs against the pure-Python class and, when dual_autodiff_x is installed, the Cython port
+@pytest.fixture(params=["python", "cython"])
+def MultiDual(request):
+    if request.param == "python":
+        return multi_dual.MultiDual
+    return pytest.importorskip("dual_autodiff_x.multi_dual").MultiDual
+
+
+def test_init(MultiDual) -> None:
+    md = MultiDual(1, [2, 3])
+    assert md.real == 1
+    assert md.dual.dtype == np.float64
+    assert np.array_equal(md.dual, [2, 3])
+
+def test_seed(MultiDual) -> None:
+    seeded = MultiDual.seed([1.0, 2.0, 3.0])
+    assert [s.real for s in seeded] == [1, 2, 3]
+    assert np.array_equal(seeded[1].dual, [0, 1, 0])
+
+def test_add_sub(MultiDual) -> None:
+    md = MultiDual(3, [1, 2]) + MultiDual(5, [3, 4])
+    assert md.real == 8
+    assert np.array_equal(md.dual, [4, 6])
+    md = 5 - MultiDual(1, [2, 3])
+    assert md.real == 4
+    assert np.array_equal(md.dual, [-2, -3])
+
+def test_mul(MultiDual) -> None:
+    md = MultiDual(2, [3, 1]) * MultiDual(4, [5, 2])
+    assert md.real == 8
+    assert np.array_equal(md.dual, [22, 8])
+
+def test_div(MultiDual) -> None:
+    md = MultiDual(3, [4, 0]) / MultiDual(1, [2, 1])
+    assert md.real == 3
+    assert np.array_equal(md.dual, [-2, -3])
+
+def test_pow(MultiDual) -> None:
+    md = MultiDual(1, [2, 0]) ** MultiDual(3, [4, 1])
+    assert md.real == 1
+    assert np.array_equal(md.dual, [6, 0])
+    md = 2 ** MultiDual(1, [2, 1])
+    assert np.allclose(md.dual, [4 * np.log(2), 2 * np.log(2)])
+
+def test_log_non_positive(MultiDual) -> None:
+    with pytest.raises(ValueError):
+        MultiDual(0, [1]).log()
+
+def test_gradient(MultiDual) -> None:
+    def f(x):
+        return x[0] * x[1] + np.sin(x[2]) + x[0] ** 2
+
+    grad = MultiDual.gradient(f, [1.0, 2.0, 0.5])
+    assert np.allclose(grad, [2 + 2 * 1.0, 1.0, np.cos(0.5)])
+
+def test_gradient_constant(MultiDual) -> None:
+    grad = MultiDual.gradient(lambda x: 3.0, [1.0, 2.0])
+    assert np.array_equal(grad, [0, 0])
+
+def test_seed_chunk(MultiDual) -> None:
+    seeded = MultiDual.seed([1.0, 2.0, 3.0], start=1, size=2)
+    assert np.array_equal(seeded[0].dual, [0, 0])
+    assert np.array_equal(seeded[1].dual, [1, 0])
+    assert np.array_equal(seeded[2].dual, [0, 1])
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 10])
+def test_jacobian(MultiDual, chunk_size) -> None:
+    def f(x):
+        return [x[0] * x[1], np.sin(x[2]), x[0] + 2 * x[2], 4.0]
+
+    jac = MultiDual.jacobian(f, [1.0, 2.0, 0.5], chunk_size=chunk_size)
+    expected = np.array([
+        [2.0, 1.0, 0.0],
+        [0.0, 0.0, np.cos(0.5)],
+        [1.0, 0.0, 2.0],
+        [0.0, 0.0, 0.0],
+    ])
+    assert jac.shape == (4, 3)
+    assert np.allclose(jac, expected)
+
+def test_jacobian_scalar_output(MultiDual) -> None:
+    jac = MultiDual.jacobian(lambda x: x[0] * x[1], [3.0, 4.0])
+    assert np.array_equal(jac, [[4, 3]])
+
+def test_jacobian_invalid_chunk(MultiDual) -> None:
+    with pytest.raises(ValueError):
+        MultiDual.jacobian(lambda x: x[0], [1.0], chunk_size=0)
+
+def test_jacobian_checks_outputs(MultiDual) -> None:
+    # A tangent shorter than the chunk is rejected rather than read past its end
+    with pytest.raises(ValueError, match="tangent of length 1, expected 2"):
+        MultiDual.jacobian(lambda x: [x[0], MultiDual(1.0, [1.0])], [1.0, 2.0])
+    # Chunks must agree on the number of outputs
+    with pytest.raises(ValueError, match="same number of outputs"):
+        MultiDual.jacobian(lambda x: [x[0]] * int(x[0].dual[0] + 1), [1.0, 2.0], chunk_size=1)
+
+def test_numpy_scalar_operands(MultiDual) -> None:
+    x = MultiDual(2.0, [1.0, 3.0])
+    for c in (np.float64(0.5), np.float32(0.5), np.int64(2)):
+        for result, real, dual in (
+            (x + c, 2 + c, [1, 3]),
+            (c - x, c - 2, [-1, -3]),
+            (x * c, 2 * c, [c, 3 * c]),
+            (x / c, 2 / c, [1 / c, 3 / c]),
+            (x ** c, 2 ** c, [c * 2 ** (c - 1), 3 * c * 2 ** (c - 1)]),
+        ):
+            assert isinstance(result, MultiDual)
+            assert result.real == pytest.approx(float(real))
+            assert np.allclose(result.dual, np.asarray(dual, dtype=np.float64))
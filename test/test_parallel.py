@@ -0,0 +1,53 @@
+import pickle
+
+import pytest
+import numpy as np
+from dual_autodiff.dual import Dual
+from dual_autodiff.parallel import parallel_derivative
+
+
+# Worker processes receive the function by pickling, so it must be defined at module level
+def f(x):
+    return x.sin() * x**2
+
+def df(x):
+    return np.cos(x) * x**2 + 2 * x * np.sin(x)
+
+def branching(x):
+    return x * 3 if x.real > 0 else x * 2
+
+def fails(x):
+    raise RuntimeError("bad point")
+
+def test_matches_serial() -> None:
+    xs = np.linspace(-2, 2, 101)
+    assert np.allclose(parallel_derivative(f, xs, workers=2, chunksize=10), df(xs))
+
+def test_keeps_shape() -> None:
+    xs = np.linspace(0.1, 1, 12).reshape(3, 4)
+    result = parallel_derivative(f, xs, workers=2, chunksize=5)
+    assert result.shape == (3, 4)
+    assert np.allclose(result, df(xs))
+
+def test_non_vectorisable_function() -> None:
+    xs = np.array([-1.0, 1.0, -2.0, 2.0])
+    assert np.allclose(parallel_derivative(branching, xs, workers=2, chunksize=1), [2, 3, 2, 3])
+
+def test_single_worker_and_empty() -> None:
+    xs = np.linspace(0, 1, 5)
+    assert np.allclose(parallel_derivative(f, xs, workers=1), df(xs))
+    assert parallel_derivative(f, [], workers=2).shape == (0,)
+
+def test_worker_error_propagates() -> None:
+    with pytest.raises(RuntimeError):
+        parallel_derivative(fails, np.ones(8), workers=2, chunksize=2)
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        parallel_derivative(f, np.ones(4), workers=0)
+    with pytest.raises(ValueError):
+        parallel_derivative(f, np.ones(4), chunksize=0)
+
+def test_dual_pickle() -> None:
+    dual = pickle.loads(pickle.dumps(Dual(1.5, -2.0)))
+    assert (dual.real, dual.dual) == (1.5, -2.0)
@@ -0,0 +1,53 @@
+import pytest
+import numpy as np
+from dual_autodiff.dual import Dual
+from dual_autodiff.reverse import Tape, Var, grad
+
+
+def test_tape_record() -> None:
+    tape = Tape()
+    x = tape.variable(2.0)
+    y = x * 3
+    assert isinstance(y, Var)
+    assert y.real == 6
+    assert len(tape) == 2
+    assert tape.parent1[y.index] == x.index
+    assert tape.partial1[y.index] == 3
+
+def test_backward() -> None:
+    tape = Tape()
+    x = tape.variable(2.0)
+    y = tape.variable(5.0)
+    z = x * y + x
+    adjoint = tape.backward(z.index)
+    assert adjoint[x.index] == 6
+    assert adjoint[y.index] == 2
+
+def test_grad() -> None:
+    def f(x):
+        return x[0] * x[1] + np.sin(x[2]) + x[0] ** 2 - x[1] / x[2] + 2 ** x[0]
+
+    x = [1.0, 2.0, 0.5]
+    expected = [2 + 2 + 2 * np.log(2), 1 - 1 / 0.5, np.cos(0.5) + 2 / 0.25]
+    assert np.allclose(grad(f, x), expected)
+
+def test_grad_matches_dual() -> None:
+    def f(x):
+        return np.log(np.sin(x)) + x**2 * np.cos(x) - np.exp(x) / np.tan(x) + 3 - x
+
+    assert pytest.approx(grad(lambda v: f(v[0]), [1.5])[0]) == Dual.derivative(f, 1.5)
+
+def test_grad_power_var_exponent() -> None:
+    # d/dx x ** y = y * x ** (y - 1), d/dy x ** y = x ** y * ln(x)
+    assert np.allclose(grad(lambda v: v[0] ** v[1], [2.0, 3.0]), [12, 8 * np.log(2)])
+
+def test_grad_constant() -> None:
+    assert np.array_equal(grad(lambda v: 1.0, [1.0, 2.0]), [0, 0])
+
+def test_pow_negative_base() -> None:
+    with pytest.raises(ValueError):
+        grad(lambda v: v[0] ** v[1], [-2.0, 3.0])
+
+def test_log_non_positive() -> None:
+    with pytest.raises(ValueError):
+        grad(lambda v: v[0].log(), [0.0])
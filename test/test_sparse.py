@@ -0,0 +1,84 @@
+import pytest
+import numpy as np
+from dual_autodiff.multi_dual import MultiDual
+from dual_autodiff.sparse import color_columns, detect_sparsity, sparse_jacobian
+
+
+def banded(x):
+    # Tridiagonal Jacobian
+    n = len(x)
+    return [
+        (x[i - 1] if i > 0 else 0.0) * 2 + x[i] ** 2 - (x[i + 1] if i < n - 1 else 0.0)
+        for i in range(n)
+    ]
+
+def test_detect_sparsity() -> None:
+    pattern = detect_sparsity(banded, np.arange(1.0, 6.0))
+    expected = np.abs(np.subtract.outer(np.arange(5), np.arange(5))) <= 1
+    assert np.array_equal(pattern, expected)
+
+def test_color_columns() -> None:
+    pattern = np.abs(np.subtract.outer(np.arange(10), np.arange(10))) <= 1
+    colors = color_columns(pattern)
+    assert colors.max() + 1 == 3
+    # Columns of the same colour never share a row
+    for c in range(3):
+        assert pattern[:, colors == c].sum(axis=1).max() <= 1
+
+def test_sparse_jacobian() -> None:
+    pytest.importorskip("scipy")
+    x = np.arange(1.0, 8.0)
+    jac = sparse_jacobian(banded, x)
+    assert jac.shape == (7, 7)
+    assert np.allclose(jac.toarray(), MultiDual.jacobian(banded, x))
+
+def test_sparse_jacobian_given_pattern() -> None:
+    pytest.importorskip("scipy")
+
+    def f(x):
+        return [x[0] * x[2], np.sin(x[1]), x[3] ** 2]
+
+    pattern = [[1, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]]
+    jac = sparse_jacobian(f, [1.0, 0.5, 3.0, 2.0], sparsity=pattern)
+    expected = [[3, 0, 1, 0], [0, np.cos(0.5), 0, 0], [0, 0, 0, 4]]
+    assert np.allclose(jac.toarray(), expected)
+
+def test_detect_sparsity_is_structural() -> None:
+    def f(x):
+        return [x[0] * x[1], np.sin(x[2]) + np.exp(x[1]) / 2, 3.0, -x[2] ** x[0]]
+
+    # d(x0 * x1)/dx0 is zero at x1 = 0 but not elsewhere, so it is part of the pattern
+    expected = [[1, 1, 0], [0, 1, 1], [0, 0, 0], [1, 0, 1]]
+    assert np.array_equal(detect_sparsity(f, [1.0, 0.0, 2.0]), expected)
+    pytest.importorskip("scipy")
+    pattern = detect_sparsity(f, [1.0, 0.0, 2.0])
+    x = [2.0, 3.0, 0.5]
+    assert np.allclose(sparse_jacobian(f, x, sparsity=pattern).toarray(), MultiDual.jacobian(f, x))
+
+def test_sparse_jacobian_cost() -> None:
+    pytest.importorskip("scipy")
+    tangents = []
+
+    def f(x):
+        tangents.append(len(x[0].dual) if isinstance(x[0], MultiDual) else None)
+        return banded(x)
+
+    x = np.linspace(0.5, 2.0, 100)
+    jac = sparse_jacobian(f, x)
+    # One evaluation with one tangent direction per colour (the pattern is traced without derivatives)
+    assert tangents == [None, 3]
+    assert np.allclose(jac.toarray(), MultiDual.jacobian(banded, x))
+
+def test_scipy_sparse_patterns() -> None:
+    sparse = pytest.importorskip("scipy.sparse")
+    dense = np.abs(np.subtract.outer(np.arange(6), np.arange(6))) <= 1
+    x = np.arange(1.0, 7.0)
+    for pattern in (sparse.csr_matrix(dense), sparse.coo_matrix(dense), sparse.csc_matrix(dense.astype(float))):
+        assert np.array_equal(color_columns(pattern), color_columns(dense))
+        jac = sparse_jacobian(banded, x, sparsity=pattern)
+        assert np.allclose(jac.toarray(), MultiDual.jacobian(banded, x))
+    # An explicit zero at (0, 1) is not a non-zero, so the columns do not conflict; duplicates are summed
+    coo = sparse.coo_matrix(([1, 0, 1, 1], ([0, 0, 1, 1], [0, 1, 1, 1])), shape=(2, 2))
+    assert np.array_equal(color_columns(coo), [0, 0])
+    with pytest.raises(ValueError, match="shape"):
+        sparse_jacobian(banded, x, sparsity=dense[:, :5])
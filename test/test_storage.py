@@ -0,0 +1,57 @@
+import pytest
+import numpy as np
+from dual_autodiff.dual import Dual
+from dual_autodiff.dual_array import DualArray
+from dual_autodiff.storage import load, open_memmap, save
+
+
+def test_round_trip(tmp_path) -> None:
+    array = DualArray(np.arange(6.0).reshape(2, 3), -np.arange(6.0).reshape(2, 3))
+    save(tmp_path / "x.npy", array)
+    loaded = load(tmp_path / "x.npy")
+    assert np.array_equal(loaded.real, array.real)
+    assert np.array_equal(loaded.dual, array.dual)
+
+def test_save_list_of_duals(tmp_path) -> None:
+    save(tmp_path / "x.npy", [Dual(1, 2), Dual(3, 4)])
+    loaded = load(tmp_path / "x.npy")
+    assert loaded[1].real == 3 and loaded[1].dual == 4
+
+def test_file_is_plain_npy(tmp_path) -> None:
+    save(tmp_path / "x.npy", DualArray([1.0, 2.0], [3.0, 4.0]))
+    assert np.array_equal(np.load(tmp_path / "x.npy"), [[1.0, 2.0], [3.0, 4.0]])
+
+def test_mmap_load_is_zero_copy(tmp_path) -> None:
+    save(tmp_path / "x.npy", DualArray(np.arange(10.0), np.ones(10)))
+    loaded = load(tmp_path / "x.npy", mmap_mode="r")
+    assert isinstance(loaded.real.base, np.memmap) or isinstance(loaded.real, np.memmap)
+    part = loaded[2:5]
+    assert np.array_equal(part.real, [2.0, 3.0, 4.0])
+
+def test_mmap_write_back(tmp_path) -> None:
+    array = open_memmap(tmp_path / "x.npy", mode="w+", shape=(4,))
+    array[1] = Dual(5.0, 6.0)
+    del array
+    array = open_memmap(tmp_path / "x.npy", mode="r+")
+    assert (array[1].real, array[1].dual) == (5.0, 6.0)
+    array.dual[:] = 2.0
+    del array
+    assert np.all(load(tmp_path / "x.npy").dual == 2.0)
+
+def test_create_requires_shape(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        open_memmap(tmp_path / "x.npy", mode="w+")
+
+def test_rejects_other_arrays(tmp_path) -> None:
+    np.save(tmp_path / "x.npy", np.ones((3, 2)))
+    with pytest.raises(ValueError):
+        load(tmp_path / "x.npy")
+    with pytest.raises(ValueError):
+        open_memmap(tmp_path / "x.npy", mode="r")
+
+def test_float32_round_trip(tmp_path) -> None:
+    save(tmp_path / "x.npy", DualArray([1.0, 2.0], [3.0, 4.0], dtype=np.float32))
+    loaded = load(tmp_path / "x.npy", mmap_mode="r")
+    assert loaded.real.dtype == loaded.dual.dtype == np.float32
+    array = open_memmap(tmp_path / "y.npy", mode="w+", shape=(3,), dtype=np.float32)
+    assert array.dual.dtype == np.float32
@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+from dual_autodiff.stream import evaluate_chunk, stream_derivative
+
+
+def f(x):
+    return x.sin() * x**2
+
+def df(x):
+    return np.cos(x) * x**2 + 2 * x * np.sin(x)
+
+def chunks(n_chunks, size=5):
+    for k in range(n_chunks):
+        yield np.linspace(k, k + 1, size)
+
+@pytest.mark.parametrize("read_ahead", [0, 2])
+def test_stream_matches_direct(read_ahead) -> None:
+    results = list(stream_derivative(f, chunks(4), read_ahead=read_ahead))
+    assert len(results) == 4
+    for (values, derivs), x in zip(results, chunks(4)):
+        assert np.allclose(values, np.sin(x) * x**2)
+        assert np.allclose(derivs, df(x))
+
+def test_stream_is_lazy() -> None:
+    pulled = []
+
+    def source():
+        for x in chunks(100):
+            pulled.append(x)
+            yield x
+
+    stream = stream_derivative(f, source())
+    next(stream)
+    assert len(pulled) == 1
+    stream.close()
+
+def test_read_ahead_is_bounded_and_stops() -> None:
+    pulled = []
+
+    def source():
+        for x in chunks(100):
+            pulled.append(x)
+            yield x
+
+    stream = stream_derivative(f, source(), read_ahead=2)
+    next(stream)
+    stream.close()
+    # One chunk consumed, at most two buffered and one blocked on the full buffer
+    assert len(pulled) <= 4
+
+def test_reader_error_propagates() -> None:
+    def source():
+        yield np.ones(3)
+        raise OSError("read failed")
+
+    stream = stream_derivative(f, source(), read_ahead=1)
+    next(stream)
+    with pytest.raises(OSError):
+        next(stream)
+
+def test_non_vectorisable_chunk() -> None:
+    values, derivs = evaluate_chunk(lambda x: x * 3 if x.real > 0 else x * 2, [-1.0, 2.0])
+    assert np.allclose(values, [-2.0, 6.0])
+    assert np.allclose(derivs, [2.0, 3.0])
+
+def test_constant_function_broadcasts() -> None:
+    values, derivs = evaluate_chunk(lambda x: 5.0 + 0 * x, np.zeros((2, 3)))
+    assert values.shape == derivs.shape == (2, 3)
+    assert np.all(derivs == 0)
+
+def test_negative_read_ahead() -> None:
+    with pytest.raises(ValueError):
+        next(stream_derivative(f, chunks(1), read_ahead=-1))
@@ -0,0 +1,90 @@
+import gc
+import weakref
+
+import pytest
+import numpy as np
+from dual_autodiff.dual import Dual
+from dual_autodiff.trace import Tracer, generate_source, trace, trace_compile
+
+
+def f(x):
+    return np.log(np.sin(x)) + x**2 * np.cos(x)
+
+def test_trace_records_graph() -> None:
+    graph, output = trace(lambda x: 2 * x + 1)
+    assert [op for op, _ in graph] == ["input", "mul", "add"]
+    assert isinstance(output, Tracer)
+    assert output.index == 2
+
+def test_generate_source() -> None:
+    source, namespace = generate_source(*trace(lambda x: x.sin()))
+    assert "np.sin(r0)" in source
+    exec(source, namespace)
+    real, dual = namespace["kernel"](0.0, 1.0)
+    assert real == 0
+    assert dual == 1
+
+def test_compile_matches_dual() -> None:
+    compiled = trace_compile(f)
+    value, deriv = compiled(1.5)
+    assert pytest.approx(value) == f(1.5)
+    assert pytest.approx(deriv) == Dual.derivative(f, 1.5)
+
+def test_compile_array() -> None:
+    x = np.linspace(0.5, 1.5, 11)
+    expected = 1 / np.tan(x) + 2 * x * np.cos(x) - x**2 * np.sin(x)
+    assert np.allclose(trace_compile(f).derivative(x), expected)
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda x: 3 - x / 2,
+        lambda x: 2 / x - x,
+        lambda x: x / (x + 1),
+        lambda x: 2**x * x**x,
+        lambda x: np.tan(x) * np.exp(x),
+    ],
+)
+def test_compile_operators(func) -> None:
+    assert pytest.approx(trace_compile(func).derivative(0.7)) == Dual.derivative(func, 0.7)
+
+def test_compile_cached() -> None:
+    compiled = trace_compile(f)
+    kernel = compiled.kernel()
+    assert trace_compile(f).kernel() is kernel
+    # One kernel serves scalars and arrays of every shape
+    for x in (1.0, np.ones(3), np.ones((2, 4))):
+        assert np.allclose(compiled.derivative(x), Dual.derivative(f, x))
+    assert compiled.kernel() is kernel
+
+class Model:
+    def __init__(self, scale):
+        self.scale = scale
+
+    def f(self, x):
+        return self.scale * x.sin()
+
+def test_compile_bound_methods_cached() -> None:
+    # Bound methods are new objects on each access, so they are cached per instance and function
+    a, b = Model(2.0), Model(3.0)
+    kernel = trace_compile(a.f).kernel()
+    assert trace_compile(a.f).kernel() is kernel
+    assert trace_compile(b.f).kernel() is not kernel
+    assert trace_compile(b.f).derivative(0.0) == 3.0
+    # The cache does not keep instances or functions alive
+    ref = weakref.ref(a)
+    del a, kernel
+    gc.collect()
+    assert ref() is None
+
+def test_compile_not_weakly_referenceable() -> None:
+    assert pytest.approx(trace_compile(np.sin).derivative(0.5)) == np.cos(0.5)
+
+def test_compile_constant() -> None:
+    value, deriv = trace_compile(lambda x: 5.0)(np.ones(2))
+    assert np.array_equal(value, [5, 5])
+    assert np.array_equal(deriv, [0, 0])
+
+def test_compile_log_non_positive() -> None:
+    with pytest.raises(ValueError):
+        trace_compile(lambda x: x.log()).derivative(np.array([1.0, -1.0]))
@@ -0,0 +1,148 @@
+import pytest
+import numpy as np
+from dual_autodiff.dual import Dual
+
+ufuncs = pytest.importorskip("dual_autodiff_x.ufuncs")
+compiled = pytest.importorskip("dual_autodiff_x.dual")
+DualNDArray = ufuncs.DualNDArray
+
+
+def assert_matches_dual(result, expected) -> None:
+    # Compare a dual-dtype array with a list of pure-Python Duals
+    result = np.asarray(result)
+    assert np.allclose(result["real"], [e.real for e in expected], equal_nan=True)
+    assert np.allclose(result["dual"], [e.dual for e in expected], equal_nan=True)
+
+XS = [0.3, 0.7, 1.6]
+YS = [1.2, -0.5, 2.5]
+
+def duals(reals, dual=2.0):
+    return [Dual(x, dual) for x in reals]
+
+def test_dual_dtype_layout() -> None:
+    # Two float64 fields laid out as the C struct dual_t
+    assert ufuncs.dual_dtype.itemsize == 16
+    assert ufuncs.dual_dtype.names == ("real", "dual")
+    arr = ufuncs.as_dual([[1.0, 2.0]], 3.0)
+    assert arr.dtype == ufuncs.dual_dtype and arr.shape == (1, 2)
+    assert np.array_equal(arr["real"], [[1.0, 2.0]])
+    assert np.array_equal(arr["dual"], [[3.0, 3.0]])
+
+@pytest.mark.parametrize("name,op", [
+    ("add", lambda a, b: a + b),
+    ("subtract", lambda a, b: a - b),
+    ("multiply", lambda a, b: a * b),
+    ("divide", lambda a, b: a / b),
+])
+def test_arithmetic_ufuncs_match_dual(name, op) -> None:
+    x, y = ufuncs.as_dual(XS, 2.0), ufuncs.as_dual(YS, -1.0)
+    result = getattr(ufuncs, name)(x, y)
+    assert result.dtype == ufuncs.dual_dtype
+    assert_matches_dual(result, [op(a, b) for a, b in zip(duals(XS), duals(YS, -1.0))])
+
+@pytest.mark.parametrize("ufunc,name", [
+    (np.sin, "sin"), (np.cos, "cos"), (np.tan, "tan"), (np.log, "log"), (np.exp, "exp"),
+    (np.tanh, "tanh"), (np.arcsin, "arcsin"), (np.arctan, "arctan"), (np.absolute, "abs"),
+    (ufuncs.sigmoid, "sigmoid"), (ufuncs.erf, "erf"),
+])
+def test_numpy_ufunc_loops_match_dual(ufunc, name) -> None:
+    # Loops registered on NumPy's own ufuncs run on plain dual-dtype ndarrays, not just DualNDArray
+    xs = [0.1, 0.4, 0.8]
+    result = ufunc(ufuncs.as_dual(xs, 2.0))
+    assert type(result) is np.ndarray and result.dtype == ufuncs.dual_dtype
+    assert_matches_dual(result, [getattr(x, name)() for x in duals(xs)])
+
+def test_power_loop_matches_dual() -> None:
+    result = np.power(ufuncs.as_dual(XS, 2.0), ufuncs.as_dual(YS, -1.0))
+    assert_matches_dual(result, [a ** b for a, b in zip(duals(XS), duals(YS, -1.0))])
+    result = np.power(ufuncs.as_dual(XS, 2.0), ufuncs.as_dual(3.0))
+    assert_matches_dual(result, [a ** 3 for a in duals(XS)])
+
+def test_invalid_inputs_give_nan() -> None:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = np.log(ufuncs.as_dual([-1.0], 1.0))
+    assert np.isnan(result["real"][0])
+
+def test_float_arrays_unchanged() -> None:
+    # Registering dual-dtype loops must not change NumPy's results for other dtypes
+    x = np.linspace(0.1, 0.9, 5)
+    for ufunc, expected in ((np.sin, [np.sin(v) for v in x]), (np.exp, [np.exp(v) for v in x])):
+        result = ufunc(x)
+        assert result.dtype == np.float64
+        assert np.allclose(result, expected)
+    assert np.power(x, 2).dtype == np.float64
+    assert np.absolute(np.array([-1, 2])).dtype == np.array([1]).dtype
+
+def test_dual_ndarray_operators() -> None:
+    x, y = DualNDArray(XS, 2.0), DualNDArray(YS, -1.0)
+    dx, dy = duals(XS), duals(YS, -1.0)
+    cases = [
+        (x + y, [a + b for a, b in zip(dx, dy)]),
+        (x - 1.5, [a - 1.5 for a in dx]),
+        (2.0 * x, [2.0 * a for a in dx]),
+        (x / np.array(YS), [a / b for a, b in zip(dx, YS)]),
+        (1.0 / x, [1.0 / a for a in dx]),
+        (x ** 2, [a ** 2 for a in dx]),
+        (x ** y, [a ** b for a, b in zip(dx, dy)]),
+        (np.sqrt(x), [a.sqrt() for a in dx]),
+        (np.sin(x * y), [(a * b).sin() for a, b in zip(dx, dy)]),
+    ]
+    for result, expected in cases:
+        assert isinstance(result, DualNDArray)
+        assert_matches_dual(result, expected)
+    assert np.array_equal(x.real, XS)
+    assert np.array_equal(x.dual, [2.0, 2.0, 2.0])
+
+def test_dual_ndarray_derivative() -> None:
+    def f(x):
+        return np.log(np.sin(x)) + x ** 2 * np.cos(x)
+
+    x = np.linspace(0.5, 1.5, 5)
+    expected = 1 / np.tan(x) + 2 * x * np.cos(x) - x ** 2 * np.sin(x)
+    assert np.allclose(compiled.Dual.derivative(f, x), expected)
+
+@pytest.mark.parametrize("name", [
+    "sin", "cos", "tan", "log", "exp", "sqrt", "tanh", "sigmoid", "arcsin", "arctan", "abs", "erf",
+])
+def test_methods_match_dual(name) -> None:
+    xs = np.array([0.2, 0.5, 0.9]) if name in ("log", "sqrt") else np.array([-0.4, 0.2, 0.5])
+    result = getattr(DualNDArray(xs, 2.0), name)()
+    assert isinstance(result, DualNDArray)
+    assert_matches_dual(result, [getattr(Dual(x, 2.0), name)() for x in xs])
+
+@pytest.mark.parametrize("name", [
+    "sin", "cos", "tan", "log", "exp", "sqrt", "tanh", "sigmoid", "arcsin", "arctan", "abs", "erf",
+])
+def test_derivatives_are_vectorised(name) -> None:
+    # A single call on a DualNDArray means the per-point fallback was not needed
+    seen = []
+    xs = np.array([0.2, 0.5, 0.9])
+
+    def func(x):
+        seen.append(type(x))
+        return getattr(x, name)()
+
+    assert np.allclose(compiled.Dual.derivative(func, xs), getattr(Dual, name + "_derivative")(xs))
+    assert np.allclose(getattr(compiled.Dual, name + "_derivative")(xs), getattr(Dual, name + "_derivative")(xs))
+    assert seen == [DualNDArray]
+
+def test_abs_tangent_at_zero() -> None:
+    result = abs(DualNDArray([-1.0, 0.0, 2.0], 1.0))
+    assert np.array_equal(result.dual, [-1.0, 0.0, 1.0])
+
+def test_derivative_fallback_is_narrow() -> None:
+    with pytest.raises(ufuncs.NotVectorisableError):
+        float(DualNDArray([1.0, 2.0]))
+    # Branching on the input needs single numbers, so each point is evaluated separately
+    d_dx = compiled.Dual.derivative(lambda x: x * 3 if x.real > 0 else x * 2, np.array([-1.0, 2.0]))
+    assert np.array_equal(d_dx, [2.0, 3.0])
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        raise ValueError("bug in f")
+
+    # Other errors are not retried point by point
+    with pytest.raises(ValueError, match="bug in f"):
+        compiled.Dual.derivative(f, np.array([1.0, 2.0]))
+    assert len(calls) == 1